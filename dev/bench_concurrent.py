@@ -0,0 +1,84 @@
+"""
+Throughput of a ``ConcurrentHashMap`` shared between threads, compared with a ``HashMap`` behind one global lock,
+for a read-heavy mix (90% lookups, 10% inserts) and a write-heavy counter (``merge``), across thread counts.
+On a free-threaded CPython build (``python3.13t``), the sharded map should scale with the number of threads;
+with the GIL, the numbers mostly show the overhead of the locking.
+
+Usage: python dev/bench_concurrent.py [OPS_PER_THREAD]   (default 200_000)
+"""
+
+import operator
+import sys
+import threading
+import time
+
+from hypoxia import ConcurrentHashMap, HashMap
+
+KEYS = 10_000
+
+
+class GlobalLockHashMap:
+    def __init__(self):
+        self.map = HashMap()
+        self.lock = threading.Lock()
+
+    def __getitem__(self, key):
+        with self.lock:
+            return self.map[key]
+
+    def __setitem__(self, key, value):
+        with self.lock:
+            self.map[key] = value
+
+    def merge(self, key, value, func):
+        with self.lock:
+            current = self.map.get(key)
+            self.map[key] = func(current.unwrap(), value) if current.is_some() else value
+
+
+def read_heavy(m, ops, offset):
+    def run():
+        for i in range(ops):
+            key = (i * 7919 + offset) % KEYS
+            if i % 10:
+                m[key]
+            else:
+                m[key] = i
+
+    return run
+
+
+def write_heavy(m, ops, offset):
+    def run():
+        for i in range(ops):
+            m.merge((i + offset) % KEYS, 1, operator.add)
+
+    return run
+
+
+def seconds(make_map, workload, threads, ops):
+    m = make_map()
+    for key in range(KEYS):
+        m[key] = 0
+
+    workers = [threading.Thread(target = workload(m, ops, t)) for t in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    ops = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'{sys.version.split()[0]}, GIL {"enabled" if gil else "disabled"}, {ops:,} ops per thread')
+    for name, workload in (('90% reads', read_heavy), ('merge counter', write_heavy)):
+        print(name)
+        for threads in (1, 2, 4, 8):
+            total = threads * ops
+            locked = seconds(GlobalLockHashMap, workload, threads, ops)
+            sharded = seconds(ConcurrentHashMap, workload, threads, ops)
+            print(f'  {threads} threads: global lock {total / locked / 1e6:.2f} Mops/s, sharded {total / sharded / 1e6:.2f} Mops/s')
@@ -0,0 +1,46 @@
+"""
+Grouped aggregation over a stream: ``Iter.counts`` and ``Iter.group_by().agg`` compared with hand-written ``HashMap`` updates in ``for_each``,
+and the cost of spilling when the number of groups is over ``max_groups``.
+
+Usage: python dev/bench_group.py [N]   (default N = 1_000_000)
+"""
+
+import random
+import sys
+import time
+
+from hypoxia import HashMap, Iter
+
+
+def seconds(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    rng = random.Random(0)
+    rows = [(rng.randrange(10_000), rng.random()) for _ in range(n)]
+
+    def count_for_each():
+        counts = HashMap()
+        Iter(rows).for_each(lambda r: counts.insert(r[0], counts[r[0]].unwrap_or(0) + 1))
+
+    def sum_for_each():
+        totals = HashMap()
+        Iter(rows).for_each(lambda r: totals.insert(r[0], totals[r[0]].unwrap_or(0) + r[1]))
+
+    def key(r):
+        return r[0]
+
+    def value(r):
+        return r[1]
+
+    print(f'N = {n:,}, 10,000 groups')
+    print(f'  counts via for_each:                 {seconds(count_for_each):.2f} s')
+    print(f'  Iter.counts(key):                    {seconds(lambda: Iter(rows).counts(key)):.2f} s')
+    print(f'  sum via for_each:                    {seconds(sum_for_each):.2f} s')
+    print(f'  group_by(key).agg(sum, count):       {seconds(lambda: Iter(rows).group_by(key).agg(total = ("sum", value), n = "count")):.2f} s')
+    print(f'  ... with max_groups = 1,000 (spills): {seconds(lambda: Iter(rows).group_by(key, max_groups = 1000).agg(total = ("sum", value), n = "count")):.2f} s')
@@ -0,0 +1,115 @@
+"""
+Lookup, bulk and counter throughput of the ``dict``-backed ``HashMap``, compared with plain ``dict.get`` and the old ``UserDict`` + ``try``/``except KeyError`` ``HashMap``.
+
+Usage: python dev/bench_hashmap.py [N]   (default N = 1_000_000)
+"""
+
+import collections
+import sys
+import time
+
+from hypoxia import HashMap, Some, Nun
+
+
+class LegacyHashMap(collections.UserDict):
+    def __getitem__(self, key):
+        try:
+            return Some(self.data[key])
+        except KeyError:
+            return Nun()
+
+
+def seconds(func, n):
+    start = time.perf_counter()
+    func(n)
+    return time.perf_counter() - start
+
+
+def lookups(get, keys):
+    def run(n):
+        for k in keys:
+            get(k)
+
+    return run
+
+
+def counter_dict(words):
+    def run(n):
+        counts = {}
+        for w in words:
+            counts[w] = counts.get(w, 0) + 1
+
+    return run
+
+
+def counter_entry(words):
+    def run(n):
+        counts = HashMap()
+        for w in words:
+            counts.entry(w).and_modify(lambda c: c + 1).or_insert(1)
+
+    return run
+
+
+def counter_or_default(words):
+    def run(n):
+        counts = HashMap()
+        for w in words:
+            e = counts.entry(w)
+            counts[w] = e.or_default() + 1  # a plain dict write; the read is a single no-raise lookup
+
+    return run
+
+
+def per_key_get_many(h, keys):
+    def run(n):
+        [h[k] for k in keys]
+
+    return run
+
+
+def bulk_get_many(h, keys):
+    return lambda n: h.get_many(keys)
+
+
+def per_key_insert(keys):
+    def run(n):
+        h = HashMap()
+        for k in keys:
+            h.insert(k, k)
+
+    return run
+
+
+def bulk_insert(keys):
+    return lambda n: HashMap().insert_many(keys, keys)
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    data = {i: i for i in range(0, 2 * n, 2)}
+    plain, legacy, hashmap = dict(data), LegacyHashMap(data), HashMap(data)
+    hits = list(range(0, 2 * n, 2))
+    misses = list(range(1, 2 * n, 2))
+
+    print(f'N = {n:,}')
+    for label, keys in (('hits', hits), ('misses', misses)):
+        print(label)
+        print(f'  dict.get(k):            {seconds(lookups(plain.get, keys), n):.2f} s')
+        print(f'  legacy UserDict h[k]:   {seconds(lookups(legacy.__getitem__, keys), n):.2f} s')
+        print(f'  HashMap h[k]:           {seconds(lookups(hashmap.__getitem__, keys), n):.2f} s')
+        print(f'  HashMap.get(k):         {seconds(lookups(hashmap.get, keys), n):.2f} s')
+
+    print('batches of N keys, half of them present')
+    mixed = [k for pair in zip(hits, misses) for k in pair][:n]
+    print(f'  [h[k] for k in keys]:   {seconds(per_key_get_many(hashmap, mixed), n):.2f} s')
+    print(f'  h.get_many(keys):       {seconds(bulk_get_many(hashmap, mixed), n):.2f} s')
+    print(f'  N x h.insert(k, v):     {seconds(per_key_insert(hits), n):.2f} s')
+    print(f'  h.insert_many(ks, vs):  {seconds(bulk_insert(hits), n):.2f} s')
+
+    words = [i % 1000 for i in range(n)]
+    print('counting N items with 1000 distinct values')
+    print(f'  dict.get(w, 0) + 1:               {seconds(counter_dict(words), n):.2f} s')
+    print(f'  entry(w).and_modify().or_insert(): {seconds(counter_entry(words), n):.2f} s')
+    print(f'  entry(w).or_default() + 1:         {seconds(counter_or_default(words), n):.2f} s')
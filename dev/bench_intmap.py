@@ -0,0 +1,43 @@
+"""
+Memory and batch lookup speed of ``IntHashMap`` compared with a ``HashMap`` of boxed ints.
+
+Usage: python dev/bench_intmap.py [N]   (default N = 1_000_000)
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from hypoxia import HashMap, IntHashMap
+
+
+def seconds(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def memory(factory):
+    tracemalloc.start()
+    obj = factory()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    ids = random.Random(0).sample(range(1 << 40), n)
+    hashmap, hashmap_bytes = memory(lambda: HashMap((i, i * 2) for i in ids))
+    intmap, intmap_bytes = memory(lambda: IntHashMap(((i, i * 2) for i in ids), capacity = n))
+
+    queries = ids[::2] + [i + 1 for i in ids[::2]]
+
+    print(f'N = {n:,}')
+    print(f'  HashMap memory:               {hashmap_bytes / n:.1f} bytes per entry')
+    print(f'  IntHashMap memory:            {intmap_bytes / n:.1f} bytes per entry')
+    print(f'  HashMap.get_many(queries):    {seconds(lambda: hashmap.get_many(queries)):.3f} s')
+    print(f'  IntHashMap.get_many(queries): {seconds(lambda: intmap.get_many(queries)):.3f} s')
+    print(f'  IntHashMap[q] for q in queries: {seconds(lambda: [intmap[q] for q in queries]):.3f} s')
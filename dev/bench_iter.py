@@ -0,0 +1,68 @@
+"""
+Per-element cost of chained ``Iter`` pipelines as the chain gets deeper.
+
+Compares the plan-based ``Iter`` against the old design, where every combinator wrapped the previous ``Iter``
+(so each element went through one ``Iter.__next__`` call per stage), and against nested builtin ``map``/``filter``.
+"""
+
+import itertools
+import timeit
+
+from hypoxia import Iter
+
+N = 100_000
+REPEATS = 5
+
+
+class WrappingIter:
+    """The old execution model: one Python-level ``__next__`` per element per stage."""
+
+    def __init__(self, iter):
+        self.iterator = iter.__iter__()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self.iterator)
+
+    def map(self, func):
+        return WrappingIter(map(func, self))
+
+    def filter(self, func):
+        return WrappingIter(filter(func, self))
+
+
+def inc(x):
+    return x + 1
+
+
+def keep(x):
+    return x >= 0
+
+
+def build(iter_cls, depth):
+    it = iter_cls(range(N))
+    for stage in itertools.islice(itertools.cycle(('map', 'filter')), depth):
+        it = it.map(inc) if stage == 'map' else it.filter(keep)
+    return it
+
+
+def build_builtins(depth):
+    it = range(N)
+    for stage in itertools.islice(itertools.cycle(('map', 'filter')), depth):
+        it = map(inc, it) if stage == 'map' else filter(keep, it)
+    return it
+
+
+def ns_per_element(func):
+    return min(timeit.repeat(func, number = 1, repeat = REPEATS)) / N * 1e9
+
+
+if __name__ == '__main__':
+    print(f'{"depth":>5} {"wrapping":>10} {"builtins":>10} {"Iter":>10}   (ns/element)')
+    for depth in range(1, 9):
+        wrapping = ns_per_element(lambda: list(build(WrappingIter, depth)))
+        builtins = ns_per_element(lambda: list(build_builtins(depth)))
+        fused = ns_per_element(lambda: list(build(Iter, depth)))
+        print(f'{depth:>5} {wrapping:>10.1f} {builtins:>10.1f} {fused:>10.1f}')
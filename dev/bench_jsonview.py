@@ -0,0 +1,36 @@
+"""
+Nested lookups in a parsed JSON document: a compiled ``KeyPath`` versus chaining ``Option``s through ``JsonView``s, and plain ``dict`` indexing.
+
+Usage: python dev/bench_jsonview.py [N]   (default N = 1_000_000)
+"""
+
+import sys
+import time
+
+from hypoxia import HashMap
+
+DOC = {'a': {'b': [{'c': i} for i in range(10)]}}
+
+
+def seconds(func, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        func()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    view = HashMap.from_json(b'{"a": {"b": [{"c": 0}, {"c": 1}, {"c": 2}, {"c": 3}]}}')
+    hit = HashMap.path('a.b[3].c')
+    miss = HashMap.path('a.x[3].c')
+
+    def chained():
+        return view['a'].map(lambda a: a['b']).unwrap_or(None)
+
+    print(f'N = {n:,}')
+    print(f'  KeyPath hit:                     {seconds(lambda: hit(view), n):.2f} s')
+    print(f'  KeyPath miss:                    {seconds(lambda: miss(view), n):.2f} s')
+    print(f'  chained JsonView Options (2 of 4 steps): {seconds(chained, n):.2f} s')
+    print(f'  plain dict indexing:             {seconds(lambda: DOC["a"]["b"][3]["c"], n):.2f} s')
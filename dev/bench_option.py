@@ -0,0 +1,94 @@
+"""
+Memory and throughput of the slotted ``Option``/``Result`` classes, compared with the old ``abc.ABC`` + ``Generic`` classes with a per-instance ``__dict__``.
+
+Usage: python dev/bench_option.py [N]   (default N = 10_000_000)
+"""
+
+import abc
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Generic, TypeVar
+
+from hypoxia import Some, Nun, Ok
+
+T = TypeVar('T')
+
+
+class LegacyOption(abc.ABC, Generic[T]):
+    def __init__(self, value):
+        self._val = value
+
+    @abc.abstractmethod
+    def map(self, func):
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def unwrap_or(self, default):
+        raise NotImplementedError
+
+
+class LegacySome(LegacyOption):
+    def map(self, func):
+        return LegacySome(func(self._val))
+
+    def unwrap_or(self, default):
+        return self._val
+
+
+class LegacyNun(LegacyOption):
+    def __init__(self):
+        super().__init__(None)
+
+    def map(self, func):
+        return self
+
+    def unwrap_or(self, default):
+        return default
+
+
+def memory_per_instance(factory, n):
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory(i) for i in range(n)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return current / n
+
+
+def seconds(func, n):
+    start = time.perf_counter()
+    func(n)
+    return time.perf_counter() - start
+
+
+def inc(x):
+    return x + 1
+
+
+def construct(some):
+    return lambda n: [some(i) for i in range(n)]
+
+
+def map_unwrap(some, nun):
+    def run(n):
+        for i in range(n):
+            (some(i) if i % 2 else nun()).map(inc).unwrap_or(0)
+
+    return run
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+
+    print(f'N = {n:,}')
+    for name, some, nun in (('legacy', LegacySome, LegacyNun), ('slotted', Some, Nun)):
+        print(name)
+        print(f'  bytes per Some (including list slot): {memory_per_instance(some, n):.1f}')
+        print(f'  construct N Somes:                    {seconds(construct(some), n):.2f} s')
+        print(f'  N x (Some|Nun).map(f).unwrap_or(d):   {seconds(map_unwrap(some, nun), n):.2f} s')
+
+    print('slotted Ok')
+    print(f'  bytes per Ok (including list slot):   {memory_per_instance(Ok, n):.1f}')
@@ -0,0 +1,45 @@
+"""
+Cost of taking a changed snapshot of a large map: copying a ``HashMap`` and changing one key,
+versus ``PersistentHashMap.insert``, which shares all but O(log n) of the structure; plus the cost of diffing two nearby versions.
+
+Usage: python dev/bench_persistent.py [N]   (default N = 1_000_000)
+"""
+
+import sys
+import time
+
+from hypoxia import HashMap, PersistentHashMap
+
+SNAPSHOTS = 100
+
+
+def seconds(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    hashmap = HashMap((i, i) for i in range(n))
+    build = seconds(lambda: PersistentHashMap((i, i) for i in range(n)))
+    pmap = PersistentHashMap((i, i) for i in range(n))
+
+    def copies():
+        for i in range(SNAPSHOTS):
+            snapshot = hashmap.copy()
+            snapshot[i] = -i
+
+    def versions():
+        version = pmap
+        for i in range(SNAPSHOTS):
+            version = version.insert(i, -i)
+
+    print(f'N = {n:,}')
+    print(f'  build PersistentHashMap (via transient):  {build:.2f} s')
+    print(f'  {SNAPSHOTS} x HashMap.copy() + set:            {seconds(copies):.4f} s')
+    print(f'  {SNAPSHOTS} x PersistentHashMap.insert:        {seconds(versions):.4f} s')
+
+    changed = pmap.insert(0, 'x').remove(1)
+    print(f'  diff of two versions with 2 changes:      {seconds(lambda: list(pmap.diff(changed))):.6f} s')
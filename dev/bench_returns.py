@@ -0,0 +1,50 @@
+"""
+Cost of ``@returns_result`` and ``try_`` on the success path, compared with calling the function directly,
+hand-written try/except, and chaining with ``and_then``.
+"""
+
+import timeit
+
+from hypoxia import returns_result, try_, Ok, Err
+
+NUMBER = 1_000_000
+
+
+def parse(s):
+    return int(s)
+
+
+@returns_result
+def parse_result(s):
+    return int(s)
+
+
+def parse_by_hand(s):
+    try:
+        return Ok(int(s))
+    except Exception as e:
+        return Err(e)
+
+
+@returns_result
+def three_steps_with_try(s):
+    x = try_(parse_result(s))
+    y = try_(parse_result(s))
+    return x + y
+
+
+def three_steps_with_and_then(s):
+    return parse_by_hand(s).and_then(lambda x: parse_by_hand(s).and_then(lambda y: Ok(x + y)))
+
+
+def per_call_ns(stmt):
+    return min(timeit.repeat(stmt, number = NUMBER, repeat = 5)) / NUMBER * 1e9
+
+
+if __name__ == '__main__':
+    print(f'direct call:                  {per_call_ns(lambda: parse("12")):6.1f} ns')
+    print(f'hand-written try/except + Ok: {per_call_ns(lambda: parse_by_hand("12")):6.1f} ns')
+    print(f'@returns_result:              {per_call_ns(lambda: parse_result("12")):6.1f} ns')
+    print()
+    print(f'two steps with and_then:      {per_call_ns(lambda: three_steps_with_and_then("12")):6.1f} ns')
+    print(f'two steps with try_:          {per_call_ns(lambda: three_steps_with_try("12")):6.1f} ns')
@@ -0,0 +1,35 @@
+"""
+Sorting a stream: ``Iter.sorted`` in memory, compared with the external sort (``max_in_memory``),
+with its runs sorted in the calling thread and in a process pool.
+
+Usage: python dev/bench_sort.py [N]   (default N = 2_000_000)
+"""
+
+import random
+import sys
+import time
+
+from hypoxia import Iter
+
+
+def seconds(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def key(r):
+    return r[0]
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+
+    rng = random.Random(0)
+    rows = [(rng.random(), i) for i in range(n)]
+    run = n // 8
+
+    print(f'N = {n:,}, runs of {run:,}')
+    print(f'  sorted(key):                          {seconds(lambda: Iter(rows).sorted(key).for_each(lambda _: None)):.2f} s')
+    print(f'  sorted(key, max_in_memory):           {seconds(lambda: Iter(rows).sorted(key, max_in_memory = run).for_each(lambda _: None)):.2f} s')
+    print(f'  ... with pool = "process":            {seconds(lambda: Iter(rows).sorted(key, max_in_memory = run, pool = "process").for_each(lambda _: None)):.2f} s')
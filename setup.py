@@ -20,4 +20,7 @@ setup(
     package_dir = {'': 'src'},
     install_requires = [
     ],
+    extras_require = {
+        'numpy': ['numpy'],
+    },
 )
@@ -1,11 +1,27 @@
 from .exceptions import Panic
 
-from .result import Result, Ok, Err
+from .result import Result, Ok, Err, LazyErr
 from .option import Option, Some, Nun
+from .arrays import OptionArray, ResultArray
+from .chain import Chain
 
-from .hashmap import HashMap
+from .propagate import returns_result, try_
+
+from .hashmap import HashMap, Entry
+from .jsonview import JsonView, JsonArray, KeyPath
+from .cache import LruHashMap, TtlHashMap, CacheStats, memoize
+from .concurrent import ConcurrentHashMap
+from .persistent import PersistentHashMap, TransientHashMap
+from .disk import DiskHashMap, BloomFilter
+from .btree import BTreeMap
+from .frozen import FrozenHashMap
+from .intmap import IntHashMap, IntFloatHashMap
+from .shared import SharedHashMap
+from .report import ErrorReport, ErrorGroup
 from .files import open_file, File
 
 from .impl import impl
 
 from .iter import Iter
+from .group import GroupBy
+from .async_iter import AsyncIter
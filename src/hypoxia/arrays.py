@@ -0,0 +1,275 @@
+from typing import Callable, Generic, Iterable, Iterator, List, Optional, Sequence, TypeVar, Union
+
+from .exceptions import Panic
+from . import numeric
+from .option import Option, Some, Nun
+from .result import Result, Ok, Err
+
+T = TypeVar('T')
+U = TypeVar('U')
+
+Mask = bytearray
+
+_INVERT = bytes.maketrans(b'\x00\x01', b'\x01\x00')
+_NORMALIZE = b'\x00' + b'\x01' * 255  # every nonzero byte becomes 1
+
+
+def _as_mask(mask: Iterable, length: int, copy: bool = True) -> Mask:
+    """
+    Return ``mask`` as a ``bytearray`` of ``0``s and ``1``s.
+    A ``bytearray`` (or ``bytes``) mask is normalized into a new ``bytearray``, unless ``copy`` is false, in which case a ``bytearray`` is used as-is.
+    """
+    if mask is None:
+        return bytearray(b'\x01') * length
+    if isinstance(mask, bytearray) and not copy:
+        return mask
+    if isinstance(mask, (bytes, bytearray)):
+        return bytearray(mask.translate(_NORMALIZE))
+    return bytearray(map(bool, mask))
+
+
+class OptionArray(Generic[T]):
+    """
+    A column of ``Option``s, stored as a flat sequence of ``values`` (a ``list``, or any sequence such as an ``array.array``)
+    and a validity ``mask`` with one byte per element: ``1`` for a ``Some``, ``0`` for a ``Nun``.
+    The value at a ``Nun`` position is meaningless (``None`` when built from ``Option``s).
+    Batched methods run over the whole column at once instead of making a method call per element.
+    Iterating yields ``Option``s, so ``Iter.collect(OptionArray)`` builds one directly from a stream of ``Option``s.
+    """
+
+    __slots__ = ('values', 'mask')
+
+    def __init__(self, options: Iterable[Option[T]] = ()):
+        values = []
+        mask = bytearray()
+        for option in options:
+            if option.is_some():
+                values.append(option.unwrap())
+                mask.append(1)
+            else:
+                values.append(None)
+                mask.append(0)
+
+        self.values = values
+        self.mask = mask
+
+    @classmethod
+    def from_columns(cls, values: Sequence[T], mask: Optional[Iterable] = None, copy_mask: bool = True) -> 'OptionArray[T]':
+        """
+        Build an ``OptionArray`` directly from a sequence of values and a mask of truthy values (all ``Some`` if ``mask`` is ``None``), without copying ``values``.
+        The mask is copied (with every truthy byte normalized to ``1``), unless ``copy_mask`` is false and it is a ``bytearray`` of only ``0``s and ``1``s,
+        which is then used as-is (and shared with the caller).
+        """
+        new = cls.__new__(cls)
+        new.values = values
+        new.mask = _as_mask(mask, len(values), copy_mask)
+
+        if len(new.mask) != len(values):
+            raise Panic(f'mask has length {len(new.mask)}, but values has length {len(values)}')
+
+        return new
+
+    @classmethod
+    def from_masked(cls, masked) -> 'OptionArray[T]':
+        """Build an ``OptionArray`` from a NumPy (masked) array, where masked elements become ``Nun``. The values are not copied."""
+        values, mask = numeric.from_masked(masked)
+        return cls.from_columns(values, mask, copy_mask = False)
+
+    def to_masked(self, dtype = None, fill = 0):
+        """Return a NumPy masked array of the values, where each ``Nun`` is masked (and has the value ``fill`` underneath)."""
+        return numeric.to_masked(self.values, self.mask, dtype = dtype, fill = fill)
+
+    def __len__(self):
+        return len(self.mask)
+
+    def __getitem__(self, idx: int) -> Option[T]:
+        if self.mask[idx]:
+            return Some(self.values[idx])
+        return Nun()
+
+    def __iter__(self) -> Iterator[Option[T]]:
+        for value, valid in zip(self.values, self.mask):
+            yield Some(value) if valid else Nun()
+
+    def __eq__(self, other):
+        return self.__class__ == other.__class__ and list(self) == list(other)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self)})'
+
+    def _all_some(self) -> bool:
+        return 0 not in self.mask
+
+    def is_some(self) -> Mask:
+        """Return the mask of which elements are ``Some``."""
+        return bytearray(self.mask)
+
+    def is_nun(self) -> Mask:
+        """Return the mask of which elements are ``Nun``."""
+        return self.mask.translate(_INVERT)
+
+    def count_some(self) -> int:
+        """Return the number of ``Some`` elements."""
+        return self.mask.count(1)
+
+    def count_nun(self) -> int:
+        """Return the number of ``Nun`` elements."""
+        return self.mask.count(0)
+
+    def map(self, func: Callable[[T], U], vectorized: bool = False) -> 'OptionArray[U]':
+        """
+        Return a new ``OptionArray`` with ``func`` applied to the value of each ``Some``.
+        If ``vectorized`` is ``True``, ``func`` is instead called once on the entire values column (e.g., a NumPy ufunc on an array-backed column),
+        including the meaningless values at ``Nun`` positions.
+        """
+        if vectorized:
+            return self.from_columns(func(self.values), self.mask)
+        if self._all_some():
+            return self.from_columns(list(map(func, self.values)), self.mask)
+        return self.from_columns([func(v) if m else None for v, m in zip(self.values, self.mask)], self.mask)
+
+    def map_or(self, func: Callable[[T], U], default: U) -> List[U]:
+        """Return a list of ``func(value)`` for each ``Some`` and ``default`` for each ``Nun``."""
+        if self._all_some():
+            return list(map(func, self.values))
+        return [func(v) if m else default for v, m in zip(self.values, self.mask)]
+
+    def unwrap_or(self, default: T) -> List[T]:
+        """Return a list of the value of each ``Some``, and ``default`` for each ``Nun`` (or an array, if the values are a NumPy array)."""
+        if numeric.is_ndarray(self.values):
+            return numeric.where(self.mask, self.values, default)
+        if self._all_some():
+            return list(self.values)
+        return [v if m else default for v, m in zip(self.values, self.mask)]
+
+    def and_then(self, func: Callable[[T], Option[U]]) -> 'OptionArray[U]':
+        """Return a new ``OptionArray`` of ``func(value)`` (which must return an ``Option``) for each ``Some``, and ``Nun`` for each ``Nun``."""
+        return OptionArray(func(v) if m else Nun() for v, m in zip(self.values, self.mask))
+
+    def filter(self, func: Callable[[T], bool]) -> 'OptionArray[T]':
+        """Return a new ``OptionArray`` where each ``Some`` whose value ``func`` is not true for becomes ``Nun``."""
+        mask = bytearray(bool(m and func(v)) for v, m in zip(self.values, self.mask))
+        return self.from_columns(self.values, mask, copy_mask = False)
+
+    def ok_or(self, err: Exception) -> 'ResultArray[T]':
+        """Return a ``ResultArray`` with ``Ok(value)`` for each ``Some`` and ``Err(err)`` for each ``Nun``."""
+        errors = [None if m else err for m in self.mask]
+        return ResultArray.from_columns(self.values, errors, self.mask)
+
+
+class ResultArray(Generic[T]):
+    """
+    A column of ``Result``s, stored as a flat sequence of ``values``, a parallel sequence of ``errors`` (the exceptions inside the ``Err``s),
+    and a mask with one byte per element: ``1`` for an ``Ok``, ``0`` for an ``Err``.
+    Iterating yields ``Result``s, so ``Iter.collect(ResultArray)`` builds one directly from a stream of ``Result``s.
+    """
+
+    __slots__ = ('values', 'errors', 'mask')
+
+    def __init__(self, results: Iterable[Result[T, Exception]] = ()):
+        values = []
+        errors = []
+        mask = bytearray()
+        for result in results:
+            if result.is_ok():
+                values.append(result.unwrap())
+                errors.append(None)
+                mask.append(1)
+            else:
+                values.append(None)
+                errors.append(result.unwrap_err())
+                mask.append(0)
+
+        self.values = values
+        self.errors = errors
+        self.mask = mask
+
+    @classmethod
+    def from_columns(cls, values: Sequence[T], errors: Sequence[Exception], mask: Optional[Iterable] = None, copy_mask: bool = True) -> 'ResultArray[T]':
+        """
+        Build a ``ResultArray`` directly from columns of values, exceptions, and a mask of truthy values (all ``Ok`` if ``mask`` is ``None``).
+        As for :meth:`OptionArray.from_columns`, the mask is copied and normalized unless ``copy_mask`` is false.
+        """
+        new = cls.__new__(cls)
+        new.values = values
+        new.errors = errors
+        new.mask = _as_mask(mask, len(values), copy_mask)
+
+        if not len(new.mask) == len(values) == len(errors):
+            raise Panic(f'mask, values, and errors have lengths {len(new.mask)}, {len(values)}, and {len(errors)}')
+
+        return new
+
+    def __len__(self):
+        return len(self.mask)
+
+    def __getitem__(self, idx: int) -> Result[T, Exception]:
+        if self.mask[idx]:
+            return Ok(self.values[idx])
+        return Err(self.errors[idx])
+
+    def __iter__(self) -> Iterator[Result[T, Exception]]:
+        for value, error, valid in zip(self.values, self.errors, self.mask):
+            yield Ok(value) if valid else Err(error)
+
+    def __eq__(self, other):
+        return self.__class__ == other.__class__ and list(self) == list(other)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({list(self)})'
+
+    def _all_ok(self) -> bool:
+        return 0 not in self.mask
+
+    def is_ok(self) -> Mask:
+        """Return the mask of which elements are ``Ok``."""
+        return bytearray(self.mask)
+
+    def is_err(self) -> Mask:
+        """Return the mask of which elements are ``Err``."""
+        return self.mask.translate(_INVERT)
+
+    def count_ok(self) -> int:
+        """Return the number of ``Ok`` elements."""
+        return self.mask.count(1)
+
+    def count_err(self) -> int:
+        """Return the number of ``Err`` elements."""
+        return self.mask.count(0)
+
+    def ok(self) -> OptionArray[T]:
+        """Return an ``OptionArray`` with ``Some(value)`` for each ``Ok`` and ``Nun`` for each ``Err``."""
+        return OptionArray.from_columns(self.values, self.mask)
+
+    def err(self) -> OptionArray[Exception]:
+        """Return an ``OptionArray`` with ``Some(exception)`` for each ``Err`` and ``Nun`` for each ``Ok``."""
+        return OptionArray.from_columns(self.errors, self.is_err(), copy_mask = False)
+
+    def map(self, func: Callable[[T], U]) -> 'ResultArray[U]':
+        """Return a new ``ResultArray`` with ``func`` applied to the value of each ``Ok``."""
+        if self._all_ok():
+            values = list(map(func, self.values))
+        else:
+            values = [func(v) if m else None for v, m in zip(self.values, self.mask)]
+        return self.from_columns(values, self.errors, self.mask)
+
+    def map_err(self, func: Callable[[Exception], Exception]) -> 'ResultArray[T]':
+        """Return a new ``ResultArray`` with ``func`` (which must return an exception) applied to the exception in each ``Err``."""
+        errors = [None if m else func(e) for e, m in zip(self.errors, self.mask)]
+        return self.from_columns(self.values, errors, self.mask)
+
+    def map_or(self, func: Callable[[T], U], default: U) -> List[U]:
+        """Return a list of ``func(value)`` for each ``Ok`` and ``default`` for each ``Err``."""
+        if self._all_ok():
+            return list(map(func, self.values))
+        return [func(v) if m else default for v, m in zip(self.values, self.mask)]
+
+    def unwrap_or(self, default: T) -> List[T]:
+        """Return a list of the value of each ``Ok``, and ``default`` for each ``Err``."""
+        if self._all_ok():
+            return list(self.values)
+        return [v if m else default for v, m in zip(self.values, self.mask)]
+
+    def and_then(self, func: Callable[[T], Result[U, Exception]]) -> 'ResultArray[U]':
+        """Return a new ``ResultArray`` of ``func(value)`` (which must return a ``Result``) for each ``Ok``, keeping each ``Err``."""
+        return ResultArray(func(v) if m else Err(e) for v, e, m in zip(self.values, self.errors, self.mask))
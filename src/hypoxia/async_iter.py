@@ -0,0 +1,216 @@
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Generic, TypeVar, Tuple, Optional, Union, Iterable, Any, Type, Collection
+import asyncio
+import collections
+import concurrent.futures
+import inspect
+
+from .exceptions import Panic
+from .option import Option
+from .result import Result, Ok, Err
+
+T = TypeVar('T')
+U = TypeVar('U')
+
+
+async def _maybe_await(value):
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def _from_sync(iterable: Iterable[T]) -> AsyncIterator[T]:
+    for element in iterable:
+        yield element
+
+
+def _async_iterator(iterable: Union[AsyncIterable[T], Iterable[T]]) -> AsyncIterator[T]:
+    if hasattr(iterable, '__aiter__'):
+        return iterable.__aiter__()
+    return _from_sync(iterable)
+
+
+async def _map(iterator, func):
+    async for element in iterator:
+        yield await _maybe_await(func(element))
+
+
+async def _filter(iterator, func):
+    async for element in iterator:
+        if await _maybe_await(func(element)):
+            yield element
+
+
+async def _filter_map(iterator, func):
+    async for element in iterator:
+        option = await _maybe_await(func(element))
+        if option.is_some():
+            yield option.unwrap()
+
+
+async def _take_while(iterator, func):
+    async for element in iterator:
+        if not await _maybe_await(func(element)):
+            return
+        yield element
+
+
+async def _enumerate(iterator, start):
+    idx = start
+    async for element in iterator:
+        yield idx, element
+        idx += 1
+
+
+async def _zip(iterators):
+    while True:
+        try:
+            yield tuple([await iterator.__anext__() for iterator in iterators])
+        except StopAsyncIteration:
+            return
+
+
+async def _call(func, element):
+    if func is None:
+        return await element
+    return await _maybe_await(func(element))
+
+
+def _settle(task: asyncio.Future) -> Result:
+    # task.exception() raises for a cancelled task; concurrent.futures.CancelledError is used since it is an Exception on every Python
+    # (asyncio's own CancelledError is a BaseException from 3.8 on, which an Err can't hold)
+    if task.cancelled():
+        return Err(concurrent.futures.CancelledError())
+
+    exception = task.exception()
+    if exception is not None:
+        return Err(exception)
+    return Ok(task.result())
+
+
+async def _buffered(iterator, n, func):
+    pending = collections.deque()
+    try:
+        async for element in iterator:
+            pending.append(asyncio.ensure_future(_call(func, element)))
+            if len(pending) >= n:
+                task = pending.popleft()
+                await asyncio.wait((task,))
+                yield _settle(task)
+
+        while pending:
+            task = pending.popleft()
+            await asyncio.wait((task,))
+            yield _settle(task)
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def _buffer_unordered(iterator, n, func):
+    pending = set()
+    try:
+        async for element in iterator:
+            pending.add(asyncio.ensure_future(_call(func, element)))
+            if len(pending) >= n:
+                done, pending = await asyncio.wait(pending, return_when = asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield _settle(task)
+
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when = asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield _settle(task)
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+class AsyncIter(Generic[T]):
+    """
+    An asynchronous counterpart to :class:`Iter`, wrapping an async iterable (or a plain iterable).
+    Anywhere a function is accepted, it may be a plain function or a coroutine function; awaitable return values are awaited.
+    """
+
+    def __init__(self, iter: Union[AsyncIterable[T], Iterable[T]]):
+        self.iterator = _async_iterator(iter)
+
+    def __aiter__(self):
+        return self.iterator
+
+    async def __anext__(self):
+        return await self.iterator.__anext__()
+
+    # METHODS THAT RETURN NEW ITERATORS
+
+    def map(self, func: Callable[[T], Union[U, Awaitable[U]]]) -> 'AsyncIter[U]':
+        """Return a new ``AsyncIter`` with each element mapped under the function ``func``, one at a time."""
+        return self.__class__(_map(self.iterator, func))
+
+    def filter(self, func: Callable[[T], Union[bool, Awaitable[bool]]]) -> 'AsyncIter[T]':
+        """Return a new ``AsyncIter`` containing only elements that ``func(element)`` is true for."""
+        return self.__class__(_filter(self.iterator, func))
+
+    def filter_map(self, func: Callable[[T], Union[Option[U], Awaitable[Option[U]]]]) -> 'AsyncIter[U]':
+        """Return a new ``AsyncIter`` containing the values of ``func(element)`` if ``func(element)`` is :class:`Some` and skipping it otherwise."""
+        return self.__class__(_filter_map(self.iterator, func))
+
+    def take_while(self, func: Callable[[T], Union[bool, Awaitable[bool]]]) -> 'AsyncIter[T]':
+        """Return a new ``AsyncIter`` containing all of the elements up to the last one that ``func(element)`` is ``True`` for."""
+        return self.__class__(_take_while(self.iterator, func))
+
+    def enumerate(self, start: int = 0) -> 'AsyncIter[Tuple[int, T]]':
+        """Return an ``AsyncIter`` of tuples containing a count (starting from ``start``) and the elements of the original ``AsyncIter``."""
+        return self.__class__(_enumerate(self.iterator, start))
+
+    def zip(self, *iters: Union[AsyncIterable, Iterable]) -> 'AsyncIter[Tuple]':
+        """Make an ``AsyncIter`` of tuples of aligned elements from this ``AsyncIter`` and each of the input (async) iterables."""
+        return self.__class__(_zip([self.iterator, *map(_async_iterator, iters)]))
+
+    def buffered(self, n: int, func: Optional[Callable[[T], Awaitable[U]]] = None) -> 'AsyncIter[Result[U, Exception]]':
+        """
+        Return a new ``AsyncIter`` of the results of awaiting ``func(element)`` (or each element itself, if ``func`` is ``None``),
+        with up to ``n`` of them running concurrently.
+        Results are yielded in the original order, as ``Ok(value)``, or ``Err(exception)`` if awaiting raised
+        (``Err(concurrent.futures.CancelledError())`` if the awaitable was cancelled).
+        """
+        if n < 1:
+            raise Panic(f'n must be at least 1, but was {n}')
+        return self.__class__(_buffered(self.iterator, n, func))
+
+    def buffer_unordered(self, n: int, func: Optional[Callable[[T], Awaitable[U]]] = None) -> 'AsyncIter[Result[U, Exception]]':
+        """Like :meth:`AsyncIter.buffered`, but results are yielded as soon as they finish instead of in the original order."""
+        if n < 1:
+            raise Panic(f'n must be at least 1, but was {n}')
+        return self.__class__(_buffer_unordered(self.iterator, n, func))
+
+    # METHODS THAT COLLAPSE THE ITERATOR, RETURNING SINGLE VALUES
+
+    async def collect(self, collection_type: Type[Collection] = list) -> Collection[T]:
+        """Collect the elements of the ``AsyncIter`` into a collection of type ``collection_type``."""
+        return collection_type([element async for element in self.iterator])
+
+    async def reduce(self, func: Callable[[U, T], Union[U, Awaitable[U]]], initial: Optional[U] = None) -> U:
+        """
+        Apply ``func`` cumulatively to the items in the iterable from left to right.
+        The first argument of ``func`` is the accumulated value, the second is the next element of the iterable.
+        If ``initial`` is given, it is first accumulated value.
+        """
+        if initial is None:
+            try:
+                acc = await self.iterator.__anext__()
+            except StopAsyncIteration:
+                raise TypeError('reduce() of empty AsyncIter with no initial value')
+        else:
+            acc = initial
+
+        async for element in self.iterator:
+            acc = await _maybe_await(func(acc, element))
+
+        return acc
+
+    # METHODS THAT DO OTHER STUFF
+
+    async def for_each(self, func: Callable[[T], Any]) -> None:
+        """Call a function on each element of the ``AsyncIter``, one at a time."""
+        async for element in self.iterator:
+            await _maybe_await(func(element))
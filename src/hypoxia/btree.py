@@ -0,0 +1,226 @@
+from typing import Any, Hashable, Iterable, Iterator, Mapping, Optional, Tuple, Union
+import bisect
+import itertools
+
+from .exceptions import Panic
+from .option import Option, Some, Nun
+from .iter import Iter
+
+_MISSING = object()
+
+LOAD = 1000
+
+
+class BTreeMap:
+    """
+    A map that keeps its keys in sorted order, like Rust's ``BTreeMap``. Keys must be mutually comparable.
+    Like a :class:`HashMap`, indexing returns ``Some(value)`` or ``Nun``.
+
+    The values live in a ``dict``, so lookups are O(1).
+    The sorted keys are split into sublists of about ``load`` keys each, with the largest key of each sublist kept in a separate index,
+    so finding a position is two binary searches and inserting or removing a key only shifts one sublist (as in ``sortedcontainers``).
+    :meth:`range`, :meth:`first`, :meth:`last`, :meth:`floor` and :meth:`ceiling` use those positions, without scanning or sorting the whole map.
+    Iterating over the map while changing it has undefined results.
+    """
+
+    __slots__ = ('_map', '_lists', '_maxes', '_load')
+
+    def __init__(self, items: Union[Mapping, Iterable[Tuple[Hashable, Any]]] = (), load: int = LOAD):
+        self._map = dict(items)
+        self._load = load
+        self._build(sorted(self._map))
+
+    @classmethod
+    def from_sorted(cls, items: Iterable[Tuple[Hashable, Any]], load: int = LOAD) -> 'BTreeMap':
+        """Build a ``BTreeMap`` in linear time from ``(key, value)`` pairs whose keys are strictly increasing (if they aren't, this raises a :class:`Panic`)."""
+        new = cls.__new__(cls)
+        new._map = {}
+        new._load = load
+
+        keys = []
+        for key, value in items:
+            if keys and not keys[-1] < key:
+                raise Panic(f'keys are not strictly increasing: {keys[-1]!r} is followed by {key!r}')
+            keys.append(key)
+            new._map[key] = value
+
+        new._build(keys)
+        return new
+
+    def _build(self, keys: list):
+        load = self._load
+        self._lists = [keys[start:start + load] for start in range(0, len(keys), load)]
+        self._maxes = [lst[-1] for lst in self._lists]
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({{{", ".join(f"{k!r}: {v!r}" for k, v in self.items())}}})'
+
+    def __len__(self):
+        return len(self._map)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._map
+
+    def __eq__(self, other):
+        if not isinstance(other, BTreeMap):
+            return NotImplemented
+        return self._map == other._map
+
+    __hash__ = None
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return itertools.chain.from_iterable(self._lists)
+
+    def keys(self) -> Iter:
+        """Return an :class:`Iter` over the keys, in order."""
+        return Iter(iter(self))
+
+    def values(self) -> Iter:
+        """Return an :class:`Iter` over the values, in key order."""
+        return Iter(map(self._map.__getitem__, iter(self)))
+
+    def items(self) -> Iter:
+        """Return an :class:`Iter` over the ``(key, value)`` pairs, in key order."""
+        m = self._map
+        return Iter((key, m[key]) for key in iter(self))
+
+    def __getitem__(self, key: Hashable) -> Option:
+        value = self._map.get(key, _MISSING)
+        if value is _MISSING:
+            return Nun()
+        return Some(value)
+
+    def get(self, key: Hashable) -> Option:
+        """Return ``Some(value)`` if ``key`` is present, and ``Nun`` if it isn't (the same as indexing)."""
+        return self[key]
+
+    def __setitem__(self, key: Hashable, value: Any):
+        m = self._map
+        if key in m:
+            m[key] = value
+            return
+
+        m[key] = value
+        lists, maxes = self._lists, self._maxes
+        if not maxes:
+            lists.append([key])
+            maxes.append(key)
+            return
+
+        pos = bisect.bisect_left(maxes, key)
+        if pos == len(maxes):
+            pos -= 1
+            lists[pos].append(key)
+            maxes[pos] = key
+        else:
+            bisect.insort(lists[pos], key)
+
+        if len(lists[pos]) > 2 * self._load:
+            lst = lists[pos]
+            half = lst[self._load:]
+            del lst[self._load:]
+            maxes[pos] = lst[-1]
+            lists.insert(pos + 1, half)
+            maxes.insert(pos + 1, half[-1])
+
+    def insert(self, key: Hashable, value: Any):
+        self[key] = value
+
+    def remove(self, key: Hashable) -> Option:
+        """Remove ``key``, returning ``Some(value)`` if it was present, and ``Nun`` if it wasn't."""
+        value = self._map.pop(key, _MISSING)
+        if value is _MISSING:
+            return Nun()
+
+        lists, maxes = self._lists, self._maxes
+        pos = bisect.bisect_left(maxes, key)
+        lst = lists[pos]
+        del lst[bisect.bisect_left(lst, key)]
+
+        if not lst:
+            del lists[pos]
+            del maxes[pos]
+        else:
+            maxes[pos] = lst[-1]
+            if pos + 1 < len(lists) and len(lst) + len(lists[pos + 1]) <= self._load:
+                lst.extend(lists.pop(pos + 1))
+                maxes[pos] = maxes.pop(pos + 1)
+
+        return Some(value)
+
+    def _pair(self, pos: int, idx: int) -> Option:
+        if pos < 0 or pos >= len(self._lists):
+            return Nun()
+        key = self._lists[pos][idx]
+        return Some((key, self._map[key]))
+
+    def _left(self, key: Hashable) -> Tuple[int, int]:
+        """The position of the first key that is ``>= key``."""
+        pos = bisect.bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return pos, 0
+        return pos, bisect.bisect_left(self._lists[pos], key)
+
+    def _right(self, key: Hashable) -> Tuple[int, int]:
+        """The position of the first key that is ``> key``."""
+        pos = bisect.bisect_right(self._maxes, key)
+        if pos == len(self._maxes):
+            return pos, 0
+        return pos, bisect.bisect_right(self._lists[pos], key)
+
+    def _before(self, pos: int, idx: int) -> Tuple[int, int]:
+        if idx > 0:
+            return pos, idx - 1
+        if pos > 0:
+            return pos - 1, len(self._lists[pos - 1]) - 1
+        return -1, 0
+
+    def first(self) -> Option:
+        """Return ``Some((key, value))`` for the smallest key, or ``Nun`` if the map is empty."""
+        return self._pair(0, 0)
+
+    def last(self) -> Option:
+        """Return ``Some((key, value))`` for the largest key, or ``Nun`` if the map is empty."""
+        return self._pair(len(self._lists) - 1, -1)
+
+    def floor(self, key: Hashable) -> Option:
+        """Return ``Some((k, value))`` for the largest key ``k <= key``, or ``Nun`` if there isn't one."""
+        return self._pair(*self._before(*self._right(key)))
+
+    def ceiling(self, key: Hashable) -> Option:
+        """Return ``Some((k, value))`` for the smallest key ``k >= key``, or ``Nun`` if there isn't one."""
+        return self._pair(*self._left(key))
+
+    def range(self, lo: Optional[Hashable] = None, hi: Optional[Hashable] = None, inclusive: Tuple[bool, bool] = (True, False)) -> Iter:
+        """
+        Return a lazy :class:`Iter` over the ``(key, value)`` pairs with keys between ``lo`` and ``hi``, in order.
+        ``inclusive`` says whether each end is included (by default, ``lo <= key < hi``, like Python's ranges);
+        ``None`` for either end means that end is unbounded.
+        """
+        lo_inclusive, hi_inclusive = inclusive
+
+        if lo is None:
+            start = (0, 0)
+        else:
+            start = self._left(lo) if lo_inclusive else self._right(lo)
+
+        if hi is None:
+            stop = (len(self._lists), 0)
+        else:
+            stop = self._right(hi) if hi_inclusive else self._left(hi)
+
+        return Iter(self._range(start, stop))
+
+    def _range(self, start: Tuple[int, int], stop: Tuple[int, int]) -> Iterator[Tuple[Hashable, Any]]:
+        lists, m = self._lists, self._map
+        (pos, idx), (stop_pos, stop_idx) = start, stop
+
+        while pos < stop_pos:
+            for key in lists[pos][idx:]:
+                yield key, m[key]
+            pos += 1
+            idx = 0
+
+        if pos == stop_pos and pos < len(lists):
+            for key in lists[pos][idx:stop_idx]:
+                yield key, m[key]
@@ -0,0 +1,297 @@
+from typing import Any, Callable, Hashable, Iterator, Optional, Tuple
+import collections
+import functools
+import time
+
+from .exceptions import Panic
+from .option import Option, Some, Nun
+from .result import Result
+
+_MISSING = object()
+_KWARGS_MARK = object()
+_get = dict.get
+
+
+class CacheStats:
+    """Running counts of what happened to a cache."""
+
+    __slots__ = ('hits', 'misses', 'evictions', 'expirations')
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(hits = {self.hits}, misses = {self.misses}, evictions = {self.evictions}, expirations = {self.expirations})'
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were hits (``0.0`` if there haven't been any lookups)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LruHashMap:
+    """
+    A size-bounded map that evicts the least-recently-used key once it is over ``capacity``.
+    Like a :class:`HashMap`, indexing returns ``Some(value)`` or ``Nun``; a hit makes the key the most-recently-used.
+    If ``weigher`` is given, ``capacity`` bounds the total ``weigher(key, value)`` of the entries instead of their number,
+    and an entry heavier than the whole ``capacity`` is not stored at all.
+    Lookups, inserts and evictions are all O(1) (it is built on ``collections.OrderedDict``).
+    """
+
+    __slots__ = ('capacity', 'weigher', 'stats', '_data', '_weights', '_weight')
+
+    def __init__(self, capacity: int, weigher: Optional[Callable[[Hashable, Any], int]] = None):
+        if capacity <= 0:
+            raise Panic(f'capacity must be positive, but was {capacity}')
+
+        self.capacity = capacity
+        self.weigher = weigher
+        self.stats = CacheStats()
+        self._data = collections.OrderedDict()
+        self._weights = {}
+        self._weight = 0
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(capacity = {self.capacity}, {dict(self._data)})'
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Checking membership does not count as a use of the key."""
+        return key in self._data
+
+    @property
+    def weight(self) -> int:
+        """The total weight of the entries (the number of entries, if there is no ``weigher``)."""
+        return len(self._data) if self.weigher is None else self._weight
+
+    def __getitem__(self, key: Hashable) -> Option:
+        value = _get(self._data, key, _MISSING)
+        if value is _MISSING:
+            self.stats.misses += 1
+            return Nun()
+
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        return Some(value)
+
+    def get(self, key: Hashable) -> Option:
+        """Return ``Some(value)`` if ``key`` is present (making it the most-recently-used), and ``Nun`` if it isn't."""
+        return self[key]
+
+    def peek(self, key: Hashable) -> Option:
+        """Like :meth:`get`, but without making the key the most-recently-used or updating the stats."""
+        value = _get(self._data, key, _MISSING)
+        if value is _MISSING:
+            return Nun()
+        return Some(value)
+
+    def __setitem__(self, key: Hashable, value: Any):
+        data = self._data
+
+        if self.weigher is not None:
+            weight = self.weigher(key, value)
+            self._weight -= self._weights.pop(key, 0)
+            if weight > self.capacity:
+                data.pop(key, None)
+                return
+
+            self._weights[key] = weight
+            self._weight += weight
+
+        data[key] = value
+        data.move_to_end(key)
+        self._evict()
+
+    def insert(self, key: Hashable, value: Any):
+        self[key] = value
+
+    def _evict(self):
+        data = self._data
+        if self.weigher is None:
+            while len(data) > self.capacity:
+                data.popitem(last = False)
+                self.stats.evictions += 1
+        else:
+            while self._weight > self.capacity:
+                key, _ = data.popitem(last = False)
+                self._weight -= self._weights.pop(key)
+                self.stats.evictions += 1
+
+    def remove(self, key: Hashable) -> Option:
+        """Remove ``key``, returning ``Some(value)`` if it was present, and ``Nun`` if it wasn't."""
+        value = self._data.pop(key, _MISSING)
+        if value is _MISSING:
+            return Nun()
+
+        if self.weigher is not None:
+            self._weight -= self._weights.pop(key)
+        return Some(value)
+
+    def clear(self):
+        self._data.clear()
+        self._weights.clear()
+        self._weight = 0
+
+    def items(self):
+        """The ``(key, value)`` pairs, from least- to most-recently-used."""
+        return self._data.items()
+
+
+class TtlHashMap:
+    """
+    A time-bounded map where each entry expires ``ttl`` seconds after it was inserted.
+    Like a :class:`HashMap`, indexing returns ``Some(value)`` or ``Nun``; an expired entry is a miss, and is removed when it is found.
+    Because every entry lives for the same ``ttl``, insertion order is expiry order,
+    so each insert also drops the expired entries from the front in amortized O(1).
+    An individual entry can be given its own ``ttl`` in :meth:`insert`; it is still checked on every lookup,
+    but a longer-lived entry in front of it may delay its removal from memory.
+    If ``capacity`` is given, the oldest entries are evicted to keep at most ``capacity`` of them.
+    ``clock`` is any function that returns the current time in seconds (``time.monotonic`` by default).
+    """
+
+    __slots__ = ('ttl', 'capacity', 'clock', 'stats', '_data')
+
+    def __init__(self, ttl: float, capacity: Optional[int] = None, clock: Callable[[], float] = time.monotonic):
+        if ttl <= 0:
+            raise Panic(f'ttl must be positive, but was {ttl}')
+        if capacity is not None and capacity <= 0:
+            raise Panic(f'capacity must be positive, but was {capacity}')
+
+        self.ttl = ttl
+        self.capacity = capacity
+        self.clock = clock
+        self.stats = CacheStats()
+        self._data = collections.OrderedDict()  # key -> (expires at, value)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(ttl = {self.ttl}, {len(self._data)} entries)'
+
+    def __len__(self):
+        """The number of entries, including any that have expired but haven't been removed yet."""
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        now = self.clock()
+        return iter([key for key, (expires, _) in self._data.items() if expires > now])
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = _get(self._data, key)
+        return entry is not None and entry[0] > self.clock()
+
+    def __getitem__(self, key: Hashable) -> Option:
+        entry = _get(self._data, key)
+        if entry is None:
+            self.stats.misses += 1
+            return Nun()
+
+        if entry[0] <= self.clock():
+            del self._data[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return Nun()
+
+        self.stats.hits += 1
+        return Some(entry[1])
+
+    def get(self, key: Hashable) -> Option:
+        """Return ``Some(value)`` if ``key`` is present and hasn't expired, and ``Nun`` otherwise."""
+        return self[key]
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self.insert(key, value)
+
+    def insert(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Insert ``key``, which expires ``ttl`` seconds from now (or after the map's ``ttl``, if not given)."""
+        now = self.clock()
+        data = self._data
+
+        data.pop(key, None)  # re-inserting moves the key to the back, in expiry order
+        data[key] = (now + (self.ttl if ttl is None else ttl), value)
+
+        self._expire(now)
+        if self.capacity is not None:
+            while len(data) > self.capacity:
+                data.popitem(last = False)
+                self.stats.evictions += 1
+
+    def _expire(self, now: float):
+        data = self._data
+        while data:
+            key, (expires, _) = next(iter(data.items()))
+            if expires > now:
+                break
+            del data[key]
+            self.stats.expirations += 1
+
+    def expire(self):
+        """Remove every expired entry from the front of the map now, instead of waiting for the next insert."""
+        self._expire(self.clock())
+
+    def remove(self, key: Hashable) -> Option:
+        """Remove ``key``, returning ``Some(value)`` if it was present and hadn't expired, and ``Nun`` otherwise."""
+        entry = self._data.pop(key, None)
+        if entry is None or entry[0] <= self.clock():
+            return Nun()
+        return Some(entry[1])
+
+    def clear(self):
+        self._data.clear()
+
+
+def _make_key(args: Tuple, kwargs: dict) -> Hashable:
+    if not kwargs:
+        return args
+    return args + (_KWARGS_MARK,) + tuple(kwargs.items())
+
+
+def memoize(func: Callable = None, *, cache = None, negative_ttl: Optional[float] = None):
+    """
+    A decorator that caches the ``Result``s returned by a function, keyed by its (hashable) arguments.
+    ``Ok``s (and plain return values) are stored in ``cache``, which can be any map with ``Option``-returning lookups,
+    such as a :class:`LruHashMap` (the default, with a capacity of 128), a :class:`TtlHashMap`, or a :class:`HashMap`.
+    ``Err``s are not cached, unless ``negative_ttl`` is given, in which case they are cached for that many seconds
+    in a separate :class:`TtlHashMap`, so that a failing call isn't retried on every use but is retried eventually.
+    The caches are available as ``wrapper.cache`` and ``wrapper.negative_cache``.
+    Can be used bare (``@memoize``) or with arguments (``@memoize(cache = TtlHashMap(60))``).
+    """
+    if func is None:
+        return functools.partial(memoize, cache = cache, negative_ttl = negative_ttl)
+
+    if cache is None:
+        cache = LruHashMap(128)
+    negative_cache = TtlHashMap(negative_ttl) if negative_ttl is not None else None
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = _make_key(args, kwargs)
+
+        value = cache[key].unwrap_or(_MISSING)
+        if value is not _MISSING:
+            return value
+
+        if negative_cache is not None:
+            value = negative_cache[key].unwrap_or(_MISSING)
+            if value is not _MISSING:
+                return value
+
+        value = func(*args, **kwargs)
+        if not isinstance(value, Result) or value.is_ok():
+            cache[key] = value
+        elif negative_cache is not None:
+            negative_cache[key] = value
+
+        return value
+
+    wrapper.cache = cache
+    wrapper.negative_cache = negative_cache
+
+    return wrapper
@@ -0,0 +1,107 @@
+from typing import Callable, Tuple, Union
+
+from .option import Option, Some
+from .result import Result, Ok
+
+MAP = 'map'
+AND_THEN = 'and_then'
+MAP_ERR = 'map_err'
+OR_ELSE = 'or_else'
+
+Wrapped = Union[Option, Result]
+
+
+class Chain:
+    """
+    A reusable sequence of ``map``/``and_then``/``map_err``/``or_else`` steps, built once and then applied to many ``Option``s or ``Result``s.
+    ``Chain().map(f).and_then(g)(x)`` gives the same answer as ``x.map(f).and_then(g)``,
+    but the value is unpacked once and only wrapped again at the end, instead of creating a new ``Some``/``Ok`` at every step.
+    Once the value is a ``Nun``/``Err`` and no later step could recover it, the remaining steps are skipped.
+    ``map_err`` steps do not apply to ``Option``s.
+    """
+
+    __slots__ = ('_steps', '_last_recovery')
+
+    def __init__(self, steps: Tuple[Tuple[str, Callable], ...] = ()):
+        self._steps = tuple(steps)
+        self._last_recovery = max((idx for idx, (kind, _) in enumerate(self._steps) if kind in (MAP_ERR, OR_ELSE)), default = -1)
+
+    def __repr__(self):
+        steps = ''.join(f'.{kind}({func!r})' for kind, func in self._steps)
+        return f'{self.__class__.__name__}(){steps}'
+
+    def __len__(self):
+        return len(self._steps)
+
+    def _then(self, kind: str, func: Callable) -> 'Chain':
+        return self.__class__(self._steps + ((kind, func),))
+
+    def map(self, func: Callable) -> 'Chain':
+        """Return a new ``Chain`` with a :meth:`map` step added to the end."""
+        return self._then(MAP, func)
+
+    def and_then(self, func: Callable) -> 'Chain':
+        """Return a new ``Chain`` with an :meth:`and_then` step added to the end."""
+        return self._then(AND_THEN, func)
+
+    def map_err(self, func: Callable) -> 'Chain':
+        """Return a new ``Chain`` with a :meth:`map_err` step added to the end."""
+        return self._then(MAP_ERR, func)
+
+    def or_else(self, func: Callable) -> 'Chain':
+        """Return a new ``Chain`` with an :meth:`or_else` step added to the end."""
+        return self._then(OR_ELSE, func)
+
+    def __call__(self, wrapped: Wrapped) -> Wrapped:
+        """Apply the steps of the ``Chain`` to an ``Option`` or ``Result``."""
+        if isinstance(wrapped, Option):
+            return self._apply_option(wrapped)
+        return self._apply_result(wrapped)
+
+    def _apply_option(self, wrapped: Option) -> Option:
+        # as in Option.and_then, the function's return value is the new value
+        ok = wrapped.is_some()
+        value = wrapped._val
+        current = wrapped  # the object that currently holds (ok, value), if there is one
+
+        for idx, (kind, func) in enumerate(self._steps):
+            if ok:
+                if kind is MAP or kind is AND_THEN:
+                    value = func(value)
+                    current = None
+            elif idx > self._last_recovery:
+                break
+            elif kind is OR_ELSE:
+                value = func()
+                ok = True
+                current = None
+
+        if current is not None:
+            return current
+        return Some(value)
+
+    def _apply_result(self, wrapped: Result) -> Result:
+        # as in Result.and_then, Result.map_err and Result.or_else, the function returns the new Result
+        ok = wrapped.is_ok()
+        value = wrapped._val
+        current = wrapped
+
+        for idx, (kind, func) in enumerate(self._steps):
+            if ok:
+                if kind is MAP:
+                    value = func(value)
+                    current = None
+                elif kind is AND_THEN:
+                    current = func(value)
+                    ok = current.is_ok()
+                    value = current._val
+            elif idx > self._last_recovery:
+                break
+            elif kind is MAP_ERR or kind is OR_ELSE:
+                current = func(value)
+                ok = current.is_ok()
+                value = current._val
+
+        if current is not None:
+            return current
+        return Ok(value)  # only a map step can leave no current Result, and it only runs on an Ok
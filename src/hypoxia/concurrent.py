@@ -0,0 +1,150 @@
+from typing import Any, Callable, Hashable, Iterable, Iterator, Tuple
+import threading
+
+from .exceptions import Panic
+from .option import Option, Some, Nun
+from .hashmap import HashMap
+
+_MISSING = object()
+_get = dict.get
+
+
+class ConcurrentHashMap:
+    """
+    A map that can be shared between threads, split into ``shards`` independently-locked ``dict``s (the shard for a key is picked by its hash).
+    Like a :class:`HashMap`, indexing returns ``Some(value)`` or ``Nun``.
+
+    Lookups don't take any lock: a single ``dict`` read is atomic (under the GIL, and on free-threaded builds, where ``dict`` locks itself).
+    Writes take only their shard's lock, so threads writing to different shards don't wait on each other.
+    The read-modify-write methods (:meth:`compute`, :meth:`merge` and :meth:`get_or_insert_with`) hold the shard lock while they run,
+    so they are atomic with respect to every other write to the same key.
+    The locks are re-entrant, so the functions passed to those methods may use the map, but they block the rest of their shard while they run,
+    so keep them short.
+    """
+
+    __slots__ = ('_shards', '_locks', '_mask')
+
+    def __init__(self, items: Iterable[Tuple[Hashable, Any]] = (), shards: int = 16):
+        if shards <= 0 or shards & (shards - 1):
+            raise Panic(f'shards must be a positive power of two, but was {shards}')
+
+        self._shards = tuple({} for _ in range(shards))
+        self._locks = tuple(threading.RLock() for _ in range(shards))
+        self._mask = shards - 1
+
+        for key, value in items.items() if isinstance(items, dict) else items:
+            self[key] = value
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({dict(self.items())})'
+
+    def __len__(self):
+        return sum(map(len, self._shards))
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._shards[hash(key) & self._mask]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over a snapshot of the keys (see :meth:`items`)."""
+        return (key for key, _ in self.items())
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """
+        Iterate over a snapshot of the ``(key, value)`` pairs, taken one shard at a time.
+        Each shard's snapshot is consistent, but writes to other shards may happen in between.
+        """
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                pairs = list(shard.items())
+            yield from pairs
+
+    def snapshot(self) -> HashMap:
+        """Return a :class:`HashMap` copy of the map (see :meth:`items`)."""
+        return HashMap(self.items())
+
+    def __getitem__(self, key: Hashable) -> Option:
+        value = _get(self._shards[hash(key) & self._mask], key, _MISSING)
+        if value is _MISSING:
+            return Nun()
+        return Some(value)
+
+    def get(self, key: Hashable) -> Option:
+        """Return ``Some(value)`` if ``key`` is present, and ``Nun`` if it isn't (the same as indexing)."""
+        return self[key]
+
+    def __setitem__(self, key: Hashable, value: Any):
+        idx = hash(key) & self._mask
+        with self._locks[idx]:
+            self._shards[idx][key] = value
+
+    def insert(self, key: Hashable, value: Any):
+        self[key] = value
+
+    def remove(self, key: Hashable) -> Option:
+        """Remove ``key``, returning ``Some(value)`` if it was present, and ``Nun`` if it wasn't."""
+        idx = hash(key) & self._mask
+        with self._locks[idx]:
+            value = self._shards[idx].pop(key, _MISSING)
+
+        if value is _MISSING:
+            return Nun()
+        return Some(value)
+
+    def compute(self, key: Hashable, func: Callable[[Option], Option]) -> Option:
+        """
+        Atomically replace the entry for ``key``: ``func`` is called with ``Some(current value)`` or ``Nun``,
+        and returns ``Some(new value)`` to store, or ``Nun`` to remove the key. Returns what ``func`` returned.
+        """
+        idx = hash(key) & self._mask
+        shard = self._shards[idx]
+        with self._locks[idx]:
+            value = _get(shard, key, _MISSING)
+            new = func(Nun() if value is _MISSING else Some(value))
+
+            new_value = new.unwrap_or(_MISSING)
+            if new_value is _MISSING:
+                shard.pop(key, None)
+            else:
+                shard[key] = new_value
+
+        return new
+
+    def merge(self, key: Hashable, value: Any, func: Callable[[Any, Any], Any]) -> Any:
+        """
+        Atomically insert ``value`` if ``key`` is missing, or replace the current value with ``func(current value, value)`` if it is present.
+        Returns the new value. For example, ``counts.merge(word, 1, operator.add)`` counts words.
+        """
+        idx = hash(key) & self._mask
+        shard = self._shards[idx]
+        with self._locks[idx]:
+            current = _get(shard, key, _MISSING)
+            if current is not _MISSING:
+                value = func(current, value)
+            shard[key] = value
+
+        return value
+
+    def get_or_insert_with(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """
+        If ``key`` is present, return its value. Otherwise, insert ``func()`` and return it.
+        ``func`` is called at most once per key, even if many threads ask for the same missing key at the same time:
+        the others wait for it and then get its value.
+        """
+        idx = hash(key) & self._mask
+        shard = self._shards[idx]
+
+        value = _get(shard, key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._locks[idx]:
+            value = _get(shard, key, _MISSING)
+            if value is _MISSING:
+                value = shard[key] = func()
+
+        return value
+
+    def clear(self):
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.clear()
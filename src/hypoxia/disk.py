@@ -0,0 +1,307 @@
+from typing import Any, Hashable, Iterable, Iterator, Mapping, Tuple, Union
+import hashlib
+import math
+import os
+import pickle
+import sqlite3
+import threading
+
+from .exceptions import Panic
+from .option import Option, Some, Nun
+
+KEY_PROTOCOL = 4  # fixed, so that the same key always pickles to the same bytes
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (key BLOB PRIMARY KEY, value BLOB NOT NULL) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value BLOB NOT NULL);
+INSERT OR IGNORE INTO meta (name, value) VALUES ('generation', 0);
+"""
+
+
+class BloomFilter:
+    """
+    A Bloom filter over ``bytes``: ``data in bloom`` is ``False`` only if ``data`` was definitely never added,
+    and is wrongly ``True`` for about ``error_rate`` of the things that weren't, as long as at most ``capacity`` things have been added.
+    The bit positions come from one ``blake2b`` digest per item (split into two hashes, combined as ``h1 + i * h2``).
+    """
+
+    __slots__ = ('size', 'hashes', 'bits')
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        capacity = max(capacity, 1)
+        self.size = max(int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))), 8)
+        self.hashes = max(int(round(self.size / capacity * math.log(2))), 1)
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, data: bytes) -> Iterator[int]:
+        digest = hashlib.blake2b(data, digest_size = 16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        size = self.size
+        return ((h1 + i * h2) % size for i in range(self.hashes))
+
+    def add(self, data: bytes):
+        bits = self.bits
+        for position in self._positions(data):
+            bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, data: bytes) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(data))
+
+    def to_bytes(self) -> bytes:
+        return self.size.to_bytes(8, 'little') + self.hashes.to_bytes(2, 'little') + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'BloomFilter':
+        new = cls.__new__(cls)
+        new.size = int.from_bytes(data[:8], 'little')
+        new.hashes = int.from_bytes(data[8:10], 'little')
+        new.bits = bytearray(data[10:])
+        return new
+
+
+class DiskHashMap:
+    """
+    A map stored in a single SQLite file (in WAL mode), for tables that don't fit in memory.
+    Like a :class:`HashMap`, indexing returns ``Some(value)`` or ``Nun``.
+    Keys and values are pickled; a key is found by its pickle, so keys should be simple values (``str``, ``int``, ``bytes``, tuples of them...)
+    whose equal instances pickle identically.
+
+    An in-memory :class:`BloomFilter` of the keys sits in front of the file, so most misses never touch the disk.
+    It is saved into the file by :meth:`flush` (and :meth:`close`), and is rebuilt from the keys when the map is opened if it wasn't saved.
+    Every write transaction also increments a generation number in the file, so when a write is made through another instance (or process),
+    this instance notices on its next miss: it loads the other writer's filter once that has been flushed, and looks every key up in the file until then.
+
+    Each thread gets its own connection, so many threads can read at once (SQLite's WAL mode lets readers proceed while a write is happening).
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], bloom_capacity: int = 1_000_000, error_rate: float = 0.01):
+        self.path = os.fspath(path)
+        self.bloom_capacity = bloom_capacity
+        self.error_rate = error_rate
+
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+
+        conn = self._connection()
+        conn.executescript(_SCHEMA)
+        self._local.data_version = conn.execute('PRAGMA data_version').fetchone()[0]  # before loading, so that later commits are noticed
+        self._load_bloom(conn)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.path!r})'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            if self._connections is None:
+                raise Panic(f'{self} has been closed')
+
+            conn = sqlite3.connect(self.path, check_same_thread = False)
+            conn.execute('PRAGMA journal_mode = WAL')
+            conn.execute('PRAGMA synchronous = NORMAL')
+            self._local.conn = conn
+            self._local.data_version = None
+            with self._lock:
+                self._connections.append(conn)
+
+        return conn
+
+    def _load_bloom(self, conn: sqlite3.Connection):
+        """
+        Use the saved filter if there is one, and otherwise build one from the keys.
+        ``_generation`` is the generation that ``bloom`` covers every key of, or ``None`` if another writer may have added keys that it doesn't.
+        """
+        # one statement, so that the filter and the generation come from the same snapshot
+        meta = dict(conn.execute("SELECT name, value FROM meta WHERE name IN ('bloom', 'generation')").fetchall())
+        if 'bloom' in meta:
+            self.bloom = BloomFilter.from_bytes(meta['bloom'])
+            self._generation = self._saved_generation = meta['generation']
+        else:
+            self._build_bloom(conn)
+
+    def _build_bloom(self, conn: sqlite3.Connection):
+        # the generation is read first, so that any keys added while the filter is being built make it look stale, not up to date
+        generation = conn.execute("SELECT value FROM meta WHERE name = 'generation'").fetchone()[0]
+        count = conn.execute('SELECT count(*) FROM entries').fetchone()[0]
+        bloom = BloomFilter(max(count, self.bloom_capacity), self.error_rate)
+        for (key,) in conn.execute('SELECT key FROM entries'):
+            bloom.add(key)
+
+        self.bloom = bloom
+        self._generation = generation
+        self._saved_generation = None
+
+    def _begin_write(self, conn: sqlite3.Connection) -> int:
+        """Called inside each write transaction (holding ``_lock``): drop the saved filter, which no longer covers every key, and increment the generation."""
+        conn.execute("DELETE FROM meta WHERE name = 'bloom'")
+        conn.execute("UPDATE meta SET value = value + 1 WHERE name = 'generation'")
+        return conn.execute("SELECT value FROM meta WHERE name = 'generation'").fetchone()[0]
+
+    def _end_write(self, generation: int):
+        # if the generation skipped ahead, another writer committed in between, and its keys aren't in the filter
+        self._generation = generation if self._generation == generation - 1 else None
+        self._saved_generation = None
+
+    def _might_contain(self, k: bytes) -> bool:
+        """``False`` only if the key definitely isn't in the file."""
+        if k in self.bloom:
+            return True
+
+        # data_version only changes when another connection commits, and checking it doesn't read the database itself
+        conn = self._connection()
+        data_version = conn.execute('PRAGMA data_version').fetchone()[0]
+        if data_version != self._local.data_version:
+            self._local.data_version = data_version
+            self._refresh_bloom(conn)
+
+        return self._generation is None or k in self.bloom
+
+    def _refresh_bloom(self, conn: sqlite3.Connection):
+        with self._lock:
+            meta = dict(conn.execute("SELECT name, value FROM meta WHERE name IN ('bloom', 'generation')").fetchall())
+            if meta['generation'] == self._generation:
+                return
+
+            if 'bloom' in meta:
+                self.bloom = BloomFilter.from_bytes(meta['bloom'])
+                self._generation = self._saved_generation = meta['generation']
+            else:
+                self._generation = None
+
+    def __len__(self):
+        return self._connection().execute('SELECT count(*) FROM entries').fetchone()[0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        k = pickle.dumps(key, protocol = KEY_PROTOCOL)
+        if not self._might_contain(k):
+            return False
+        return self._connection().execute('SELECT 1 FROM entries WHERE key = ?', (k,)).fetchone() is not None
+
+    def __getitem__(self, key: Hashable) -> Option:
+        k = pickle.dumps(key, protocol = KEY_PROTOCOL)
+        if not self._might_contain(k):
+            return Nun()
+
+        row = self._connection().execute('SELECT value FROM entries WHERE key = ?', (k,)).fetchone()
+        if row is None:
+            return Nun()
+        return Some(pickle.loads(row[0]))
+
+    def get(self, key: Hashable) -> Option:
+        """Return ``Some(value)`` if ``key`` is present, and ``Nun`` if it isn't (the same as indexing)."""
+        return self[key]
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self._write_batch(self._connection(), [(pickle.dumps(key, protocol = KEY_PROTOCOL), pickle.dumps(value, protocol = pickle.HIGHEST_PROTOCOL))])
+
+    def insert(self, key: Hashable, value: Any):
+        self[key] = value
+
+    def extend(self, items: Union[Mapping, Iterable[Tuple[Hashable, Any]]], batch_size: int = 10_000):
+        """
+        Insert every ``(key, value)`` pair from ``items`` (which may be a mapping or an :class:`Iter`),
+        committing one transaction per ``batch_size`` pairs instead of one per pair.
+        """
+        conn = self._connection()
+        pairs = items.items() if isinstance(items, Mapping) else items
+
+        batch = []
+        for key, value in pairs:
+            batch.append((pickle.dumps(key, protocol = KEY_PROTOCOL), pickle.dumps(value, protocol = pickle.HIGHEST_PROTOCOL)))
+
+            if len(batch) >= batch_size:
+                self._write_batch(conn, batch)
+                batch = []
+
+        if batch:
+            self._write_batch(conn, batch)
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: list):
+        # the lock makes adding to the filter (a read-modify-write of its bytes) and tracking the generation safe across this instance's threads
+        with self._lock:
+            for k, _ in batch:
+                self.bloom.add(k)  # before the write commits, so a reader can never miss a committed key
+
+            with conn:
+                generation = self._begin_write(conn)
+                conn.executemany('INSERT OR REPLACE INTO entries (key, value) VALUES (?, ?)', batch)
+            self._end_write(generation)
+
+    def remove(self, key: Hashable) -> Option:
+        """Remove ``key``, returning ``Some(value)`` if it was present, and ``Nun`` if it wasn't. (The key stays in the Bloom filter until :meth:`compact`.)"""
+        k = pickle.dumps(key, protocol = KEY_PROTOCOL)
+        if not self._might_contain(k):
+            return Nun()
+
+        conn = self._connection()
+        with self._lock:
+            with conn:
+                conn.execute('BEGIN IMMEDIATE')  # take the write lock before reading, so the row can't change before it is deleted
+                row = conn.execute('SELECT value FROM entries WHERE key = ?', (k,)).fetchone()
+                if row is None:
+                    return Nun()
+                generation = self._begin_write(conn)
+                conn.execute('DELETE FROM entries WHERE key = ?', (k,))
+            self._end_write(generation)
+
+        return Some(pickle.loads(row[0]))
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        """Iterate over the ``(key, value)`` pairs, streaming them from the file."""
+        for k, v in self._connection().execute('SELECT key, value FROM entries'):
+            yield pickle.loads(k), pickle.loads(v)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        for (k,) in self._connection().execute('SELECT key FROM entries'):
+            yield pickle.loads(k)
+
+    def keys(self) -> Iterator[Hashable]:
+        return iter(self)
+
+    def values(self) -> Iterator[Any]:
+        for (v,) in self._connection().execute('SELECT value FROM entries'):
+            yield pickle.loads(v)
+
+    def flush(self):
+        """Save the Bloom filter into the file (so that it doesn't need to be rebuilt when the file is next opened) and checkpoint the write-ahead log."""
+        conn = self._connection()
+        with self._lock:
+            if self._generation is not None and self._generation != self._saved_generation:
+                with conn:
+                    # only if nobody else has written since, since the filter wouldn't cover their keys
+                    saved = conn.execute(
+                        "INSERT OR REPLACE INTO meta (name, value) SELECT 'bloom', ? FROM meta WHERE name = 'generation' AND value = ?",
+                        (self.bloom.to_bytes(), self._generation),
+                    ).rowcount
+                if saved:
+                    self._saved_generation = self._generation
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+
+    def compact(self):
+        """Rebuild the Bloom filter without the removed keys, and rewrite the file without the space they used."""
+        conn = self._connection()
+        with self._lock:
+            self._build_bloom(conn)
+        conn.execute('VACUUM')
+        self.flush()
+
+    def close(self):
+        """Flush, then close every thread's connection. The map can't be used afterwards."""
+        if self._connections is None:
+            return
+
+        self.flush()
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections = None
+        self._local = threading.local()
@@ -1,11 +1,9 @@
-from .result import Ok, Err
+from .propagate import returns_result
 
 
+@returns_result
 def open_file(file, *args, **kwargs):
-    try:
-        return Ok(open(file, *args, **kwargs))
-    except Exception as e:
-        return Err(e)
+    return open(file, *args, **kwargs)
 
 
 class File:
@@ -0,0 +1,273 @@
+from typing import Any, BinaryIO, Hashable, Iterable, Iterator, Mapping, Tuple, Union
+import array
+import bisect
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+
+from .exceptions import Panic
+from .option import Option, Some, Nun
+from .arrays import OptionArray
+
+MAGIC = b'HYPXFRZ1'
+
+INT_KEYS = 1
+STR_KEYS = 2
+
+INT_VALUES = 1
+FLOAT_VALUES = 2
+OBJECT_VALUES = 3
+
+# magic, count, key kind, value kind, then the (start, stop) byte range of each of the four sections
+_HEADER = struct.Struct('<8sQBB6x8Q')
+
+
+def stable_hash(data: bytes) -> int:
+    """A 64-bit hash of ``data`` that is the same in every process (unlike ``hash``, which is salted for ``str``)."""
+    return int.from_bytes(hashlib.blake2b(data, digest_size = 8).digest(), 'little')
+
+
+def _aligned(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _blob(items: Iterable[bytes]) -> Tuple[array.array, bytes]:
+    """Concatenate ``items``, returning the offsets of their boundaries (one more than the number of items) and the concatenated bytes."""
+    offsets = array.array('Q', [0])
+    chunks = []
+    position = 0
+    for item in items:
+        position += len(item)
+        offsets.append(position)
+        chunks.append(item)
+    return offsets, b''.join(chunks)
+
+
+def _value_kind(values: list) -> int:
+    if all(type(v) is int for v in values):
+        if all(-(1 << 63) <= v < (1 << 63) for v in values):
+            return INT_VALUES
+    elif all(type(v) is float for v in values):
+        return FLOAT_VALUES
+    return OBJECT_VALUES
+
+
+def _build(items: Union[Mapping, Iterable[Tuple[Hashable, Any]]]) -> bytearray:
+    """Build the file image of a ``FrozenHashMap`` (see :meth:`FrozenHashMap.save` for the layout)."""
+    d = dict(items)
+    if all(type(k) is int for k in d):
+        key_kind = INT_KEYS
+        keys = sorted(d)
+        try:
+            key_sections = [array.array('q', keys).tobytes(), b'']
+        except OverflowError:
+            raise Panic('int keys must fit in 64 bits')
+    elif all(type(k) is str for k in d):
+        key_kind = STR_KEYS
+        encoded = sorted((stable_hash(e), e, k) for k, e in ((k, k.encode('utf-8')) for k in d))
+        keys = [k for _, _, k in encoded]
+        offsets, blob = _blob(e for _, e, _ in encoded)
+        key_sections = [array.array('Q', [h for h, _, _ in encoded]).tobytes(), offsets.tobytes() + blob]
+    else:
+        raise Panic('keys must be all ints or all strs')
+
+    values = [d[k] for k in keys]
+    value_kind = _value_kind(values)
+    if value_kind == INT_VALUES:
+        value_sections = [array.array('q', values).tobytes(), b'']
+    elif value_kind == FLOAT_VALUES:
+        value_sections = [array.array('d', values).tobytes(), b'']
+    else:
+        offsets, blob = _blob(pickle.dumps(v, protocol = pickle.HIGHEST_PROTOCOL) for v in values)
+        value_sections = [offsets.tobytes(), blob]
+
+    ranges = []
+    position = _HEADER.size
+    for section in key_sections + value_sections:
+        ranges += [position, position + len(section)]
+        position = _aligned(position + len(section))
+
+    image = bytearray(position)
+    image[:_HEADER.size] = _HEADER.pack(MAGIC, len(keys), key_kind, value_kind, *ranges)
+    for section, start in zip(key_sections + value_sections, ranges[::2]):
+        image[start:start + len(section)] = section
+
+    return image
+
+
+class FrozenHashMap:
+    """
+    A read-only map for large, static lookup tables, stored as a few flat arrays instead of a ``dict`` of Python objects.
+    Like a :class:`HashMap`, indexing returns ``Some(value)`` or ``Nun``.
+
+    Keys must be all ``int`` (stored sorted, as 64-bit integers) or all ``str`` (stored as UTF-8, sorted by a stable 64-bit hash);
+    a lookup is a binary search over the sorted column.
+    Values are stored as 64-bit integers if they are all ``int``, as doubles if they are all ``float``, and pickled otherwise.
+
+    The whole map is a single buffer, which :meth:`save` writes to a file and :meth:`load` memory-maps,
+    so loading is O(1) and the pages are shared between processes that load the same file.
+    """
+
+    __slots__ = ('_buffer', '_mmap', '_count', '_key_kind', '_value_kind', '_keys', '_key_offsets', '_key_blob', '_values', '_value_offsets', '_value_blob')
+
+    def __init__(self, items: Union[Mapping, Iterable[Tuple[Hashable, Any]]] = ()):
+        self._mmap = None
+        self._attach(_build(items))
+
+    @classmethod
+    def load(cls, source: Union[str, os.PathLike, BinaryIO]) -> 'FrozenHashMap':
+        """
+        Memory-map a file written by :meth:`save`, given its path or an open binary file (which is not closed).
+        The file must not be changed while it is mapped.
+        """
+        if not hasattr(source, 'fileno'):
+            with open(source, 'rb') as f:
+                return cls.load(f)
+
+        new = cls.__new__(cls)
+        new._mmap = mmap.mmap(source.fileno(), 0, access = mmap.ACCESS_READ)
+        new._attach(new._mmap)
+        return new
+
+    def _attach(self, buffer):
+        view = memoryview(buffer)
+        if len(view) < _HEADER.size or bytes(view[:8]) != MAGIC:
+            raise Panic('not a FrozenHashMap file')
+
+        _, count, key_kind, value_kind, *ranges = _HEADER.unpack_from(view)
+        (k0, k1, k2, k3, v0, v1, v2, v3) = ranges
+
+        self._buffer = view
+        self._count = count
+        self._key_kind = key_kind
+        self._value_kind = value_kind
+
+        if key_kind == INT_KEYS:
+            self._keys = view[k0:k1].cast('q')
+            self._key_offsets = self._key_blob = None
+        else:
+            self._keys = view[k0:k1].cast('Q')
+            self._key_offsets = view[k2:k2 + 8 * (count + 1)].cast('Q')
+            self._key_blob = view[k2 + 8 * (count + 1):k3]
+
+        if value_kind == OBJECT_VALUES:
+            self._values = None
+            self._value_offsets = view[v0:v1].cast('Q')
+            self._value_blob = view[v2:v3]
+        else:
+            self._values = view[v0:v1].cast('q' if value_kind == INT_VALUES else 'd')
+            self._value_offsets = self._value_blob = None
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._count} entries, {self.nbytes} bytes)'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the map's buffer, in bytes."""
+        return self._buffer.nbytes
+
+    def save(self, path: Union[str, os.PathLike]):
+        """
+        Write the map to ``path``, to be loaded with :meth:`load`.
+        The file is an 88-byte header (magic, count, key and value kinds, and the byte range of each section)
+        followed by 8-byte-aligned sections: the sorted keys (or key hashes), the key offsets and UTF-8 bytes (``str`` keys only),
+        and then either the value column, or the value offsets and pickles.
+        """
+        with open(path, 'wb') as f:
+            f.write(self._buffer)
+
+    def close(self):
+        """Release the buffer (and unmap the file, if it was loaded). The map can't be used afterwards."""
+        for name in ('_keys', '_key_offsets', '_key_blob', '_values', '_value_offsets', '_value_blob'):
+            view = getattr(self, name)
+            if view is not None:
+                view.release()
+            setattr(self, name, None)
+        self._buffer.release()
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __len__(self):
+        return self._count
+
+    def _index(self, key: Hashable) -> int:
+        """The position of ``key`` in the columns, or ``-1`` if it isn't present."""
+        keys = self._keys
+
+        if self._key_kind == INT_KEYS:
+            if not isinstance(key, int):
+                return -1
+            idx = bisect.bisect_left(keys, key)
+            return idx if idx < self._count and keys[idx] == key else -1
+
+        if not isinstance(key, str):
+            return -1
+        encoded = key.encode('utf-8')
+        h = stable_hash(encoded)
+        offsets, blob = self._key_offsets, self._key_blob
+        idx = bisect.bisect_left(keys, h)
+        while idx < self._count and keys[idx] == h:
+            if blob[offsets[idx]:offsets[idx + 1]] == encoded:
+                return idx
+            idx += 1
+        return -1
+
+    def _value(self, idx: int) -> Any:
+        if self._values is not None:
+            return self._values[idx]
+        return pickle.loads(self._value_blob[self._value_offsets[idx]:self._value_offsets[idx + 1]])
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._index(key) >= 0
+
+    def __getitem__(self, key: Hashable) -> Option:
+        idx = self._index(key)
+        if idx < 0:
+            return Nun()
+        return Some(self._value(idx))
+
+    def get(self, key: Hashable) -> Option:
+        """Return ``Some(value)`` if ``key`` is present, and ``Nun`` if it isn't (the same as indexing)."""
+        return self[key]
+
+    def get_many(self, keys: Iterable[Hashable]) -> OptionArray:
+        """Look up every key in ``keys``, returning an :class:`OptionArray` with one element per key (``Nun`` for missing keys)."""
+        values, mask = [], bytearray()
+        for key in keys:
+            idx = self._index(key)
+            if idx < 0:
+                values.append(None)
+                mask.append(0)
+            else:
+                values.append(self._value(idx))
+                mask.append(1)
+
+        return OptionArray.from_columns(values, mask)
+
+    def _key(self, idx: int) -> Hashable:
+        if self._key_kind == INT_KEYS:
+            return self._keys[idx]
+        return str(self._key_blob[self._key_offsets[idx]:self._key_offsets[idx + 1]], 'utf-8')
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterate over the keys, in storage order (sorted for ``int`` keys, and in hash order for ``str`` keys)."""
+        return map(self._key, range(self._count))
+
+    def keys(self) -> Iterator[Hashable]:
+        return iter(self)
+
+    def values(self) -> Iterator[Any]:
+        return map(self._value, range(self._count))
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        return zip(self.keys(), self.values())
@@ -0,0 +1,216 @@
+from typing import Any, Callable, Collection, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple, Type, Union
+import functools
+import operator
+import pickle
+import tempfile
+
+from .exceptions import Panic
+from .hashmap import HashMap
+
+PARTITIONS = 16
+
+# How each aggregation starts a group's state from the first value, and updates it with each later value, as lines of source in the generated loop.
+# ``{val}`` is the value being aggregated (the element, or a function of it) and ``s[{i}]`` is the aggregation's slot in the group's state.
+_INIT = {
+    'count': '1',
+    'sum': '{val}',
+    'min': '{val}',
+    'max': '{val}',
+    'mean': '[{val}, 1]',
+    'first': '{val}',
+    'last': '{val}',
+    'list': '[{val}]',
+}
+
+_UPDATE = {
+    'count': ['s[{i}] += 1'],
+    'sum': ['s[{i}] += {val}'],
+    'min': ['y = {val}', 'if y < s[{i}]:', '    s[{i}] = y'],
+    'max': ['y = {val}', 'if y > s[{i}]:', '    s[{i}] = y'],
+    'mean': ['m = s[{i}]', 'm[0] += {val}', 'm[1] += 1'],
+    'first': [],
+    'last': ['s[{i}] = {val}'],
+    'list': ['s[{i}].append({val})'],
+}
+
+# How to combine two partial states of the same group (the earlier one first), after spilling.
+_MERGE = {
+    'count': operator.add,
+    'sum': operator.add,
+    'min': min,
+    'max': max,
+    'mean': lambda a, b: [a[0] + b[0], a[1] + b[1]],
+    'first': lambda a, b: a,
+    'last': lambda a, b: b,
+    'list': operator.add,
+}
+
+_FINISH = {
+    'mean': lambda m: m[0] / m[1],
+}
+
+AGGREGATIONS = tuple(_INIT)
+
+Spec = Union[str, Tuple[str, Callable]]
+
+
+@functools.lru_cache(maxsize = None)
+def _aggregate_loop(kinds: Tuple[Tuple[str, bool], ...]) -> Callable:
+    """
+    Generate (and cache) a function that folds an iterator into ``groups``, a ``dict`` from keys to lists of aggregation states.
+    ``kinds`` holds the kind of each aggregation and whether it has its own value function (``v{i}``).
+    """
+    funcs = ''.join(f', v{i}' for i, (_, has_func) in enumerate(kinds) if has_func)
+    vals = [f'v{i}(x)' if has_func else 'x' for i, (_, has_func) in enumerate(kinds)]
+    init = ', '.join(_INIT[kind].format(val = val) for (kind, _), val in zip(kinds, vals))
+    update = [
+        f'            {line.format(i = i, val = val)}'
+        for i, ((kind, _), val) in enumerate(zip(kinds, vals))
+        for line in _UPDATE[kind]
+    ]
+
+    source = '\n'.join([
+        f'def aggregate(iterator, key, groups, max_groups, spill{funcs}):',
+        '    get = groups.get',
+        '    for x in iterator:',
+        '        k = key(x)',
+        '        s = get(k)',
+        '        if s is None:',
+        '            if len(groups) >= max_groups:',
+        '                spill()',
+        f'            groups[k] = [{init}]',
+        '        else:',
+        *(update or ['            pass']),
+    ])
+
+    namespace = {}
+    exec(source, namespace)
+    return namespace['aggregate']
+
+
+class _Spill:
+    """Hash-partitioned temporary files of partial group states, written whenever the groups in memory reach the budget."""
+
+    def __init__(self, groups: dict, partitions: int):
+        self.groups = groups
+        self.partitions = partitions
+        self.files = None
+
+    def __call__(self):
+        if self.files is None:
+            self.files = [tempfile.TemporaryFile() for _ in range(self.partitions)]
+
+        buckets = [[] for _ in range(self.partitions)]
+        for item in self.groups.items():
+            buckets[hash(item[0]) % self.partitions].append(item)
+
+        for bucket, f in zip(buckets, self.files):
+            if bucket:
+                pickle.dump(bucket, f, protocol = pickle.HIGHEST_PROTOCOL)
+
+        self.groups.clear()
+
+    def merged(self, merges: List[Callable]) -> Iterator[Dict[Hashable, list]]:
+        """Yield the merged states of each partition in turn, so that only one partition's groups are in memory at once."""
+        for f in self.files:
+            with f:
+                f.seek(0)
+                merged = {}
+                while True:
+                    try:
+                        bucket = pickle.load(f)
+                    except EOFError:
+                        break
+
+                    for k, state in bucket:
+                        existing = merged.get(k)
+                        if existing is None:
+                            merged[k] = state
+                        else:
+                            merged[k] = [merge(a, b) for merge, a, b in zip(merges, existing, state)]
+
+                yield merged
+
+
+def _identity(x):
+    return x
+
+
+class GroupBy:
+    """
+    The elements of an ``Iter``, grouped by ``key(element)`` (or by the elements themselves), as returned by :meth:`Iter.group_by`.
+    Aggregations run in a single generated loop over the elements, with one ``dict`` lookup per element.
+
+    If ``max_groups`` is given and more groups than that are in memory at once, the partial aggregates are spilled to temporary files,
+    split into ``partitions`` by the hash of their keys, and each partition is merged separately at the end.
+    Use :meth:`agg_iter` to get the results one partition at a time instead of all at once.
+    """
+
+    def __init__(self, iterable: Iterable, key: Optional[Callable[[Any], Hashable]] = None, max_groups: Optional[int] = None, partitions: int = PARTITIONS):
+        if max_groups is not None and max_groups <= 0:
+            raise Panic(f'max_groups must be positive, but was {max_groups}')
+
+        self._iterable = iterable
+        self.key = key if key is not None else _identity
+        self.max_groups = max_groups
+        self.partitions = partitions
+
+    def _groups(self, kinds: List[str], funcs: List[Optional[Callable]]) -> Iterator[Tuple[Hashable, list]]:
+        loop = _aggregate_loop(tuple((kind, func is not None) for kind, func in zip(kinds, funcs)))
+
+        groups = {}
+        spill = _Spill(groups, self.partitions)
+        max_groups = self.max_groups if self.max_groups is not None else float('inf')
+        loop(iter(self._iterable), self.key, groups, max_groups, spill, *(func for func in funcs if func is not None))
+
+        if spill.files is None:
+            yield from groups.items()
+            return
+
+        spill()
+        for partition in spill.merged([_MERGE[kind] for kind in kinds]):
+            yield from partition.items()
+
+    def agg_iter(self, **aggs: Spec) -> 'Iter':
+        """
+        Like :meth:`agg`, but return an :class:`Iter` of ``(key, results)`` pairs instead of a ``HashMap``,
+        which (when spilling) only needs one partition's groups in memory at a time.
+        """
+        from .iter import Iter
+
+        if not aggs:
+            raise Panic('no aggregations given')
+
+        names, kinds, funcs = [], [], []
+        for name, spec in aggs.items():
+            kind, func = (spec, None) if isinstance(spec, str) else spec
+            if kind not in _INIT:
+                raise Panic(f'unknown aggregation {kind!r} (expected one of {", ".join(AGGREGATIONS)})')
+
+            names.append(name)
+            kinds.append(kind)
+            funcs.append(func)
+
+        finishes = [_FINISH.get(kind, _identity) for kind in kinds]
+
+        def results():
+            for k, state in self._groups(kinds, funcs):
+                yield k, {name: finish(s) for name, finish, s in zip(names, finishes, state)}
+
+        return Iter(results())
+
+    def agg(self, **aggs: Spec) -> HashMap:
+        """
+        Aggregate each group, returning a ``HashMap`` from each key to a ``dict`` of the named results.
+        Each aggregation is one of ``'count'``, ``'sum'``, ``'min'``, ``'max'``, ``'mean'``, ``'first'``, ``'last'`` or ``'list'``,
+        applied to the elements themselves, or a ``(aggregation, func)`` pair to aggregate ``func(element)`` instead.
+        For example, ``orders.group_by(lambda o: o.customer).agg(n = 'count', total = ('sum', lambda o: o.amount))``.
+        """
+        return HashMap(self.agg_iter(**aggs))
+
+    def collect(self, collection_type: Type[Collection] = list) -> HashMap:
+        """Return a ``HashMap`` from each key to a collection (of type ``collection_type``) of the elements in its group, in their original order."""
+        groups = self._groups(['list'], [None])
+        if collection_type is list:
+            return HashMap((k, state[0]) for k, state in groups)
+        return HashMap((k, collection_type(state[0])) for k, state in groups)
@@ -1,19 +1,183 @@
-from typing import Hashable, Any
-
-import collections
+from typing import Hashable, Any, Callable, Iterable, Mapping, Tuple, Union
+import itertools
+import operator
+import os
 
+from .exceptions import Panic
 from .option import Option, Some, Nun
+from .arrays import OptionArray
+from .jsonview import KeyPath, load_json, compile_path
+
+_MISSING = object()
+_get = dict.get
+_pop = dict.pop
+_contains = dict.__contains__
+
 
+class HashMap(dict):
+    """
+    A ``dict`` whose lookups return ``Option``s: ``Some(value)`` if the key is present, ``Nun`` if it isn't.
+    Lookups go straight to the underlying ``dict`` with a sentinel default, so a miss never raises (and catches) a ``KeyError``.
+    """
 
-class HashMap(collections.UserDict):
-    def __getitem__(self, item: Hashable) -> Option:
-        try:
-            return Some(super().__getitem__(item))
-        except KeyError:
+    __slots__ = ()
+
+    def __getitem__(self, key: Hashable) -> Option:
+        value = _get(self, key, _MISSING)
+        if value is _MISSING:
             return Nun()
+        return Some(value)
 
     def get(self, key: Hashable) -> Option:
-        return super().get(key)
+        """Return ``Some(value)`` if ``key`` is present, and ``Nun`` if it isn't (the same as indexing)."""
+        value = _get(self, key, _MISSING)
+        if value is _MISSING:
+            return Nun()
+        return Some(value)
 
     def insert(self, key: Hashable, item: Any):
-        self.__setitem__(key, item)
+        self[key] = item
+
+    @staticmethod
+    def from_json(source: Union[str, os.PathLike, bytes]) -> Any:
+        """
+        Parse a JSON document from a file path or from ``bytes``, returning a lazy :class:`JsonView` of it (or a :class:`JsonArray`, if it is an array),
+        which has the same ``Option``-returning lookups as a ``HashMap`` but only wraps nested objects when they are accessed.
+        """
+        return load_json(source)
+
+    @staticmethod
+    def path(path: str) -> KeyPath:
+        """
+        Compile a path like ``"a.b[3].c"`` into a :class:`KeyPath`, which can be called on a ``HashMap``, a :class:`JsonView`, or plain nested ``dict``s and ``list``s
+        to get ``Some(value)``, or ``Nun`` if any step is missing. Compile the path once and reuse it for many lookups.
+        """
+        return compile_path(path)
+
+    def remove(self, key: Hashable) -> Option:
+        """Remove ``key``, returning ``Some(value)`` if it was present, and ``Nun`` if it wasn't."""
+        value = self.pop(key, _MISSING)
+        if value is _MISSING:
+            return Nun()
+        return Some(value)
+
+    def get_many(self, keys: Iterable[Hashable]) -> OptionArray:
+        """
+        Look up every key in ``keys`` at once, returning an :class:`OptionArray` with one element per key (``Nun`` for missing keys).
+        The found-mask and the values are each built by a single C-level pass over the keys, without creating an ``Option`` per key.
+        """
+        if not isinstance(keys, (list, tuple)):
+            keys = list(keys)
+
+        mask = bytearray(map(_contains, itertools.repeat(self), keys))
+        values = list(map(_get, itertools.repeat(self), keys))
+
+        return OptionArray.from_columns(values, mask)
+
+    def insert_many(self, keys: Iterable[Hashable], values: Iterable[Any]):
+        """Insert each key in ``keys`` with the corresponding value from ``values``. ``keys`` and ``values`` must have the same length."""
+        if not isinstance(keys, (list, tuple)):
+            keys = list(keys)
+        if not isinstance(values, (list, tuple)):
+            values = list(values)
+
+        if len(keys) != len(values):
+            raise Panic(f'got {len(keys)} keys, but {len(values)} values')
+
+        dict.update(self, zip(keys, values))
+
+    def extend(self, pairs: Union[Mapping, Iterable[Tuple[Hashable, Any]]]):
+        """Insert every ``(key, value)`` pair from ``pairs`` (which may be a mapping, an :class:`Iter`, or any iterable of pairs) in one C-level pass."""
+        dict.update(self, pairs)
+
+    def remove_many(self, keys: Iterable[Hashable]) -> OptionArray:
+        """Remove every key in ``keys``, returning an :class:`OptionArray` of the removed values (``Nun`` for keys that weren't present)."""
+        removed = list(map(_pop, itertools.repeat(self), keys, itertools.repeat(_MISSING)))
+        mask = bytearray(map(operator.is_not, removed, itertools.repeat(_MISSING)))
+
+        return OptionArray.from_columns([v if m else None for v, m in zip(removed, mask)], mask)
+
+    def retain(self, pred: Callable[[Hashable, Any], bool]):
+        """Remove every ``(key, value)`` pair for which ``pred(key, value)`` is false."""
+        for key in [key for key, value in self.items() if not pred(key, value)]:
+            dict.__delitem__(self, key)
+
+    def entry(self, key: Hashable) -> 'Entry':
+        """Return the :class:`Entry` for ``key``, for in-place manipulation."""
+        return Entry(self, key)
+
+    def copy(self) -> 'HashMap':
+        return self.__class__(self)
+
+    @classmethod
+    def fromkeys(cls, keys: Iterable[Hashable], value: Any = None) -> 'HashMap':
+        return cls(zip(keys, itertools.repeat(value)))
+
+    # the union operators are defined here (rather than inherited) so that they return a HashMap, and so that they exist before Python 3.9
+
+    def __or__(self, other: Mapping) -> 'HashMap':
+        if not isinstance(other, dict):
+            return NotImplemented
+        new = self.copy()
+        dict.update(new, other)
+        return new
+
+    def __ror__(self, other: Mapping) -> 'HashMap':
+        if not isinstance(other, dict):
+            return NotImplemented
+        new = self.__class__(other)
+        dict.update(new, self)
+        return new
+
+    def __ior__(self, other: Union[Mapping, Iterable[Tuple[Hashable, Any]]]) -> 'HashMap':
+        dict.update(self, other)
+        return self
+
+
+class Entry:
+    """
+    A view into a single key of a :class:`HashMap`, which may or may not be present, for read-modify-write updates (like Rust's ``Entry``).
+    For example, to count things: ``counts.entry(thing).and_modify(lambda n: n + 1).or_insert(1)``.
+    """
+
+    __slots__ = ('_map', '_key')
+
+    def __init__(self, map: HashMap, key: Hashable):
+        self._map = map
+        self._key = key
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._key!r})'
+
+    def key(self) -> Hashable:
+        """Return the key of the ``Entry``."""
+        return self._key
+
+    def is_occupied(self) -> bool:
+        """Return ``True`` if the key is present in the ``HashMap``."""
+        return self._key in self._map
+
+    def or_insert(self, default: Any) -> Any:
+        """If the key is present, return its value. Otherwise, insert ``default`` and return it."""
+        return self._map.setdefault(self._key, default)
+
+    def or_insert_with(self, func: Callable[[], Any]) -> Any:
+        """If the key is present, return its value. Otherwise, insert ``func()`` and return it. ``func`` is only called if the key is missing."""
+        value = _get(self._map, self._key, _MISSING)
+        if value is _MISSING:
+            value = func()
+            self._map[self._key] = value
+
+        return value
+
+    def or_default(self, default_type: Callable[[], Any] = int) -> Any:
+        """If the key is present, return its value. Otherwise, insert ``default_type()`` (``0``, unless otherwise specified) and return it."""
+        return self.or_insert_with(default_type)
+
+    def and_modify(self, func: Callable[[Any], Any]) -> 'Entry':
+        """If the key is present, replace its value with ``func(value)``. Returns the ``Entry``, so that it can be followed by e.g. :meth:`Entry.or_insert`."""
+        value = _get(self._map, self._key, _MISSING)
+        if value is not _MISSING:
+            self._map[self._key] = func(value)
+
+        return self
@@ -0,0 +1,237 @@
+from typing import Any, Iterable, Iterator, Mapping, Tuple, Union
+import array
+
+from . import numeric
+from .option import Option, Some, Nun
+from .arrays import OptionArray
+
+_FIBONACCI = 0x9E3779B97F4A7C15  # 2 ** 64 / golden ratio
+_MASK64 = (1 << 64) - 1
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+MAX_LOAD = 0.7
+
+
+class IntHashMap:
+    """
+    A map from 64-bit ``int`` keys to 64-bit ``int`` values, stored unboxed in ``array.array`` buffers instead of as Python objects.
+    Like a :class:`HashMap`, indexing returns ``Some(value)`` or ``Nun``.
+
+    It is an open-addressing table with linear probing: the home slot of a key is its Fibonacci hash (the top bits of ``key * 2 ** 64 / golden ratio``),
+    and removals shift the following entries back instead of leaving tombstones, so a lookup stops at the first empty slot.
+    :meth:`get_many` probes a whole array of keys at once with NumPy, if it is installed.
+    """
+
+    value_typecode = 'q'
+
+    __slots__ = ('_keys', '_values', '_used', '_count', '_bits')
+
+    def __init__(self, items: Union[Mapping, Iterable[Tuple[int, Any]]] = (), capacity: int = 8):
+        bits = 3
+        while (1 << bits) * MAX_LOAD < capacity:
+            bits += 1
+        self._allocate(bits)
+
+        for key, value in items.items() if isinstance(items, Mapping) else items:
+            self[key] = value
+
+    def _allocate(self, bits: int):
+        size = 1 << bits
+        self._bits = bits
+        self._keys = array.array('q', bytes(8 * size))
+        self._values = array.array(self.value_typecode, bytes(8 * size))
+        self._used = bytearray(size)
+        self._count = 0
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({dict(self.items())})'
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def capacity(self) -> int:
+        """The number of slots in the table."""
+        return len(self._used)
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the table's buffers, in bytes."""
+        return len(self._used) * 17
+
+    def _home(self, key: int) -> int:
+        return ((key & _MASK64) * _FIBONACCI & _MASK64) >> (64 - self._bits)
+
+    def _slot(self, key: int) -> int:
+        """The slot that holds ``key``, or ``-1`` if it isn't present."""
+        if not isinstance(key, int):
+            return -1
+
+        keys, used = self._keys, self._used
+        mask = len(used) - 1
+        slot = self._home(key)
+        while used[slot]:
+            if keys[slot] == key:
+                return slot
+            slot = (slot + 1) & mask
+        return -1
+
+    def __contains__(self, key: int) -> bool:
+        return self._slot(key) >= 0
+
+    def __getitem__(self, key: int) -> Option:
+        slot = self._slot(key)
+        if slot < 0:
+            return Nun()
+        return Some(self._values[slot])
+
+    def get(self, key: int) -> Option:
+        """Return ``Some(value)`` if ``key`` is present, and ``Nun`` if it isn't (the same as indexing)."""
+        return self[key]
+
+    def __setitem__(self, key: int, value):
+        if not isinstance(key, int):
+            raise TypeError(f'{self.__class__.__name__} keys must be ints, but got {key!r}')
+        if not _INT64_MIN <= key <= _INT64_MAX:
+            raise OverflowError(f'{self.__class__.__name__} keys must fit in 64 bits, but got {key}')
+
+        if (self._count + 1) > len(self._used) * MAX_LOAD:
+            self._grow()
+
+        keys, used = self._keys, self._used
+        mask = len(used) - 1
+        slot = self._home(key)
+        while used[slot]:
+            if keys[slot] == key:
+                self._values[slot] = value
+                return
+            slot = (slot + 1) & mask
+
+        self._values[slot] = value  # first, so that a value of the wrong type doesn't leave a half-inserted key
+        keys[slot] = key
+        used[slot] = 1
+        self._count += 1
+
+    def insert(self, key: int, value):
+        self[key] = value
+
+    def insert_many(self, keys: Iterable[int], values: Iterable):
+        """Insert each key in ``keys`` with the corresponding value from ``values``."""
+        for key, value in zip(keys, values):
+            self[key] = value
+
+    def _grow(self):
+        old_keys, old_values, old_used = self._keys, self._values, self._used
+        self._allocate(self._bits + 1)
+        for key, value, used in zip(old_keys, old_values, old_used):
+            if used:
+                self[key] = value
+
+    def remove(self, key: int) -> Option:
+        """Remove ``key``, returning ``Some(value)`` if it was present, and ``Nun`` if it wasn't."""
+        slot = self._slot(key)
+        if slot < 0:
+            return Nun()
+
+        keys, values, used = self._keys, self._values, self._used
+        removed = values[slot]
+        mask = len(used) - 1
+
+        # backward-shift deletion: move later entries of the probe sequence into the hole, unless that would put them before their home slot
+        hole = slot
+        probe = slot
+        while True:
+            probe = (probe + 1) & mask
+            if not used[probe]:
+                break
+
+            home = self._home(keys[probe])
+            if hole <= probe:
+                stays = hole < home <= probe
+            else:
+                stays = home > hole or home <= probe
+            if stays:
+                continue
+
+            keys[hole] = keys[probe]
+            values[hole] = values[probe]
+            hole = probe
+
+        used[hole] = 0
+        self._count -= 1
+        return Some(removed)
+
+    def __iter__(self) -> Iterator[int]:
+        return (key for key, used in zip(self._keys, self._used) if used)
+
+    def keys(self) -> Iterator[int]:
+        return iter(self)
+
+    def values(self) -> Iterator:
+        return (value for value, used in zip(self._values, self._used) if used)
+
+    def items(self) -> Iterator[Tuple[int, Any]]:
+        return ((key, value) for key, value, used in zip(self._keys, self._values, self._used) if used)
+
+    def get_many(self, keys: Iterable[int]) -> OptionArray:
+        """
+        Look up every key in ``keys`` (a sequence or NumPy array of ints), returning an :class:`OptionArray` with one element per key.
+        With NumPy, every key is probed at once (one vectorized step per probe distance), the values are a NumPy array,
+        and the value under a ``Nun`` is ``0``. Without NumPy, or if the keys aren't all ints, the keys are looked up one at a time,
+        so every key gets the same answer as indexing would give.
+        """
+        if not numeric.available():
+            return self._get_many_one_at_a_time(keys)
+
+        np = numeric.np
+        if not numeric.is_ndarray(keys):
+            keys = list(keys)
+        queries = np.asarray(keys)
+        if queries.ndim != 1 or queries.dtype.kind not in 'biu':
+            # floats, strs, objects... are looked up one at a time, like indexing does, rather than being truncated to some other int key
+            return self._get_many_one_at_a_time(keys.tolist() if numeric.is_ndarray(keys) else keys)
+
+        # uint64 keys that don't fit in an int64 can't be present, and mustn't wrap around to a negative key that is
+        in_range = queries <= _INT64_MAX if queries.dtype.kind == 'u' else np.ones(len(queries), dtype = bool)
+        queries = np.where(in_range, queries, 0).astype(np.int64)
+        table_keys = np.frombuffer(self._keys, dtype = np.int64)
+        table_values = np.frombuffer(self._values, dtype = np.int64 if self.value_typecode == 'q' else np.float64)
+        table_used = np.frombuffer(self._used, dtype = np.uint8).view(bool)
+        mask = np.uint64(len(self._used) - 1)
+
+        with np.errstate(over = 'ignore'):
+            slots = (queries.astype(np.uint64) * np.uint64(_FIBONACCI)) >> np.uint64(64 - self._bits)
+
+        found_slots = np.full(len(queries), -1, dtype = np.int64)
+        active = np.flatnonzero(in_range)
+        while len(active):
+            s = slots[active].astype(np.intp)
+            occupied = table_used[s]
+            hit = occupied & (table_keys[s] == queries[active])
+            found_slots[active[hit]] = s[hit]
+
+            still_probing = occupied & ~hit
+            active = active[still_probing]
+            slots[active] = (slots[active] + np.uint64(1)) & mask
+
+        found = found_slots >= 0
+        values = np.where(found, table_values[np.where(found, found_slots, 0)], 0)
+
+        return OptionArray.from_columns(values, bytearray(found.astype(np.uint8).tobytes()))
+
+    def _get_many_one_at_a_time(self, keys: Iterable[int]) -> OptionArray:
+        values, mask = [], bytearray()
+        for key in keys:
+            slot = self._slot(key)
+            values.append(self._values[slot] if slot >= 0 else 0)
+            mask.append(slot >= 0)
+        return OptionArray.from_columns(values, mask)
+
+
+class IntFloatHashMap(IntHashMap):
+    """Like :class:`IntHashMap`, but the values are stored as 64-bit ``float``s."""
+
+    value_typecode = 'd'
+
+    __slots__ = ()
@@ -1,25 +1,208 @@
 from typing import Iterable, Callable, Generic, TypeVar, Tuple, Optional, Iterator, Union, List, Any, Type, Collection
+import collections
 import functools
+import heapq
 import itertools
 import operator
 
+from .exceptions import Panic
 from .option import Option, Some, Nun
+from .result import Result, Ok, Err
+from .report import ErrorReport
+from .hashmap import HashMap
+from .group import GroupBy
+from .sort import external_sort
+from . import par, numeric
 
 _iter = iter
 
 T = TypeVar('T')
 U = TypeVar('U')
 
+_FAILED = object()
+
+# Stages that can be fused into a single generated loop, and the source line(s) each contributes to the loop body.
+# Each stage reads the current element from ``x`` and its function from ``f{i}``.
+_FUSABLE_STAGES = {
+    'map': [
+        'x = f{i}(x)',
+    ],
+    'star_map': [
+        'x = f{i}(*x)',
+    ],
+    'filter': [
+        'if not f{i}(x):',
+        '    continue',
+    ],
+    'filter_map': [
+        'o = f{i}(x)',
+        'if not o.is_some():',
+        '    continue',
+        'x = o.unwrap()',
+    ],
+}
+
+# A single map, star_map, or filter is fastest as the builtin itself; longer runs are faster as one generated loop.
+_NATIVE_STAGES = {
+    'map': lambda iterator, func: map(func, iterator),
+    'star_map': lambda iterator, func: itertools.starmap(func, iterator),
+    'filter': lambda iterator, func: filter(func, iterator),
+}
+
+
+@functools.lru_cache(maxsize = None)
+def _fused_loop(kinds: Tuple[str, ...]) -> Callable:
+    """Generate (and cache) a generator function that runs the given kinds of stages in a single loop."""
+    funcs = ', '.join(f'f{i}' for i in range(len(kinds)))
+    body = [
+        f'        {line.format(i = i)}'
+        for i, kind in enumerate(kinds)
+        for line in _FUSABLE_STAGES[kind]
+    ]
+    source = '\n'.join([
+        f'def fused(iterator, {funcs}):',
+        '    for x in iterator:',
+        *body,
+        '        yield x',
+    ])
+
+    namespace = {}
+    exec(source, namespace)
+    return namespace['fused']
+
+
+def _flatten_ok(results: Iterable[Result]) -> Iterator[Result]:
+    for r in results:
+        if r.is_ok():
+            yield from map(Ok, r.unwrap())
+        else:
+            yield r
+
+
+def _compile(source: Iterator, stages: Tuple[Tuple[str, Callable], ...]) -> Iterator:
+    """Compile a plan of fusable stages on top of ``source`` into a single native iterator."""
+    if not stages:
+        return source
+
+    if len(stages) == 1:
+        kind, func = stages[0]
+        if kind in _NATIVE_STAGES:
+            return _NATIVE_STAGES[kind](source, func)
+
+    kinds, funcs = zip(*stages)
+    return _fused_loop(kinds)(source, *funcs)
+
+
+def _inner_join(left: Iterable, key: Callable, lookup: Callable) -> Iterator[Tuple]:
+    for x in left:
+        matches = lookup(key(x))
+        if matches is not None:
+            for y in matches:
+                yield x, y
+
+
+def _left_join(left: Iterable, key: Callable, lookup: Callable) -> Iterator[Tuple]:
+    for x in left:
+        matches = lookup(key(x))
+        if matches is None:
+            yield x, Nun()
+        else:
+            for y in matches:
+                yield x, Some(y)
+
+
+def _anti_join(left: Iterable, key: Callable, lookup: Callable) -> Iterator:
+    for x in left:
+        if lookup(key(x)) is None:
+            yield x
+
+
+_JOINS = {
+    'inner': _inner_join,
+    'left': _left_join,
+    'anti': _anti_join,
+}
+
+
+def _sorted_groups(iterable: Iterable, key: Callable, side: str) -> Iterator[Tuple[Any, Iterator]]:
+    """Like :func:`itertools.groupby`, but raises a :class:`Panic` if the keys aren't in ascending order."""
+    previous = _FAILED
+    for k, group in itertools.groupby(iterable, key):
+        if previous is not _FAILED and k < previous:
+            raise Panic(f'{side} side of merge_join is not sorted: {previous!r} is followed by {k!r}')
+        previous = k
+        yield k, group
+
+
+def _merge_join(left: Iterable, right: Iterable, left_key: Callable, right_key: Callable, how: str) -> Iterator:
+    rights = _sorted_groups(right, right_key, 'right')
+    r = next(rights, None)
+
+    for k, group in _sorted_groups(left, left_key, 'left'):
+        while r is not None and r[0] < k:
+            r = next(rights, None)
+
+        if r is not None and r[0] == k:
+            matches = list(r[1])
+            r = next(rights, None)
+            if how == 'inner':
+                for x in group:
+                    for y in matches:
+                        yield x, y
+            elif how == 'left':
+                for x in group:
+                    for y in matches:
+                        yield x, Some(y)
+        elif how == 'left':
+            for x in group:
+                yield x, Nun()
+        elif how == 'anti':
+            yield from group
+
 
 class Iter(Generic[T]):
+    """
+    An ``Iter`` records its chain of ``map``/``star_map``/``filter``/``filter_map`` stages as a lazy plan.
+    The plan is compiled into a single native iterator (with adjacent stages fused into one loop) the first time the ``Iter`` is iterated,
+    so elements never pass through intermediate ``Iter.__next__`` calls.
+    Other combinators build directly on the compiled iterator of the ``Iter`` they are called on.
+    """
+
     def __init__(self, iter: Union[Iterable[T], Iterator[T]]):
-        self.iterator = _iter(iter)
+        self._source = _iter(iter)
+        self._stages = ()
+        self._iterator = None
+
+    @property
+    def iterator(self) -> Iterator[T]:
+        """The native iterator that this ``Iter``'s plan compiles to."""
+        if self._iterator is None:
+            self._iterator = _compile(self._source, self._stages)
+            self._source = self._stages = None
+
+        return self._iterator
 
     def __iter__(self):
-        return self
+        return self.iterator
 
     def __next__(self):
-        return next(self.iterator)
+        iterator = self._iterator
+        if iterator is None:
+            iterator = self.iterator
+
+        return next(iterator)
+
+    def _then(self, kind: str, func: Callable) -> 'Iter':
+        """Return a new ``Iter`` whose plan is this ``Iter``'s plan plus one more fusable stage."""
+        # built through the constructor, so that subclasses with their own __init__ get their state set up
+        if self._iterator is None:
+            new = self.__class__(self._source)
+            new._stages = self._stages + ((kind, func),)
+        else:
+            new = self.__class__(self._iterator)
+            new._stages = ((kind, func),)
+
+        return new
 
     # CONSTRUCTORS
 
@@ -81,22 +264,24 @@ class Iter(Generic[T]):
 
     def map(self, func: Callable[[T], U]) -> 'Iter[U]':
         """Return a new ``Iter`` with each element mapped under the function ``func``."""
-        return self.__class__(map(func, self))
+        return self._then('map', func)
 
     def star_map(self, func: Callable[[Any], U]) -> 'Iter[U]':
         """
         Return a new ``Iter`` with each element mapped under the function ``func``.
         Each element is unpacked into the function's arguments.
         """
-        return self.__class__(itertools.starmap(func, self))
+        return self._then('star_map', func)
 
     def filter(self, func: Callable[[T], bool]) -> 'Iter[T]':
         """Return a new ``Iter`` containing only elements that ``func(element)`` is true for."""
-        return self.__class__(filter(func, self))
+        if func is None:
+            func = operator.truth
+        return self._then('filter', func)
 
     def filter_map(self, func: Callable[[T], Option[U]]) -> 'Iter[U]':
         """Return a new ``Iter`` containing the values of ``func(element)`` if ``func(element)`` is :class:`Some` and skipping it otherwise."""
-        return self.map(func).filter(lambda x: x.is_some()).map(lambda x: x.unwrap())
+        return self._then('filter_map', func)
 
     def compress(self, selectors: Iterable[bool]) -> 'Iter[T]':
         """Return a new ``Iter`` containing only the elements where ``selector`` has a ``True``-like value at that index."""
@@ -134,11 +319,18 @@ class Iter(Generic[T]):
         """Return a new ``Iter`` which repeats the elements of the ``Iter`` cyclically., forever."""
         return self.__class__(itertools.cycle(self))
 
-    def sorted(self, key = None, reversed = False):
+    def sorted(self, key = None, reversed = False, max_in_memory: Optional[int] = None, pool: Optional[par.Pool] = None, workers: Optional[int] = None):
         """
         Return a new ``Iter`` containing the elements of the ``Iter`` in sorted order.
         ``key`` and ``reversed`` have the same meaning as in :function:`sorted`.
+
+        If ``max_in_memory`` is given, the sort is external: the elements are sorted in runs of ``max_in_memory``,
+        which are pickled to temporary files and lazily merged back together (:meth:`Iter.merge`), so the whole ``Iter`` never has to fit in memory.
+        The runs are sorted in a ``'thread'`` or ``'process'`` pool (or an existing ``Executor``) if ``pool`` is given,
+        in which case up to one run per worker is in memory at once. Either way, the sort is stable.
         """
+        if max_in_memory is not None:
+            return self.__class__(external_sort(self, key, reversed, max_in_memory, pool, workers))
         return Iter(sorted(self, key = key, reverse = reversed))
 
     # METHODS THAT COLLAPSE THE ITERATOR, RETURNING SINGLE VALUES
@@ -154,30 +346,55 @@ class Iter(Generic[T]):
         """
         return any(self)
 
-    def max(self, key = None):
-        """Return the maximum value in the ``Iter``, possibly using a ``key`` function."""
+    def max(self, key = None, vectorize: bool = False):
+        """
+        Return the maximum value in the ``Iter``, possibly using a ``key`` function.
+        If ``vectorize`` is ``True`` (and there is no ``key``), the ``Iter`` is pulled into NumPy arrays in chunks and reduced with vectorized kernels, if NumPy is installed.
+        """
         if key is None:
+            if vectorize and numeric.available():
+                return numeric.max(self)
             return max(self)
         return max(self, key = key)
 
-    def min(self, key = None):
-        """Return the minimum value in the ``Iter``, possibly using a ``key`` function."""
+    def min(self, key = None, vectorize: bool = False):
+        """
+        Return the minimum value in the ``Iter``, possibly using a ``key`` function.
+        ``vectorize`` has the same meaning as in :meth:`Iter.max`.
+        """
         if key is None:
+            if vectorize and numeric.available():
+                return numeric.min(self)
             return min(self)
         return min(self, key = key)
 
-    def sum(self, start: Optional[T] = None) -> T:
-        """Return the sum of the elements in the ``Iter``, possibly using a ``start`` value."""
+    def sum(self, start: Optional[T] = None, vectorize: bool = False) -> T:
+        """
+        Return the sum of the elements in the ``Iter``, possibly using a ``start`` value.
+        ``vectorize`` has the same meaning as in :meth:`Iter.max`.
+        """
+        if vectorize and numeric.available():
+            return numeric.sum(self, 0 if start is None else start)
         if start is None:
             return sum(self)
         return sum(self, start)
 
-    def mul(self, initial: U = 1) -> U:
-        """Fold the ``Iter`` via pairwise multiplication."""
+    def mul(self, initial: U = 1, vectorize: bool = False) -> U:
+        """
+        Fold the ``Iter`` via pairwise multiplication.
+        ``vectorize`` has the same meaning as in :meth:`Iter.max`.
+        """
+        if vectorize and numeric.available():
+            return numeric.mul(self, initial)
         return self.reduce(operator.mul, initial = initial)
 
-    def dot(self, other):
-        """Return the dot product of two ``Iter``s (sum of elementwise product)."""
+    def dot(self, other, vectorize: bool = False):
+        """
+        Return the dot product of two ``Iter``s (sum of elementwise product).
+        ``vectorize`` has the same meaning as in :meth:`Iter.max`.
+        """
+        if vectorize and numeric.available():
+            return numeric.dot(self, other)
         return sum(map(operator.mul, self, other))
 
     def __matmul__(self, other):
@@ -252,3 +469,231 @@ class Iter(Generic[T]):
         """Call a function on each element of the ``Iter``, unpacking each element into the function's arguments as a tuple."""
         for t in self:
             func(*t)
+
+    # GROUPING METHODS
+
+    def counts(self, key: Optional[Callable[[T], Any]] = None, max_groups: Optional[int] = None) -> HashMap:
+        """
+        Return a ``HashMap`` from each element (or each ``key(element)``) to the number of times it appears in the ``Iter``.
+        This counts in C (via ``collections.Counter``), unless ``max_groups`` is given, in which case it spills to disk like :meth:`Iter.group_by`.
+        """
+        if max_groups is None:
+            return HashMap(collections.Counter(self if key is None else map(key, self)))
+        return HashMap((k, a['count']) for k, a in self.group_by(key, max_groups = max_groups).agg_iter(count = 'count'))
+
+    def group_by(self, key: Optional[Callable[[T], Any]] = None, max_groups: Optional[int] = None) -> GroupBy:
+        """
+        Group the elements of the ``Iter`` by ``key(element)`` (or by the elements themselves), returning a :class:`GroupBy`,
+        which can aggregate each group (``.agg(total = 'sum', n = 'count')``) or collect them (``.collect(list)``) into a ``HashMap``.
+        If ``max_groups`` is given, at most that many groups are kept in memory while aggregating; the rest are spilled to disk and merged at the end.
+        """
+        return GroupBy(self, key, max_groups = max_groups)
+
+    # JOIN METHODS
+
+    def hash_join(self, other: Iterable[U], left_key: Callable[[T], Any], right_key: Optional[Callable[[U], Any]] = None, how: str = 'inner') -> 'Iter':
+        """
+        Join this ``Iter`` with ``other`` on ``left_key(element) == right_key(other element)`` (``right_key`` defaults to ``left_key``).
+        ``other`` is loaded into a ``HashMap`` from keys to lists of its elements, and this ``Iter`` is streamed past it,
+        so ``other`` should be the smaller side.
+
+        * ``how = 'inner'`` yields ``(element, other element)`` for every matching pair.
+        * ``how = 'left'`` yields ``(element, Some(other element))`` for every matching pair, and ``(element, Nun)`` for elements with no match.
+        * ``how = 'anti'`` yields the elements with no match.
+        """
+        join = _JOINS.get(how)
+        if join is None:
+            raise Panic(f'unknown join {how!r} (expected one of {", ".join(_JOINS)})')
+
+        table = HashMap()
+        for r in other:
+            table.setdefault((right_key or left_key)(r), []).append(r)
+
+        return self.__class__(join(self, left_key, functools.partial(dict.get, table)))
+
+    def merge_join(self, other: Iterable[U], left_key: Callable[[T], Any], right_key: Optional[Callable[[U], Any]] = None, how: str = 'inner') -> 'Iter':
+        """
+        Like :meth:`Iter.hash_join`, but for inputs that are both already sorted by their keys (in ascending order).
+        Both sides are streamed together, and only the elements of ``other`` with the current key are held in memory.
+        If either side turns out not to be sorted, this raises a :class:`Panic`.
+        """
+        if how not in _JOINS:
+            raise Panic(f'unknown join {how!r} (expected one of {", ".join(_JOINS)})')
+
+        return self.__class__(_merge_join(self, other, left_key, right_key or left_key, how))
+
+    def merge(self, *iters: Iterable, key: Optional[Callable[[T], Any]] = None, reversed: bool = False) -> 'Iter':
+        """
+        Merge this ``Iter`` and the other ``iters``, which must each already be sorted, into a single sorted ``Iter``, using a heap (:func:`heapq.merge`).
+        Only one element from each input is held at a time. ``key`` and ``reversed`` have the same meaning as in :meth:`Iter.sorted`.
+        """
+        return self.__class__(heapq.merge(self, *iters, key = key, reverse = reversed))
+
+    # METHODS FOR ITERS OF RESULTS AND OPTIONS
+
+    def filter_ok(self, func: Callable[[T], bool]) -> 'Iter[Result]':
+        """Return a new ``Iter`` of ``Result``s containing every ``Err``, but only the ``Ok``s where ``func(value)`` is true."""
+        return self.filter(lambda r: r.is_err() or func(r.unwrap()))
+
+    def flatten_ok(self) -> 'Iter[Result]':
+        """Return a new ``Iter`` of ``Result``s where each ``Ok(iterable)`` is replaced by ``Ok(element)`` for each element of the iterable. ``Err``s are kept as they are."""
+        return self.__class__(_flatten_ok(self))
+
+    def _collect_until_failure(self, collection_type: Type[Collection]) -> Tuple[Collection, Union[Result, Option, None]]:
+        """Collect the values inside the ``Ok``s/``Some``s of the ``Iter`` up to the first ``Err``/``Nun``, which is also returned (or ``None``)."""
+        failure = []
+
+        def values():
+            for wrapped in self:
+                value = wrapped.unwrap_or(_FAILED)
+                if value is _FAILED:
+                    failure.append(wrapped)
+                    return
+                yield value
+
+        collection = collection_type(values())
+        return collection, failure[0] if failure else None
+
+    def collect_result(self, collection_type: Type[Collection] = list) -> Result[Collection, Exception]:
+        """
+        Collect the values of an ``Iter`` of ``Result``s into ``Ok(collection)``, where the collection has type ``collection_type``.
+        If there is an ``Err``, return it instead, without pulling any more elements from the ``Iter``.
+        """
+        collection, failure = self._collect_until_failure(collection_type)
+        if failure is not None:
+            return failure
+        return Ok(collection)
+
+    def collect_option(self, collection_type: Type[Collection] = list) -> Option[Collection]:
+        """
+        Collect the values of an ``Iter`` of ``Option``s into ``Some(collection)``, where the collection has type ``collection_type``.
+        If there is a ``Nun``, return it instead, without pulling any more elements from the ``Iter``.
+        """
+        collection, failure = self._collect_until_failure(collection_type)
+        if failure is not None:
+            return failure
+        return Some(collection)
+
+    def try_fold(self, initial: U, func: Callable[[U, T], Union[Result, Option]]) -> Union[Result, Option]:
+        """
+        Fold the ``Iter`` like :meth:`Iter.reduce`, except that ``func(accumulated, element)`` returns an ``Ok``/``Some`` of the new accumulated value.
+        If ``func`` returns an ``Err``/``Nun``, return it immediately, without pulling any more elements from the ``Iter``.
+        Otherwise, return ``Ok(accumulated)`` (or ``Some(accumulated)``, if ``func`` returns ``Option``s).
+        """
+        acc = initial
+        r = None
+        for element in self:
+            r = func(acc, element)
+            acc = r.unwrap_or(_FAILED)
+            if acc is _FAILED:
+                return r
+
+        if isinstance(r, Option):
+            return Some(acc)
+        return Ok(acc)
+
+    def try_for_each(self, func: Callable[[T], Union[Result, Option, None]]) -> Union[Result, Option]:
+        """
+        Call a function on each element of the ``Iter``, stopping as soon as it returns an ``Err`` or ``Nun``, which is returned.
+        Otherwise, return ``Ok(None)``.
+        """
+        for element in self:
+            r = func(element)
+            if r is not None and r.unwrap_or(_FAILED) is _FAILED:
+                return r
+
+        return Ok(None)
+
+    def collect_errors(self, samples: int = 3, template: Optional[Callable[[Exception], Any]] = None) -> Tuple['Iter', ErrorReport]:
+        """
+        Split an ``Iter`` of ``Result``s into a new ``Iter`` of the values inside the ``Ok``s and an :class:`ErrorReport` that summarizes the ``Err``s,
+        keeping only counts, first and last positions, and a few ``samples`` per kind of error, instead of every ``Err``.
+        The report fills in as the new ``Iter`` is consumed.
+        ``samples`` and ``template`` have the same meaning as for :class:`ErrorReport`.
+        """
+        report = ErrorReport(samples = samples, template = template)
+        return self.__class__(report.watch(self)), report
+
+    def partition_results(self) -> Tuple[List[T], List[Exception]]:
+        """Divide an ``Iter`` of ``Result``s into a list of the values inside the ``Ok``s and a list of the exceptions inside the ``Err``s."""
+        oks = []
+        errs = []
+        for r in self:
+            value = r.unwrap_or(_FAILED)
+            if value is _FAILED:
+                errs.append(r.unwrap_err())
+            else:
+                oks.append(value)
+
+        return oks, errs
+
+    # PARALLEL METHODS
+
+    def par_map(
+        self,
+        func: Callable[[T], U],
+        pool: par.Pool = 'thread',
+        workers: Optional[int] = None,
+        ordered: bool = True,
+        chunk_size: int = 1,
+        max_in_flight: Optional[int] = None,
+    ) -> 'Iter[Result[U, Exception]]':
+        """
+        Return a new ``Iter`` of ``Ok(func(element))``, computed in a ``'thread'`` or ``'process'`` pool (or an existing ``Executor``).
+        If ``func`` raises, that element becomes an ``Err`` holding the exception.
+        Elements are sent to the workers ``chunk_size`` at a time, and at most ``max_in_flight`` chunks are outstanding at once,
+        so this is safe to use on infinite ``Iter``s.
+        If ``ordered`` is ``False``, results are yielded as soon as their chunk finishes instead of in the original order.
+        """
+        return self.__class__(par.run(par.map_chunk, func, self, pool, workers, ordered, chunk_size, max_in_flight))
+
+    def par_filter_map(
+        self,
+        func: Callable[[T], Option[U]],
+        pool: par.Pool = 'thread',
+        workers: Optional[int] = None,
+        ordered: bool = True,
+        chunk_size: int = 1,
+        max_in_flight: Optional[int] = None,
+    ) -> 'Iter[Result[U, Exception]]':
+        """Like :meth:`Iter.filter_map`, but computed in parallel like :meth:`Iter.par_map`. The kept values are wrapped in ``Ok``, and exceptions in ``Err``."""
+        return self.__class__(par.run(par.filter_map_chunk, func, self, pool, workers, ordered, chunk_size, max_in_flight))
+
+    def par_for_each(
+        self,
+        func: Callable[[T], None],
+        pool: par.Pool = 'thread',
+        workers: Optional[int] = None,
+        chunk_size: int = 1,
+        max_in_flight: Optional[int] = None,
+    ) -> List[Err]:
+        """Call a function on each element of the ``Iter`` in parallel, in no particular order. Returns the ``Err``s of any calls that raised."""
+        results = par.run(par.map_chunk, func, self, pool, workers, False, chunk_size, max_in_flight)
+        return [r for r in results if r.is_err()]
+
+    def par_reduce(
+        self,
+        func: Callable[[T, T], T],
+        initial: Optional[T] = None,
+        pool: par.Pool = 'thread',
+        workers: Optional[int] = None,
+        chunk_size: int = 1024,
+        max_in_flight: Optional[int] = None,
+    ) -> Result[T, Exception]:
+        """
+        Reduce each chunk of the ``Iter`` under ``func`` in parallel, then reduce the partial results in order, starting from ``initial`` if given.
+        ``func`` must be associative.
+        Returns ``Ok(reduction)``, or the first ``Err`` as soon as any reduction raises.
+        """
+        partials = []
+        for r in par.run(par.reduce_chunk, func, self, pool, workers, True, chunk_size, max_in_flight):
+            if r.is_err():
+                return r
+            partials.append(r.unwrap())
+
+        if initial is not None:
+            partials.insert(0, initial)
+        if not partials:
+            return Err(TypeError('par_reduce() of empty Iter with no initial value'))
+
+        return par.reduce_chunk(func, partials)[0]
@@ -0,0 +1,236 @@
+from typing import Any, Iterator, Tuple, Union
+import functools
+import json
+import os
+import re
+
+from .exceptions import Panic
+from .option import Option, Some, Nun
+
+_MISSING = object()
+
+
+def _wrap(value: Any) -> Any:
+    """Wrap plain JSON containers in views, and return anything else (including a ``HashMap``) as-is."""
+    t = type(value)
+    if t is dict:
+        return JsonView(value)
+    if t is list:
+        return JsonArray(value)
+    return value
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, (JsonView, JsonArray)):
+        return value.raw
+    return value
+
+
+def _unwrapped(value: Any) -> Any:
+    """Recursively convert a parsed JSON value into ``HashMap``s and ``list``s."""
+    from .hashmap import HashMap
+
+    if isinstance(value, dict):
+        return HashMap((k, _unwrapped(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return [_unwrapped(v) for v in value]
+    return value
+
+
+class JsonView:
+    """
+    A read-only view of a parsed JSON object, where indexing returns ``Some(value)`` or ``Nun``, like a :class:`HashMap`.
+    Nested objects and arrays are only wrapped in views (:class:`JsonView` and :class:`JsonArray`) when they are accessed,
+    so viewing a large document costs nothing up front. The underlying ``dict`` is available as ``raw``.
+    """
+
+    __slots__ = ('raw',)
+
+    def __init__(self, raw: dict):
+        self.raw = raw
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.raw!r})'
+
+    def __eq__(self, other):
+        return _unwrap(other) == self.raw
+
+    __hash__ = None
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.raw
+
+    def __getitem__(self, key: str) -> Option:
+        value = self.raw.get(key, _MISSING)
+        if value is _MISSING:
+            return Nun()
+        return Some(_wrap(value))
+
+    def get(self, key: str) -> Option:
+        """Return ``Some(value)`` if ``key`` is present, and ``Nun`` if it isn't (the same as indexing)."""
+        return self[key]
+
+    def keys(self) -> Iterator[str]:
+        return iter(self.raw)
+
+    def values(self) -> Iterator[Any]:
+        return map(_wrap, self.raw.values())
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return ((k, _wrap(v)) for k, v in self.raw.items())
+
+    def to_hashmap(self):
+        """Convert the whole object into nested ``HashMap``s (and ``list``s, for arrays)."""
+        return _unwrapped(self.raw)
+
+
+class JsonArray:
+    """
+    A read-only view of a parsed JSON array, where indexing returns ``Some(element)``, or ``Nun`` if the index is out of range.
+    Like :class:`JsonView`, nested containers are wrapped when they are accessed. The underlying ``list`` is available as ``raw``.
+    """
+
+    __slots__ = ('raw',)
+
+    def __init__(self, raw: list):
+        self.raw = raw
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.raw!r})'
+
+    def __eq__(self, other):
+        return _unwrap(other) == self.raw
+
+    __hash__ = None
+
+    def __len__(self):
+        return len(self.raw)
+
+    def __iter__(self) -> Iterator[Any]:
+        return map(_wrap, self.raw)
+
+    def __getitem__(self, idx: int) -> Option:
+        if not -len(self.raw) <= idx < len(self.raw):
+            return Nun()
+        return Some(_wrap(self.raw[idx]))
+
+    def get(self, idx: int) -> Option:
+        return self[idx]
+
+    def to_list(self) -> list:
+        """Convert the whole array into a ``list`` (with nested objects as ``HashMap``s)."""
+        return _unwrapped(self.raw)
+
+
+def load_json(source: Union[str, os.PathLike, bytes, bytearray]) -> Any:
+    """
+    Parse a JSON document from a file path (``str`` or path-like) or from ``bytes``,
+    returning a :class:`JsonView` for an object, a :class:`JsonArray` for an array, and the value itself for anything else.
+    """
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = json.loads(bytes(source))
+    else:
+        with open(source, 'rb') as f:
+            data = json.load(f)
+
+    return _wrap(data)
+
+
+_TOKEN = re.compile(r"""
+    (?P<dot>^|\.)(?P<name>[^.\[\]]+)     # .name (or name, at the start)
+  | \[(?P<index>-?\d+)\]                 # [3]
+  | \[(?P<quote>['"])(?P<key>.*?)(?P=quote)\]  # ["a.b"]
+""", re.VERBOSE)
+
+_KEY_STEP = """
+    if not _isinstance(value, _dict):
+        return _Nun()
+    value = _get(value, {key!r}, _MISSING)
+    if value is _MISSING:
+        return _Nun()
+"""
+
+_INDEX_STEP = """
+    if not _isinstance(value, _list) or not {low} <= {index} < _len(value):
+        return _Nun()
+    value = value[{index}]
+"""
+
+
+def _parse(path: str) -> Tuple[Union[str, int], ...]:
+    steps = []
+    position = 0
+    while position < len(path):
+        match = _TOKEN.match(path, position)
+        if match is None or (match.group('name') is not None and match.group('dot') == '' and position != 0):
+            raise Panic(f'could not parse path {path!r} at position {position}')
+
+        if match.group('name') is not None:
+            steps.append(match.group('name'))
+        elif match.group('index') is not None:
+            steps.append(int(match.group('index')))
+        else:
+            steps.append(match.group('key'))
+
+        position = match.end()
+
+    if not steps:
+        raise Panic('empty path')
+
+    return tuple(steps)
+
+
+class KeyPath:
+    """
+    A path into nested objects and arrays, like ``"a.b[3].c"`` or ``'users[0]["e-mail"]'``, that is parsed once and can then be looked up many times.
+    Calling it on a :class:`JsonView`, a :class:`HashMap`, or plain ``dict``s and ``list``s returns ``Some(value)``,
+    or ``Nun`` as soon as any step is missing (or is the wrong kind of container), without creating an ``Option`` for each step.
+    The lookup is compiled into a straight-line function with one block per step.
+    """
+
+    __slots__ = ('path', 'steps', '_lookup')
+
+    def __init__(self, path: str):
+        self.path = path
+        self.steps = _parse(path)
+
+        body = []
+        for step in self.steps:
+            if isinstance(step, int):
+                body.append(_INDEX_STEP.format(index = step, low = '-_len(value)' if step < 0 else '0'))
+            else:
+                body.append(_KEY_STEP.format(key = step))
+
+        source = 'def lookup(value):\n    value = _unwrap(value)\n' + ''.join(body) + '    return _Some(_wrap(value))\n'
+        namespace = {
+            '_isinstance': isinstance,
+            '_len': len,
+            '_dict': dict,
+            '_list': list,
+            '_get': dict.get,  # not the (Option-returning) HashMap.get
+            '_MISSING': _MISSING,
+            '_Some': Some,
+            '_Nun': Nun,
+            '_wrap': _wrap,
+            '_unwrap': _unwrap,
+        }
+        exec(source, namespace)
+        self._lookup = namespace['lookup']
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.path!r})'
+
+    def __call__(self, value: Any) -> Option:
+        return self._lookup(value)
+
+
+@functools.lru_cache(maxsize = 1024)
+def compile_path(path: str) -> KeyPath:
+    """Return the :class:`KeyPath` for ``path``, reusing it if the same path was compiled recently."""
+    return KeyPath(path)
@@ -0,0 +1,145 @@
+from typing import Any, Iterable, Iterator, Optional
+import builtins
+import functools
+import itertools
+import operator
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+CHUNK_SIZE = 65536
+
+
+def available() -> bool:
+    """Return ``True`` if NumPy can be imported."""
+    return np is not None
+
+
+def require():
+    if np is None:
+        raise ImportError('this operation requires numpy, which is not installed')
+
+
+def is_ndarray(obj: Any) -> bool:
+    return np is not None and isinstance(obj, np.ndarray)
+
+
+def _to_python(value):
+    """Convert NumPy scalars back into the equivalent Python scalars."""
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def chunks(iterable: Iterable, chunk_size: int = CHUNK_SIZE) -> Iterator['np.ndarray']:
+    """Pull ``iterable`` into contiguous arrays of (at most) ``chunk_size`` elements, with the dtype inferred per chunk."""
+    iterator = iter(iterable)
+    while True:
+        values = list(itertools.islice(iterator, chunk_size))
+        if not values:
+            return
+
+        chunk = np.asarray(values)
+        # ints beyond 64 bits (or mixed signed and unsigned 64-bit ints) are inferred as floats, which would round them, so keep them as Python objects instead
+        if chunk.dtype.kind == 'f' and np.abs(chunk).max() >= 2.0 ** 53 and builtins.any(type(v) is int for v in values):
+            chunk = np.asarray(values, dtype = object)
+        yield chunk
+
+
+# Vectorized reductions.
+# NumPy's fixed-width integers wrap around on overflow, unlike Python ints, so each integer chunk is checked against a bound on its result first,
+# and is reduced with Python ints instead if the result might not fit. The bound is kept well below ``2 ** 63`` so that the float rounding in it can't hide an overflow.
+
+_EXACT_BITS = 62
+
+
+def _is_int(chunk: 'np.ndarray') -> bool:
+    return chunk.dtype.kind in 'iu'
+
+
+def _magnitude(chunk: 'np.ndarray') -> float:
+    """The largest absolute value in the (integer) chunk, as a float (so that it can't overflow itself)."""
+    return float(np.abs(chunk.astype(np.float64)).max())
+
+
+def _chunk_sum(chunk: 'np.ndarray'):
+    if _is_int(chunk) and _magnitude(chunk) * len(chunk) >= 2.0 ** _EXACT_BITS:
+        return builtins.sum(chunk.tolist())
+    return _to_python(chunk.sum())
+
+
+def _chunk_prod(chunk: 'np.ndarray'):
+    if _is_int(chunk) and np.log2(np.maximum(np.abs(chunk.astype(np.float64)), 1)).sum() >= _EXACT_BITS:
+        return functools.reduce(operator.mul, chunk.tolist(), 1)
+    return _to_python(chunk.prod())
+
+
+def _chunk_dot(x: 'np.ndarray', y: 'np.ndarray'):
+    if _is_int(x) and _is_int(y) and _magnitude(x) * _magnitude(y) * len(x) >= 2.0 ** _EXACT_BITS:
+        return builtins.sum(map(operator.mul, x.tolist(), y.tolist()))
+    return _to_python(np.dot(x, y))
+
+
+def sum(iterable: Iterable, start = 0):
+    total = start
+    for chunk in chunks(iterable):
+        total = total + _chunk_sum(chunk)
+    return total
+
+
+def mul(iterable: Iterable, initial = 1):
+    total = initial
+    for chunk in chunks(iterable):
+        total = total * _chunk_prod(chunk)
+    return total
+
+
+def dot(a: Iterable, b: Iterable):
+    total = 0
+    for x, y in zip(chunks(a), chunks(b)):
+        n = builtins.min(len(x), len(y))
+        total = total + _chunk_dot(x[:n], y[:n])
+        if len(x) != len(y):  # one of the iterables ran out, and the rest of the other is lost just like with zip
+            break
+    return total
+
+
+def max(iterable: Iterable):
+    partials = [chunk.max() for chunk in chunks(iterable)]
+    if not partials:
+        raise ValueError('max() arg is an empty sequence')
+    return _to_python(builtins.max(partials))
+
+
+def min(iterable: Iterable):
+    partials = [chunk.min() for chunk in chunks(iterable)]
+    if not partials:
+        raise ValueError('min() arg is an empty sequence')
+    return _to_python(builtins.min(partials))
+
+
+def to_masked(values, mask: bytearray, dtype = None, fill = 0) -> 'np.ma.MaskedArray':
+    """Build a masked array from a values column and a validity mask (``1`` means valid), with ``fill`` at the invalid positions."""
+    require()
+    valid = np.frombuffer(mask, dtype = np.bool_)
+    if is_ndarray(values):
+        data = np.asarray(values, dtype = dtype)
+        data = np.where(valid, data, fill).astype(data.dtype, copy = False)  # a copy, so the caller's array keeps its values
+    else:
+        data = np.asarray([v if m else fill for v, m in zip(values, mask)], dtype = dtype)
+    return np.ma.MaskedArray(data, mask = ~valid)
+
+
+def from_masked(masked) -> tuple:
+    """Split a (masked) array into a values array and a validity mask (``1`` means valid), without copying the values."""
+    require()
+    values = np.ma.getdata(masked)
+    mask = bytearray((~np.ma.getmaskarray(masked)).tobytes())
+    return values, mask
+
+
+def where(mask: bytearray, values: 'np.ndarray', default: Any) -> 'np.ndarray':
+    """Return an array with the values where ``mask`` is valid and ``default`` elsewhere."""
+    return np.where(np.frombuffer(mask, dtype = np.bool_), values, default)
@@ -1,4 +1,3 @@
-import abc
 from typing import Callable, TypeVar, Generic
 
 from .exceptions import Panic
@@ -8,8 +7,17 @@ T = TypeVar('T')
 U = TypeVar('U')
 
 
-class Option(abc.ABC, Generic[T]):
+class Option(Generic[T]):
+    """
+    ``Option``s are plain slotted objects (no per-instance ``__dict__``), so they are cheap to create.
+    ``Some`` and ``Nun`` share the same layout, which lets a ``Nun`` turn itself into a ``Some`` in-place (see :meth:`Option.get_or_insert`).
+    """
+
+    __slots__ = ('_val',)
+
     def __init__(self, value: T):
+        if type(self) is Option:
+            raise TypeError('Option is abstract; use Some(value) or Nun() instead')
         self._val = value
 
     def __hash__(self):
@@ -21,88 +29,78 @@ class Option(abc.ABC, Generic[T]):
     def __eq__(self, other):
         return self.__class__ == other.__class__ and self._val == other._val
 
-    @abc.abstractmethod
     def is_some(self) -> bool:
         """Returns ``True`` if the ``Option`` is a ``Some``, and ``False`` if it is a ``Nun``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def is_nun(self) -> bool:
         """Returns ``True`` if the ``Option`` is a ``Nun``, and ``False`` if it is a ``Some``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def unwrap(self) -> T:
         """If the ``Option`` is a ``Some``, return its value. If it is a ``Nun``, this raises a :class:`Panic`."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def unwrap_or(self, default: T) -> T:
         """If the ``Option`` is a ``Some``, return its value. If it is a ``Nun``, return ``default`` instead."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def unwrap_or_else(self, func: Callable[[], T]) -> T:
         """If the ``Option`` is a ``Some``, return its value. If it is a ``Nun``, return ``func()``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def map(self, func: Callable[[T], U]) -> 'Option[U]':
         """If the ``Option`` is a ``Some``, return ``Some(func(value))``. If it is a ``Nun``, return ``Nun()``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def map_or(self, func: Callable[[T], U], default: U) -> U:
         """If the ``Option`` is a ``Some``, return ``func(value)``. If it is a ``Nun``, return ``default``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def map_or_else(self, func: Callable[[T], U], default_func: Callable[[], U]) -> U:
         """If the ``Option`` is a ``Some``, return ``func(value)``. If it is a ``Nun``, return ``default_func()``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def ok_or(self, err: Exception) -> 'result.Result[T]':
         """If the ``Option`` is a ``Some``, return ``Ok(value)``. If it is a ``Nun``, return ``Err(err)``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def ok_or_else(self, err_func: Callable[[], Exception]) -> 'result.Result[T]':
         """If the ``Option`` is a ``Some``, return ``Ok(value)``. If it is a ``Nun``, return ``Err(err())``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def and_(self, other: 'Option[U]') -> 'Option[U]':
         """If either ``Option`` is ``Nun``, return ``Nun``. If both are ``Some``, return ``other``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def and_then(self, func: Callable[[], U]) -> 'Option[U]':
         """If the ``Option`` is a ``Some``, return ``func()``. If it is a ``Nun``, return ``Nun()``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def or_(self, other: 'Option[T]') -> 'Option[T]':
         """If the ``Option`` is a ``Some``, return it. If it is a ``Nun``, return ``other``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def or_else(self, func: Callable[[], T]) -> 'Option[T]':
         """If the ``Option`` is a ``Some``, return it. If it is a ``Nun``, return ``func()``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def get_or_insert(self, value: T) -> T:
         """If the ``Option`` is a ``Some``, return its value. If it is a ``Nun``, convert this ``Option`` into ``Some(value)`` and return the value."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def get_or_insert_with(self, func: Callable[[], T]) -> T:
         """If the ``Option`` is a ``Some``, return its value. If it is a ``Nun``, convert this ``Option`` into ``Some(func())`` and return the value."""
         raise NotImplementedError
 
+    def pipe(self, *funcs: Callable) -> 'Option':
+        """Equivalent to ``.map(funcs[0]).map(funcs[1])...``, but without creating an intermediate ``Some`` at each step. A ``Nun`` is returned as-is."""
+        raise NotImplementedError
+
 
 class Some(Option):
+    __slots__ = ()
+
     def __iter__(self):
         yield self._val
 
@@ -156,10 +154,19 @@ class Some(Option):
     def get_or_insert_with(self, func: Callable[[], T]) -> T:
         return self._val
 
+    def pipe(self, *funcs: Callable) -> 'Option':
+        value = self._val
+        for func in funcs:
+            value = func(value)
+
+        return Some(value)
+
 
 class Nun(Option):
+    __slots__ = ()
+
     def __init__(self):
-        super().__init__(None)
+        self._val = None
 
     def __repr__(self):
         return 'Nun'
@@ -222,3 +229,6 @@ class Nun(Option):
         self._val = func()
 
         return self._val
+
+    def pipe(self, *funcs: Callable) -> 'Option':
+        return self
@@ -0,0 +1,122 @@
+from typing import Callable, Iterable, Iterator, List, Optional, Union, Any
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import itertools
+import os
+
+from .result import Result, Ok, Err
+
+POOLS = {
+    'thread': concurrent.futures.ThreadPoolExecutor,
+    'process': concurrent.futures.ProcessPoolExecutor,
+}
+
+Pool = Union[str, concurrent.futures.Executor]
+
+
+# Chunk runners execute inside the workers, so they must be module-level (picklable) and must not raise.
+
+def map_chunk(func: Callable, chunk: List) -> List[Result]:
+    """Return ``Ok(func(element))`` or ``Err(exception)`` for each element of the chunk."""
+    out = []
+    for element in chunk:
+        try:
+            out.append(Ok(func(element)))
+        except Exception as e:
+            out.append(Err(e))
+
+    return out
+
+
+def filter_map_chunk(func: Callable, chunk: List) -> List[Result]:
+    """Return ``Ok(value)`` for each element where ``func(element)`` is ``Some(value)``, and ``Err(exception)`` where it raised."""
+    out = []
+    for element in chunk:
+        try:
+            option = func(element)
+        except Exception as e:
+            out.append(Err(e))
+            continue
+
+        if option.is_some():
+            out.append(Ok(option.unwrap()))
+
+    return out
+
+
+def reduce_chunk(func: Callable, chunk: List) -> List[Result]:
+    """Return ``[Ok(reduction)]`` of the chunk under ``func``, or ``[Err(exception)]``."""
+    try:
+        return [Ok(functools.reduce(func, chunk))]
+    except Exception as e:
+        return [Err(e)]
+
+
+@contextlib.contextmanager
+def executor(pool: Pool, workers: Optional[int]):
+    """Yield an executor for ``pool``, which is either the name of a pool type or an existing executor (which is not shut down afterwards)."""
+    if isinstance(pool, concurrent.futures.Executor):
+        yield pool
+        return
+
+    try:
+        pool_type = POOLS[pool]
+    except KeyError:
+        raise ValueError(f'pool must be one of {sorted(POOLS)} or an Executor, but was {pool!r}')
+
+    with pool_type(max_workers = workers) as ex:
+        yield ex
+
+
+def run(
+    runner: Callable[[Callable, List], List[Result]],
+    func: Callable,
+    iterable: Iterable,
+    pool: Pool = 'thread',
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    chunk_size: int = 1,
+    max_in_flight: Optional[int] = None,
+) -> Iterator[Result]:
+    """
+    Lazily yield the ``Result``s of ``runner(func, chunk)`` over successive chunks of ``iterable``, computed in a pool.
+    At most ``max_in_flight`` chunks (by default, twice the number of workers) are pulled from ``iterable`` and not yet yielded at any time,
+    so infinite sources are never materialized.
+    If a whole chunk fails (for example, because a process pool could not pickle ``func``), a single ``Err`` is yielded for it.
+    """
+    if chunk_size < 1:
+        raise ValueError(f'chunk_size must be at least 1, but was {chunk_size}')
+    if max_in_flight is None:
+        max_in_flight = 2 * (workers or os.cpu_count() or 1)
+
+    iterator = iter(iterable)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+
+    with executor(pool, workers) as ex:
+        submit = functools.partial(ex.submit, runner, func)
+        pending = collections.deque(map(submit, itertools.islice(chunks, max_in_flight)))
+        try:
+            if ordered:
+                while pending:
+                    future = pending.popleft()
+                    pending.extend(map(submit, itertools.islice(chunks, 1)))
+                    yield from _outcome(future)
+            else:
+                while pending:
+                    done, not_done = concurrent.futures.wait(pending, return_when = concurrent.futures.FIRST_COMPLETED)
+                    pending = collections.deque(not_done)
+                    pending.extend(map(submit, itertools.islice(chunks, len(done))))
+                    for future in done:
+                        yield from _outcome(future)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _outcome(future: concurrent.futures.Future) -> List[Result]:
+    try:
+        return future.result()
+    except Exception as e:
+        return [Err(e)]
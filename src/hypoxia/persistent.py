@@ -0,0 +1,410 @@
+from typing import Any, Hashable, Iterable, Iterator, Mapping, Tuple, Union
+
+from .exceptions import Panic
+from .option import Option, Some, Nun
+from .hashmap import HashMap
+from .iter import Iter
+
+_MISSING = object()
+
+_BITS = 5
+_WIDTH_MASK = (1 << _BITS) - 1
+_HASH_MASK = (1 << 64) - 1
+_MAX_SHIFT = 64  # after this many bits, keys with equal hashes go into a collision node
+
+_popcount = getattr(int, 'bit_count', None) or (lambda x: bin(x).count('1'))
+
+
+def _hash(key: Hashable) -> int:
+    return hash(key) & _HASH_MASK
+
+
+class _BitmapNode:
+    """
+    A node of the trie: ``items`` holds one entry for each set bit of ``bitmap``, in bit order.
+    An entry is either a ``(key, value)`` tuple or a child node.
+    ``edit`` is the token of the transient that owns the node (and may mutate it in place), if any.
+    """
+
+    __slots__ = ('bitmap', 'items', 'edit')
+
+    def __init__(self, bitmap: int, items: list, edit):
+        self.bitmap = bitmap
+        self.items = items
+        self.edit = edit
+
+
+class _CollisionNode:
+    """A node holding ``(key, value)`` tuples whose keys all have the same (full) hash."""
+
+    __slots__ = ('hash', 'items', 'edit')
+
+    def __init__(self, hash: int, items: list, edit):
+        self.hash = hash
+        self.items = items
+        self.edit = edit
+
+
+_EMPTY = _BitmapNode(0, [], None)
+
+
+def _find(node, h: int, key: Hashable):
+    shift = 0
+    while True:
+        if type(node) is _CollisionNode:
+            for k, v in node.items:
+                if k is key or k == key:
+                    return v
+            return _MISSING
+
+        bit = 1 << ((h >> shift) & _WIDTH_MASK)
+        if not node.bitmap & bit:
+            return _MISSING
+
+        item = node.items[_popcount(node.bitmap & (bit - 1))]
+        if type(item) is tuple:
+            k = item[0]
+            return item[1] if k is key or k == key else _MISSING
+
+        node = item
+        shift += _BITS
+
+
+def _editable(node, edit):
+    """Return ``node`` if the transient ``edit`` owns it, and a copy owned by ``edit`` otherwise."""
+    if edit is not None and node.edit is edit:
+        return node
+    if type(node) is _CollisionNode:
+        return _CollisionNode(node.hash, list(node.items), edit)
+    return _BitmapNode(node.bitmap, list(node.items), edit)
+
+
+def _merge_leaves(shift: int, leaf1: tuple, h1: int, leaf2: tuple, h2: int, edit):
+    if h1 == h2 or shift >= _MAX_SHIFT:
+        return _CollisionNode(h1, [leaf1, leaf2], edit)
+
+    idx1 = (h1 >> shift) & _WIDTH_MASK
+    idx2 = (h2 >> shift) & _WIDTH_MASK
+    if idx1 == idx2:
+        return _BitmapNode(1 << idx1, [_merge_leaves(shift + _BITS, leaf1, h1, leaf2, h2, edit)], edit)
+    if idx1 < idx2:
+        return _BitmapNode((1 << idx1) | (1 << idx2), [leaf1, leaf2], edit)
+    return _BitmapNode((1 << idx1) | (1 << idx2), [leaf2, leaf1], edit)
+
+
+def _assoc(node, edit, shift: int, h: int, key: Hashable, value: Any):
+    """Return the node with ``key`` set to ``value``, and whether ``key`` is new."""
+    if type(node) is _CollisionNode:
+        if h != node.hash:
+            # push the collision node one level down, under a bitmap node that can tell the hashes apart
+            wrapper = _BitmapNode(1 << ((node.hash >> shift) & _WIDTH_MASK), [node], edit)
+            return _assoc(wrapper, edit, shift, h, key, value)
+
+        for idx, (k, v) in enumerate(node.items):
+            if k is key or k == key:
+                if v is value:
+                    return node, False
+                node = _editable(node, edit)
+                node.items[idx] = (key, value)
+                return node, False
+
+        node = _editable(node, edit)
+        node.items.append((key, value))
+        return node, True
+
+    bit = 1 << ((h >> shift) & _WIDTH_MASK)
+    idx = _popcount(node.bitmap & (bit - 1))
+
+    if not node.bitmap & bit:
+        node = _editable(node, edit)
+        node.items.insert(idx, (key, value))
+        node.bitmap |= bit
+        return node, True
+
+    item = node.items[idx]
+    if type(item) is tuple:
+        k, v = item
+        if k is key or k == key:
+            if v is value:
+                return node, False
+            new, added = (key, value), False
+        else:
+            new, added = _merge_leaves(shift + _BITS, item, _hash(k), (key, value), h, edit), True
+    else:
+        new, added = _assoc(item, edit, shift + _BITS, h, key, value)
+        if new is item:
+            return node, added
+
+    node = _editable(node, edit)
+    node.items[idx] = new
+    return node, added
+
+
+def _dissoc(node, edit, shift: int, h: int, key: Hashable):
+    """
+    Return the node without ``key`` (which may be ``None`` if it is now empty, or a lone ``(key, value)`` tuple that the parent should hold directly),
+    and the removed value (or ``_MISSING``).
+    """
+    if type(node) is _CollisionNode:
+        for idx, (k, v) in enumerate(node.items):
+            if k is key or k == key:
+                if len(node.items) == 2:
+                    return node.items[1 - idx], v
+                node = _editable(node, edit)
+                del node.items[idx]
+                return node, v
+        return node, _MISSING
+
+    bit = 1 << ((h >> shift) & _WIDTH_MASK)
+    if not node.bitmap & bit:
+        return node, _MISSING
+
+    idx = _popcount(node.bitmap & (bit - 1))
+    item = node.items[idx]
+    if type(item) is tuple:
+        k, removed = item
+        if not (k is key or k == key):
+            return node, _MISSING
+        new = None
+    else:
+        new, removed = _dissoc(item, edit, shift + _BITS, h, key)
+        if removed is _MISSING:
+            return node, _MISSING
+
+    if new is None:
+        if len(node.items) == 1:
+            return None, removed
+        if shift > 0 and len(node.items) == 2 and type(node.items[1 - idx]) is tuple:
+            return node.items[1 - idx], removed
+
+        node = _editable(node, edit)
+        del node.items[idx]
+        node.bitmap &= ~bit
+        return node, removed
+
+    if shift > 0 and len(node.items) == 1 and type(new) is tuple:
+        return new, removed
+
+    node = _editable(node, edit)
+    node.items[idx] = new
+    return node, removed
+
+
+def _iter_items(item) -> Iterator[Tuple[Hashable, Any]]:
+    if type(item) is tuple:
+        yield item
+        return
+
+    for child in item.items:
+        if type(child) is tuple:
+            yield child
+        else:
+            yield from _iter_items(child)
+
+
+def _diff_pairs(old: dict, new: dict) -> Iterator[Tuple[Hashable, Option, Option]]:
+    for key, value in old.items():
+        other = new.get(key, _MISSING)
+        if other is _MISSING:
+            yield key, Some(value), Nun()
+        elif other is not value and other != value:
+            yield key, Some(value), Some(other)
+
+    for key, value in new.items():
+        if key not in old:
+            yield key, Nun(), Some(value)
+
+
+def _diff_nodes(old, new, shift: int) -> Iterator[Tuple[Hashable, Option, Option]]:
+    if old is new:
+        return
+
+    if type(old) is not _BitmapNode or type(new) is not _BitmapNode:
+        yield from _diff_pairs(dict(_iter_items(old)), dict(_iter_items(new)))
+        return
+
+    for position in range(1 << _BITS):
+        bit = 1 << position
+        old_item = old.items[_popcount(old.bitmap & (bit - 1))] if old.bitmap & bit else _MISSING
+        new_item = new.items[_popcount(new.bitmap & (bit - 1))] if new.bitmap & bit else _MISSING
+
+        if old_item is new_item:  # shared structure (or both missing)
+            continue
+        if old_item is _MISSING:
+            yield from ((k, Nun(), Some(v)) for k, v in _iter_items(new_item))
+        elif new_item is _MISSING:
+            yield from ((k, Some(v), Nun()) for k, v in _iter_items(old_item))
+        elif type(old_item) is _BitmapNode and type(new_item) is _BitmapNode:
+            yield from _diff_nodes(old_item, new_item, shift + _BITS)
+        else:
+            yield from _diff_pairs(dict(_iter_items(old_item)), dict(_iter_items(new_item)))
+
+
+class PersistentHashMap:
+    """
+    An immutable map (a hash array mapped trie), where :meth:`insert` and :meth:`remove` return new versions of the map
+    that share all but O(log n) of their structure with the old one, so keeping many versions around is cheap.
+    Like a :class:`HashMap`, indexing returns ``Some(value)`` or ``Nun``.
+    For many changes at once, use :meth:`transient` (or :meth:`update`), which mutates nodes in place until :meth:`TransientHashMap.persistent` is called.
+    :meth:`diff` compares two versions while skipping the structure they share.
+    """
+
+    __slots__ = ('_root', '_count')
+
+    def __init__(self, items: Union[Mapping, Iterable[Tuple[Hashable, Any]]] = ()):
+        self._root = _EMPTY
+        self._count = 0
+
+        if items:
+            t = self.transient()
+            t.extend(items)
+            self._root, self._count = t._root, t._count
+
+    @classmethod
+    def _make(cls, root, count: int) -> 'PersistentHashMap':
+        new = cls.__new__(cls)
+        new._root = root
+        new._count = count
+        return new
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({dict(self.items())})'
+
+    def __len__(self):
+        return self._count
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return (key for key, _ in _iter_items(self._root))
+
+    def __contains__(self, key: Hashable) -> bool:
+        return _find(self._root, _hash(key), key) is not _MISSING
+
+    def __eq__(self, other):
+        if not isinstance(other, PersistentHashMap):
+            return NotImplemented
+        if self._root is other._root:
+            return True
+        return self._count == other._count and next(iter(self.diff(other)), None) is None
+
+    __hash__ = None
+
+    def __getitem__(self, key: Hashable) -> Option:
+        value = _find(self._root, _hash(key), key)
+        if value is _MISSING:
+            return Nun()
+        return Some(value)
+
+    def get(self, key: Hashable) -> Option:
+        """Return ``Some(value)`` if ``key`` is present, and ``Nun`` if it isn't (the same as indexing)."""
+        return self[key]
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        return _iter_items(self._root)
+
+    def keys(self) -> Iterator[Hashable]:
+        return iter(self)
+
+    def values(self) -> Iterator[Any]:
+        return (value for _, value in _iter_items(self._root))
+
+    def insert(self, key: Hashable, value: Any) -> 'PersistentHashMap':
+        """Return a new version of the map with ``key`` set to ``value``."""
+        root, added = _assoc(self._root, None, 0, _hash(key), key, value)
+        if root is self._root:
+            return self
+        return self._make(root, self._count + added)
+
+    def remove(self, key: Hashable) -> 'PersistentHashMap':
+        """Return a new version of the map without ``key`` (or this version, if ``key`` isn't present)."""
+        root, removed = _dissoc(self._root, None, 0, _hash(key), key)
+        if removed is _MISSING:
+            return self
+        return self._make(root if root is not None else _EMPTY, self._count - 1)
+
+    def update(self, items: Union[Mapping, Iterable[Tuple[Hashable, Any]]]) -> 'PersistentHashMap':
+        """Return a new version of the map with every ``(key, value)`` pair from ``items`` inserted, using a transient."""
+        t = self.transient()
+        t.extend(items)
+        return t.persistent()
+
+    def transient(self) -> 'TransientHashMap':
+        """Return a mutable :class:`TransientHashMap` that starts out sharing all of its structure with this map. This map is unaffected by changes to it."""
+        return TransientHashMap(self._root, self._count)
+
+    def to_hashmap(self) -> HashMap:
+        return HashMap(self.items())
+
+    def diff(self, other: 'PersistentHashMap') -> Iter:
+        """
+        Return an :class:`Iter` of ``(key, old, new)`` triples for every key that differs between this map (old) and ``other`` (new),
+        where ``old`` and ``new`` are ``Some(value)``, or ``Nun`` if the key is missing from that map.
+        Subtrees that the two versions share are skipped without being looked at, so diffing two nearby versions is fast.
+        """
+        return Iter(_diff_nodes(self._root, other._root, 0))
+
+
+class TransientHashMap:
+    """
+    A mutable view of a :class:`PersistentHashMap`, for making many changes without creating a new version for each one.
+    Nodes that the transient has already copied are mutated in place.
+    :meth:`persistent` returns the result as a new ``PersistentHashMap``, after which the transient can't be used any more.
+    """
+
+    __slots__ = ('_root', '_count', '_edit')
+
+    def __init__(self, root, count: int):
+        self._root = root
+        self._count = count
+        self._edit = object()
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._count} entries)'
+
+    def _check(self):
+        if self._edit is None:
+            raise Panic('transient used after persistent() was called')
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, key: Hashable) -> bool:
+        return _find(self._root, _hash(key), key) is not _MISSING
+
+    def __getitem__(self, key: Hashable) -> Option:
+        value = _find(self._root, _hash(key), key)
+        if value is _MISSING:
+            return Nun()
+        return Some(value)
+
+    def get(self, key: Hashable) -> Option:
+        return self[key]
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self._check()
+        self._root, added = _assoc(self._root, self._edit, 0, _hash(key), key, value)
+        self._count += added
+
+    def insert(self, key: Hashable, value: Any):
+        self[key] = value
+
+    def extend(self, items: Union[Mapping, Iterable[Tuple[Hashable, Any]]]):
+        """Insert every ``(key, value)`` pair from ``items`` (which may also be a mapping)."""
+        for key, value in items.items() if isinstance(items, Mapping) else items:
+            self[key] = value
+
+    def remove(self, key: Hashable) -> Option:
+        """Remove ``key``, returning ``Some(value)`` if it was present, and ``Nun`` if it wasn't."""
+        self._check()
+        root, removed = _dissoc(self._root, self._edit, 0, _hash(key), key)
+        if removed is _MISSING:
+            return Nun()
+
+        self._root = root if root is not None else _EMPTY
+        self._count -= 1
+        return Some(removed)
+
+    def persistent(self) -> PersistentHashMap:
+        """Return the contents as a :class:`PersistentHashMap`, and invalidate the transient."""
+        self._check()
+        self._edit = None
+        return PersistentHashMap._make(self._root, self._count)
@@ -0,0 +1,135 @@
+from typing import Any, Callable, Dict, Tuple, Type, TypeVar, Union
+import functools
+import inspect
+
+from .option import Option
+from .result import Result, Ok, Err
+
+T = TypeVar('T')
+
+_FAILED = object()
+
+
+class _Propagate(BaseException):
+    """
+    Raised by :func:`try_` to carry an ``Err`` (or ``Nun``) out to the enclosing function decorated with :func:`returns_result`.
+    It is a ``BaseException`` so that ``except Exception`` blocks in between don't swallow it.
+    """
+
+    def __init__(self, wrapped: Union[Result, Option]):
+        super().__init__(f'try_ on {wrapped} outside of a function decorated with returns_result')
+        self.wrapped = wrapped
+
+
+def try_(wrapped: Union[Result[T, Exception], Option[T]]) -> T:
+    """
+    Rust's ``?`` operator: return the value inside an ``Ok`` or ``Some``.
+    If ``wrapped`` is an ``Err`` (or ``Nun``), immediately return it from the enclosing function decorated with :func:`returns_result` instead.
+    """
+    value = wrapped.unwrap_or(_FAILED)
+    if value is _FAILED:
+        raise _Propagate(wrapped)
+    return value
+
+
+_WRAPPER_TEMPLATE = """
+def make(_hypoxia_func, _hypoxia_catch, {defaults}):
+    {async_}def wrapper({params}):
+        try:
+            _hypoxia_value = {await_}_hypoxia_func({args})
+        except _hypoxia_Propagate as _hypoxia_p:
+            return _hypoxia_p.wrapped
+        except _hypoxia_catch as _hypoxia_e:
+            return _hypoxia_Err(_hypoxia_e)
+
+        if _hypoxia_isinstance(_hypoxia_value, _hypoxia_Result):
+            return _hypoxia_value
+        return _hypoxia_Ok(_hypoxia_value)
+
+    return wrapper
+"""
+
+
+def _forwarding(func: Callable) -> Tuple[str, str, Dict[str, Any]]:
+    """
+    Return the parameter list and argument list for a wrapper that forwards every argument to ``func`` explicitly,
+    plus the default values the parameter list refers to.
+    Spelling out the parameters avoids packing and unpacking ``*args`` and ``**kwargs`` on every call.
+    """
+    generic = '*args, **kwargs', '*args, **kwargs', {}
+    try:
+        # not following __wrapped__, since a decorator may have changed the parameters of the function it wraps
+        parameters = inspect.signature(func, follow_wrapped = False).parameters.values()
+    except (TypeError, ValueError):  # no signature available, e.g. for some builtins
+        return generic
+
+    if any(p.name.startswith('_hypoxia_') for p in parameters):  # they would collide with the names the wrapper uses itself
+        return generic
+
+    params, args, defaults = [], [], {}
+    keyword_only_marked = False
+    positional_only = [p for p in parameters if p.kind is p.POSITIONAL_ONLY]
+    for p in parameters:
+        param = p.name
+        if p.default is not p.empty:
+            defaults[f'_hypoxia_default_{p.name}'] = p.default
+            param += f' = _hypoxia_default_{p.name}'
+
+        if p.kind is p.VAR_POSITIONAL:
+            params.append(f'*{p.name}')
+            args.append(f'*{p.name}')
+            keyword_only_marked = True
+        elif p.kind is p.VAR_KEYWORD:
+            params.append(f'**{p.name}')
+            args.append(f'**{p.name}')
+        elif p.kind is p.KEYWORD_ONLY:
+            if not keyword_only_marked:
+                params.append('*')
+                keyword_only_marked = True
+            params.append(param)
+            args.append(f'{p.name} = {p.name}')
+        else:
+            params.append(param)
+            args.append(p.name)
+
+        if positional_only and p is positional_only[-1]:
+            params.append('/')
+
+    return ', '.join(params), ', '.join(args), defaults
+
+
+def returns_result(func: Callable = None, *, catch: Tuple[Type[Exception], ...] = (Exception,)):
+    """
+    A decorator that makes a function return ``Ok(return value)``, or ``Err(exception)`` if it raises one of the ``catch`` exception types.
+    If the function already returns a ``Result``, it is passed through unchanged.
+    Inside the function, :func:`try_` returns early with an ``Err``, like Rust's ``?``.
+    Coroutine functions produce coroutine functions.
+    Can be used bare (``@returns_result``) or with arguments (``@returns_result(catch = (OSError,))``).
+
+    The wrapper is generated with the same parameters as the function, so the success path costs about one extra call and the ``Ok``.
+    As with any function, calling it with arguments that don't match those parameters raises ``TypeError`` immediately.
+    """
+    if func is None:
+        return functools.partial(returns_result, catch = catch)
+
+    is_async = inspect.iscoroutinefunction(func)
+    params, args, defaults = _forwarding(func)
+    source = _WRAPPER_TEMPLATE.format(
+        defaults = ', '.join(defaults),
+        params = params,
+        args = args,
+        async_ = 'async ' if is_async else '',
+        await_ = 'await ' if is_async else '',
+    )
+
+    namespace = {
+        '_hypoxia_isinstance': isinstance,
+        '_hypoxia_Propagate': _Propagate,
+        '_hypoxia_Result': Result,
+        '_hypoxia_Ok': Ok,
+        '_hypoxia_Err': Err,
+    }
+    exec(source, namespace)
+    wrapper = namespace['make'](func, catch, **defaults)
+
+    return functools.wraps(func)(wrapper)
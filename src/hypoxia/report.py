@@ -0,0 +1,89 @@
+from typing import Callable, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from .result import Result, Err
+from .hashmap import HashMap
+
+T = TypeVar('T')
+
+_FAILED = object()
+
+
+class ErrorGroup:
+    """The running summary of one kind of ``Err`` in an :class:`ErrorReport`."""
+
+    __slots__ = ('count', 'first', 'last', 'samples')
+
+    def __init__(self, position: int):
+        self.count = 0
+        self.first = position
+        self.last = position
+        self.samples = []
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(count = {self.count}, first = {self.first}, last = {self.last}, samples = {self.samples})'
+
+
+class ErrorReport:
+    """
+    A summary of the ``Err``s in a stream of ``Result``s that doesn't keep every ``Err`` alive.
+    ``Err``s are grouped by the exception class and args (the same key that ``Err.__eq__`` and ``Err.__hash__`` use),
+    or by ``template(exception)`` if ``template`` is given (e.g., to group messages that differ only by an ID).
+    For each group, it keeps a count, the positions in the stream of the first and last ``Err``, and the first ``samples`` ``Err``s themselves.
+    """
+
+    def __init__(self, samples: int = 3, template: Optional[Callable[[Exception], Hashable]] = None):
+        self.samples = samples
+        self.template = template
+        self.total = 0
+        self._groups = {}
+
+    def __len__(self):
+        return self.total
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(total = {self.total}, groups = {len(self._groups)})'
+
+    def __str__(self):
+        lines = [f'{self.total} errors in {len(self._groups)} groups']
+        for key, group in self.most_common():
+            lines.append(f'  {group.count} x {key!r} (first at {group.first}, last at {group.last})')
+        return '\n'.join(lines)
+
+    @property
+    def groups(self) -> HashMap:
+        """A ``HashMap`` from group keys to :class:`ErrorGroup`s."""
+        return HashMap(self._groups)
+
+    @property
+    def counts(self) -> HashMap:
+        """A ``HashMap`` from group keys to how many ``Err``s were in the group."""
+        return HashMap((key, group.count) for key, group in self._groups.items())
+
+    def most_common(self, n: Optional[int] = None) -> List[Tuple[Hashable, ErrorGroup]]:
+        """Return the ``n`` largest groups (or all of them), largest first, as ``(key, group)`` pairs."""
+        groups = sorted(self._groups.items(), key = lambda item: item[1].count, reverse = True)
+        return groups if n is None else groups[:n]
+
+    def add(self, position: int, err: Err):
+        """Record an ``Err`` that was found at ``position`` in the stream."""
+        key = err._key() if self.template is None else self.template(err.unwrap_err())
+
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = ErrorGroup(position)
+
+        group.count += 1
+        group.last = position
+        if len(group.samples) < self.samples:
+            group.samples.append(err)
+
+        self.total += 1
+
+    def watch(self, results: Iterable[Result[T, Exception]]) -> Iterator[T]:
+        """Yield the values inside the ``Ok``s of ``results``, recording each ``Err`` in the report as it goes by."""
+        for position, r in enumerate(results):
+            value = r.unwrap_or(_FAILED)
+            if value is _FAILED:
+                self.add(position, r)
+            else:
+                yield value
@@ -1,5 +1,5 @@
-import abc
-from typing import Callable, TypeVar, Generic, Union
+from typing import Callable, TypeVar, Generic, Union, Optional, Tuple, Any
+import traceback
 
 from .exceptions import Panic
 from . import option
@@ -10,12 +10,17 @@ E = TypeVar('E')
 F = TypeVar('F')
 
 
-class Result(abc.ABC, Generic[T, E]):
+class Result(Generic[T, E]):
     """
     The value inside an ``Err`` must be something that counts as an instance of :class:`Exception`.
+    ``Result``s are plain slotted objects (no per-instance ``__dict__``), so they are cheap to create.
     """
 
+    __slots__ = ('_val',)
+
     def __init__(self, value: Union[T, E]):
+        if type(self) is Result:
+            raise TypeError('Result is abstract; use Ok(value) or Err(exception) instead')
         self._val = value
 
     def __hash__(self):
@@ -27,73 +32,65 @@ class Result(abc.ABC, Generic[T, E]):
     def __eq__(self, other):
         return self.__class__ == other.__class__ and self._val == other._val
 
-    @abc.abstractmethod
     def is_ok(self) -> bool:
         """Returns ``True`` if the ``Result`` is an ``Ok``, and ``False`` if it is an ``Err``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def is_err(self) -> bool:
         """Returns ``True`` if the ``Result`` is an ``Err``, and ``False`` if it is an ``Ok``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def ok(self) -> 'option.Option[T]':
         """Returns ``Some(value)`` if the ``Result`` is an ``Ok``, and ``Nun`` if it is an ``Err``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def err(self) -> 'option.Option[E]':
         """Returns ``Some(value)`` if the ``Result`` is an ``Err``, and ``Nun`` if it is an ``Err``."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def map(self, func: Callable[[T], U]) -> 'Result[U, E]':
         raise NotImplementedError
 
-    @abc.abstractmethod
     def map_err(self, func: Callable[[E], F]) -> 'Result[T, F]':
         raise NotImplementedError
 
-    @abc.abstractmethod
     def and_(self, result: 'Result[T, E]'):
         raise NotImplementedError
 
-    @abc.abstractmethod
     def and_then(self, func: Callable[[T], 'Result[U, E]']) -> 'Result[U, E]':
         raise NotImplementedError
 
-    @abc.abstractmethod
     def or_(self, result: 'Result[T, F]') -> 'Result[T, F]':
         raise NotImplementedError
 
-    @abc.abstractmethod
     def or_else(self, func: Callable[[E], 'Result[T, F]']) -> 'Result[T, F]':
         """If the ``Result`` is an ``Ok``, return its value. If it is a ``Err``, this raises a :class:`Panic`."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def unwrap(self) -> T:
         """If the ``Result`` is an ``Ok``, return its value. If it is a ``Err``, this raises a :class:`Panic`."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def unwrap_or(self, default: T) -> T:
         """If the ``Result`` is an ``Ok``, return its value. If it is a ``Err``, return ``default`` instead."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def unwrap_or_else(self, func: Callable[[E], T]) -> T:
         """If the ``Result`` is an ``Ok``, return its value. If it is a ``Err``, return ``func(value)`` instead."""
         raise NotImplementedError
 
-    @abc.abstractmethod
     def unwrap_err(self) -> E:
         """If the ``Result`` is an ``Err``, return its value. If it is a ``Ok``, this raises a :class:`Panic`."""
         raise NotImplementedError
 
+    def pipe(self, *funcs: Callable) -> 'Result':
+        """Equivalent to ``.map(funcs[0]).map(funcs[1])...``, but without creating an intermediate ``Ok`` at each step. An ``Err`` is returned as-is."""
+        raise NotImplementedError
+
 
 class Ok(Result):
+    __slots__ = ()
+
     def __iter__(self):
         yield self._val
 
@@ -139,19 +136,74 @@ class Ok(Result):
     def unwrap_err(self) -> E:
         raise Panic(f'unwrap_err on {self}')
 
+    def pipe(self, *funcs: Callable) -> 'Result':
+        value = self._val
+        for func in funcs:
+            value = func(value)
+
+        return Ok(value)
+
+
+def _compact_traceback(exception: BaseException) -> Optional[traceback.StackSummary]:
+    """
+    Strip the traceback from ``exception`` (and from the exceptions it was raised from or during), so that it no longer keeps frames alive.
+    Returns a summary of the stripped traceback (which holds only file names, line numbers, and function names), or ``None`` if there was no traceback.
+    """
+    tb = exception.__traceback__
+    summary = None if tb is None else traceback.StackSummary.extract(traceback.walk_tb(tb), lookup_lines = False)
+
+    seen = set()
+    while exception is not None and id(exception) not in seen:
+        seen.add(id(exception))
+        exception.__traceback__ = None
+        exception = exception.__cause__ or exception.__context__
+
+    return summary
+
 
 class Err(Result):
-    def __init__(self, value):
+    """
+    By default, the exception inside an ``Err`` keeps its traceback, which keeps every frame it passed through (and their locals) alive.
+    Pass ``keep_traceback = False``, or set ``Err.keep_tracebacks = False`` to change the default everywhere,
+    to replace the traceback with a compact summary (see :meth:`Err.traceback_summary`) instead.
+    """
+
+    __slots__ = ('_summary',)
+
+    keep_tracebacks = True
+
+    def __init__(self, value, keep_traceback: Optional[bool] = None):
         if not isinstance(value, Exception):
             raise Panic(f'Err value must be an exception, but was {value}')
 
-        super().__init__(value)
+        self._val = value
+        if keep_traceback is None:
+            keep_traceback = self.keep_tracebacks
+        self._summary = None if keep_traceback else _compact_traceback(value)
+
+    @classmethod
+    def lazy(cls, factory: Callable[..., Exception], *args) -> 'LazyErr':
+        """Return an ``Err`` whose exception is only built, as ``factory(*args)``, when something needs it. See :class:`LazyErr`."""
+        return LazyErr(factory, *args)
+
+    def _key(self) -> Tuple[type, tuple]:
+        return self._val.__class__, self._val.args
 
     def __eq__(self, other):
-        return self.__class__ == other.__class__ and self._val.__class__ == other._val.__class__ and self._val.args == other._val.args
+        return isinstance(other, Err) and self._key() == other._key()
 
     def __hash__(self):
-        return hash((self._val.__class__, self._val.args))
+        return hash(self._key())
+
+    def traceback_summary(self) -> 'option.Option[traceback.StackSummary]':
+        """Return ``Some(summary)`` of where the exception was raised (from the compacted summary or the live traceback), or ``Nun`` if it was never raised."""
+        if self._summary is not None:
+            return option.Some(self._summary)
+
+        tb = self._val.__traceback__
+        if tb is None:
+            return option.Nun()
+        return option.Some(traceback.StackSummary.extract(traceback.walk_tb(tb), lookup_lines = False))
 
     def __iter__(self):
         """This produces an empty iterator."""
@@ -199,3 +251,41 @@ class Err(Result):
 
     def unwrap_err(self) -> E:
         return self._val
+
+    def pipe(self, *funcs: Callable) -> 'Result':
+        return self
+
+
+class LazyErr(Err):
+    """
+    An ``Err`` whose exception is only built, as ``factory(*args)``, the first time something needs it (unwrapping, mapping, ``repr``, ...).
+    If ``factory`` is an exception class, comparing and hashing use ``factory`` and ``args`` directly, without building the exception
+    (assuming, as for the built-in exceptions, that ``args`` become the exception's ``args``).
+    Since the exception is never raised, it never carries a traceback.
+    """
+
+    __slots__ = ('_factory', '_args', '_exc')
+
+    def __init__(self, factory: Callable[..., Exception], *args: Any):
+        self._factory = factory
+        self._args = args
+        self._exc = None
+        self._summary = None
+
+    @property
+    def _val(self) -> Exception:
+        if self._exc is None:
+            exc = self._factory(*self._args)
+            if not isinstance(exc, Exception):
+                raise Panic(f'Err value must be an exception, but was {exc}')
+            self._exc = exc
+
+        return self._exc
+
+    def _key(self) -> Tuple[type, tuple]:
+        if self._exc is None and isinstance(self._factory, type):
+            return self._factory, self._args
+        return super()._key()
+
+    def __reduce__(self):
+        return Err, (self._val,)
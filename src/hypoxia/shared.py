@@ -0,0 +1,144 @@
+from typing import Any, Hashable, Iterable, Iterator, Mapping, Optional, Tuple, Union
+import os
+import tempfile
+import time
+
+from .option import Option
+from .arrays import OptionArray
+from .frozen import FrozenHashMap
+
+
+def _version(st: os.stat_result) -> Tuple[int, int, int]:
+    return st.st_dev, st.st_ino, st.st_mtime_ns
+
+
+def _umask() -> int:
+    # the only way to read the umask is to set it
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _open(path: str) -> Tuple[FrozenHashMap, Tuple[int, int, int]]:
+    """Map the file at ``path``, and return the mapping with the version of the very file that was mapped (even if ``path`` is replaced meanwhile)."""
+    with open(path, 'rb') as f:
+        return FrozenHashMap.load(f), _version(os.fstat(f.fileno()))
+
+
+class SharedHashMap:
+    """
+    A read-only map that any number of processes can use at once without each having its own copy.
+    The map is a :class:`FrozenHashMap` file that every process memory-maps,
+    so the operating system keeps one copy of its pages in memory, however many processes have it open.
+    Like a :class:`HashMap`, indexing returns ``Some(value)`` or ``Nun``.
+
+    :meth:`publish` replaces the file atomically (by writing a new file and renaming it over the old one),
+    so a process that has the old version mapped keeps using it, unchanged, until it calls :meth:`refresh`.
+    If ``check_interval`` is given, lookups call :meth:`refresh` themselves, at most once per ``check_interval`` seconds.
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], check_interval: Optional[float] = None):
+        self.path = os.fspath(path)
+        self.check_interval = check_interval
+
+        self._map, self._version = _open(self.path)
+        self._checked = time.monotonic()
+
+    @classmethod
+    def publish(cls, path: Union[str, os.PathLike], items: Union[Mapping, Iterable[Tuple[Hashable, Any]]], mode: Optional[int] = None):
+        """
+        Build a map from ``items`` (which may be a mapping or an :class:`Iter`) and atomically make it the current version at ``path``.
+        Processes attached to ``path`` see the new version once they :meth:`refresh`.
+        The file gets permissions ``mode`` (by default, ``0o666`` less the umask, like a file created with ``open``).
+        """
+        path = os.fspath(path)
+        directory = os.path.dirname(os.path.abspath(path))
+
+        fd, tmp = tempfile.mkstemp(dir = directory, prefix = '.' + os.path.basename(path), suffix = '.tmp')
+        try:
+            os.close(fd)
+            frozen = FrozenHashMap(items)
+            frozen.save(tmp)
+            frozen.close()
+
+            # mkstemp creates the file readable only by its owner, which would stop processes running as other users from attaching
+            os.chmod(tmp, mode if mode is not None else 0o666 & ~_umask())
+
+            with open(tmp, 'rb') as f:
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+        # the rename is only durable once the directory entry is on disk too
+        if os.name == 'posix':
+            fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.path!r}, {len(self)} entries)'
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def version(self) -> Tuple[int, int, int]:
+        """An identifier for the version of the file that is mapped (its device, inode and modification time)."""
+        return self._version
+
+    def refresh(self) -> bool:
+        """If a new version has been published since this one was mapped, map it instead. Returns ``True`` if the version changed."""
+        self._checked = time.monotonic()
+
+        if _version(os.stat(self.path)) == self._version:
+            return False
+
+        # the old mapping isn't closed explicitly, since another thread might be in the middle of a lookup;
+        # it is unmapped once nothing refers to it any more
+        self._map, self._version = _open(self.path)
+        return True
+
+    def _current(self) -> FrozenHashMap:
+        if self.check_interval is not None and time.monotonic() - self._checked >= self.check_interval:
+            self.refresh()
+        return self._map
+
+    def close(self):
+        self._map.close()
+
+    def __len__(self):
+        return len(self._current())
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._current()
+
+    def __getitem__(self, key: Hashable) -> Option:
+        return self._current()[key]
+
+    def get(self, key: Hashable) -> Option:
+        """Return ``Some(value)`` if ``key`` is present, and ``Nun`` if it isn't (the same as indexing)."""
+        return self._current()[key]
+
+    def get_many(self, keys: Iterable[Hashable]) -> OptionArray:
+        """Look up every key in ``keys``, returning an :class:`OptionArray` with one element per key (``Nun`` for missing keys)."""
+        return self._current().get_many(keys)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._current())
+
+    def keys(self) -> Iterator[Hashable]:
+        return iter(self)
+
+    def values(self) -> Iterator[Any]:
+        return self._current().values()
+
+    def items(self) -> Iterator[Tuple[Hashable, Any]]:
+        return self._current().items()
@@ -0,0 +1,114 @@
+from typing import Any, Callable, Iterable, Iterator, List, Optional
+import collections
+import functools
+import heapq
+import itertools
+import os
+import pickle
+import shutil
+import tempfile
+
+from . import par
+from .exceptions import Panic
+
+# Sorted runs are written to disk as a sequence of pickled batches of this many elements, so that reading one back holds only one batch in memory.
+BATCH_SIZE = 1024
+
+# The most runs that are merged at once. If there are more, consecutive runs are merged into longer runs first, to bound the number of open files.
+MERGE_FAN_IN = 128
+
+
+def _write_run(elements: Iterable, directory: str) -> str:
+    fd, path = tempfile.mkstemp(dir = directory, suffix = '.run')
+    with open(fd, 'wb') as f:
+        iterator = iter(elements)
+        for batch in iter(lambda: list(itertools.islice(iterator, BATCH_SIZE)), []):
+            pickle.dump(batch, f, protocol = pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _read_run(path: str) -> Iterator:
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                batch = pickle.load(f)
+            except EOFError:
+                break
+            yield from batch
+    os.unlink(path)
+
+
+# The run sorter executes inside the workers when there is a process pool, so it must be module-level (picklable).
+
+def sort_run(key: Optional[Callable], reversed: bool, directory: str, chunk: List) -> str:
+    """Sort ``chunk`` and write it to a new file in ``directory``, returning its path."""
+    chunk.sort(key = key, reverse = reversed)
+    return _write_run(chunk, directory)
+
+
+def _runs(iterable: Iterable, key: Optional[Callable], reversed: bool, directory: str, max_in_memory: int, pool: Optional[par.Pool], workers: Optional[int]) -> Iterator[str]:
+    """Yield the paths of the sorted runs of ``iterable``, in their original order."""
+    iterator = iter(iterable)
+    chunks = iter(lambda: list(itertools.islice(iterator, max_in_memory)), [])
+
+    if pool is None:
+        for chunk in chunks:
+            yield sort_run(key, reversed, directory, chunk)
+        return
+
+    with par.executor(pool, workers) as ex:
+        max_in_flight = workers or os.cpu_count() or 1
+        submit = functools.partial(ex.submit, sort_run, key, reversed, directory)
+        pending = collections.deque(map(submit, itertools.islice(chunks, max_in_flight)))
+        try:
+            while pending:
+                future = pending.popleft()
+                pending.extend(map(submit, itertools.islice(chunks, 1)))
+                yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def external_sort(
+    iterable: Iterable,
+    key: Optional[Callable[[Any], Any]] = None,
+    reversed: bool = False,
+    max_in_memory: int = 1_000_000,
+    pool: Optional[par.Pool] = None,
+    workers: Optional[int] = None,
+) -> Iterator:
+    """
+    Return an iterator over the elements of ``iterable`` in (stable) sorted order, holding at most ``max_in_memory`` elements per run in memory.
+    Nothing is read from ``iterable`` until the iterator is advanced. See :meth:`Iter.sorted`.
+    """
+    if max_in_memory < 1:
+        raise Panic(f'max_in_memory must be at least 1, but was {max_in_memory}')
+
+    return _external_sort(iterable, key, reversed, max_in_memory, pool, workers)
+
+
+def _external_sort(iterable: Iterable, key: Optional[Callable], reversed: bool, max_in_memory: int, pool: Optional[par.Pool], workers: Optional[int]) -> Iterator:
+    iterator = iter(iterable)
+    first = list(itertools.islice(iterator, max_in_memory + 1))
+    if len(first) <= max_in_memory:
+        first.sort(key = key, reverse = reversed)
+        yield from first
+        return
+
+    directory = tempfile.mkdtemp(prefix = 'hypoxia-sort-')
+    try:
+        elements = itertools.chain(first, iterator)
+        del first  # so that the buffered elements can be freed once the chain has moved past them
+        runs = list(_runs(elements, key, reversed, directory, max_in_memory, pool, workers))
+
+        # heapq.merge prefers earlier inputs when elements are equal, so merging consecutive runs in order keeps the sort stable
+        while len(runs) > MERGE_FAN_IN:
+            runs = [
+                _write_run(heapq.merge(*map(_read_run, runs[i:i + MERGE_FAN_IN]), key = key, reverse = reversed), directory)
+                for i in range(0, len(runs), MERGE_FAN_IN)
+            ]
+
+        yield from heapq.merge(*map(_read_run, runs), key = key, reverse = reversed)
+    finally:
+        shutil.rmtree(directory, ignore_errors = True)
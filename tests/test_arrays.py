@@ -0,0 +1,166 @@
+import array
+
+import pytest
+
+from hypoxia import OptionArray, ResultArray, Iter, Some, Nun, Ok, Err, Panic
+
+
+@pytest.fixture(scope = 'function')
+def options():
+    return OptionArray([Some(1), Nun(), Some(3), Nun()])
+
+
+@pytest.fixture(scope = 'function')
+def results():
+    return ResultArray([Ok(1), Err(ValueError('bad')), Ok(3)])
+
+
+def test_option_array_columns(options):
+    assert options.values == [1, None, 3, None]
+    assert options.mask == bytearray([1, 0, 1, 0])
+
+
+def test_option_array_round_trip(options):
+    assert list(options) == [Some(1), Nun(), Some(3), Nun()]
+    assert len(options) == 4
+    assert options[0] == Some(1)
+    assert options[1] == Nun()
+
+
+def test_collect_option_array():
+    x = Iter(range(4)).map(lambda x: Some(x) if x % 2 else Nun()).collect(OptionArray)
+
+    assert x == OptionArray([Nun(), Some(1), Nun(), Some(3)])
+
+
+def test_from_columns_with_typed_buffer():
+    x = OptionArray.from_columns(array.array('d', [1.0, 0.0, 3.0]), [True, False, True])
+
+    assert list(x) == [Some(1.0), Nun(), Some(3.0)]
+
+
+def test_from_columns_without_mask_is_all_some():
+    assert OptionArray.from_columns([1, 2]).count_some() == 2
+
+
+def test_from_columns_normalizes_and_copies_mask():
+    mask = bytearray([2, 0, 1])
+    x = OptionArray.from_columns(['a', 'b', 'c'], mask)
+
+    assert x.mask == bytearray([1, 0, 1])
+    assert x.count_some() == 2
+    assert x.is_nun() == bytearray([0, 1, 0])
+    assert list(x) == [Some('a'), Nun(), Some('c')]
+
+    mask[1] = 1
+    assert x[1] == Nun()
+
+
+def test_normalized_mask_converts_to_masked_array():
+    pytest.importorskip('numpy')
+    x = OptionArray.from_columns([1.0, 2.0, 3.0], bytearray([2, 0, 1]))
+
+    assert x.to_masked(dtype = float).mask.tolist() == [False, True, False]
+
+
+def test_from_columns_without_copying_mask():
+    mask = bytearray([1, 0])
+    x = OptionArray.from_columns(['a', 'b'], mask, copy_mask = False)
+
+    assert x.mask is mask
+
+
+def test_result_array_from_columns_normalizes_mask():
+    x = ResultArray.from_columns([1, None], [None, KeyError('k')], bytes([7, 0]))
+
+    assert x.count_ok() == 1
+    assert x.is_err() == bytearray([0, 1])
+
+
+def test_from_columns_with_mismatched_lengths():
+    with pytest.raises(Panic):
+        OptionArray.from_columns([1, 2], [1])
+
+
+def test_masks_and_counts(options):
+    assert options.is_some() == bytearray([1, 0, 1, 0])
+    assert options.is_nun() == bytearray([0, 1, 0, 1])
+    assert options.count_some() == 2
+    assert options.count_nun() == 2
+
+
+def test_option_array_map(options):
+    assert options.map(lambda x: x * 10) == OptionArray([Some(10), Nun(), Some(30), Nun()])
+
+
+def test_option_array_map_when_all_some():
+    assert OptionArray.from_columns([1, 2]).map(str) == OptionArray([Some('1'), Some('2')])
+
+
+def test_option_array_map_or(options):
+    assert options.map_or(lambda x: x * 10, 0) == [10, 0, 30, 0]
+
+
+def test_option_array_unwrap_or(options):
+    assert options.unwrap_or(-1) == [1, -1, 3, -1]
+
+
+def test_option_array_and_then(options):
+    x = options.and_then(lambda x: Some(x) if x > 1 else Nun())
+
+    assert x == OptionArray([Nun(), Nun(), Some(3), Nun()])
+
+
+def test_option_array_filter(options):
+    assert options.filter(lambda x: x < 2) == OptionArray([Some(1), Nun(), Nun(), Nun()])
+
+
+def test_option_array_ok_or(options):
+    err = ValueError('missing')
+
+    assert list(options.ok_or(err)) == [Ok(1), Err(err), Ok(3), Err(err)]
+
+
+def test_result_array_columns(results):
+    assert results.values == [1, None, 3]
+    assert results.mask == bytearray([1, 0, 1])
+    assert results.errors[1].args == ('bad',)
+
+
+def test_collect_result_array():
+    x = Iter([Ok(1), Err(ValueError('bad'))]).collect(ResultArray)
+
+    assert list(x) == [Ok(1), Err(ValueError('bad'))]
+
+
+def test_result_array_masks_and_counts(results):
+    assert results.is_ok() == bytearray([1, 0, 1])
+    assert results.is_err() == bytearray([0, 1, 0])
+    assert results.count_ok() == 2
+    assert results.count_err() == 1
+
+
+def test_result_array_ok_and_err(results):
+    assert list(results.ok()) == [Some(1), Nun(), Some(3)]
+    assert [o.map(lambda e: e.args) for o in results.err()] == [Nun(), Some(('bad',)), Nun()]
+
+
+def test_result_array_map(results):
+    assert list(results.map(lambda x: x + 1)) == [Ok(2), Err(ValueError('bad')), Ok(4)]
+
+
+def test_result_array_map_err(results):
+    x = results.map_err(lambda e: TypeError(*e.args))
+
+    assert list(x) == [Ok(1), Err(TypeError('bad')), Ok(3)]
+
+
+def test_result_array_unwrap_or_and_map_or(results):
+    assert results.unwrap_or(0) == [1, 0, 3]
+    assert results.map_or(str, '') == ['1', '', '3']
+
+
+def test_result_array_and_then(results):
+    x = results.and_then(lambda x: Ok(x) if x < 2 else Err(KeyError(x)))
+
+    assert list(x) == [Ok(1), Err(ValueError('bad')), Err(KeyError(3))]
@@ -0,0 +1,159 @@
+import asyncio
+import concurrent.futures
+
+import pytest
+
+from hypoxia import AsyncIter, Ok, Err, Some, Nun, Panic
+
+
+def run(coro):
+    # not asyncio.run, which needs Python 3.7
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+async def agen(n):
+    for x in range(n):
+        await asyncio.sleep(0)
+        yield x
+
+
+async def async_square(x):
+    await asyncio.sleep(0)
+    return x ** 2
+
+
+def test_wraps_sync_iterable():
+    assert run(AsyncIter(range(3)).collect(list)) == [0, 1, 2]
+
+
+def test_wraps_async_iterable():
+    assert run(AsyncIter(agen(3)).collect(tuple)) == (0, 1, 2)
+
+
+def test_async_for():
+    async def consume():
+        return [x async for x in AsyncIter(agen(3))]
+
+    assert run(consume()) == [0, 1, 2]
+
+
+def test_map_with_sync_func():
+    assert run(AsyncIter(agen(4)).map(lambda x: 2 * x).collect(list)) == [0, 2, 4, 6]
+
+
+def test_map_with_coroutine_func():
+    assert run(AsyncIter(agen(4)).map(async_square).collect(list)) == [0, 1, 4, 9]
+
+
+def test_filter():
+    assert run(AsyncIter(agen(5)).filter(lambda x: x % 2 == 0).collect(list)) == [0, 2, 4]
+
+
+def test_filter_map():
+    async def fm(x):
+        return Some(x ** 2) if x % 2 == 0 else Nun()
+
+    assert run(AsyncIter(agen(5)).filter_map(fm).collect(list)) == [0, 4, 16]
+
+
+def test_take_while():
+    assert run(AsyncIter(agen(10)).take_while(lambda x: x < 3).collect(list)) == [0, 1, 2]
+
+
+def test_enumerate():
+    assert run(AsyncIter('abc').enumerate(start = 1).collect(list)) == [(1, 'a'), (2, 'b'), (3, 'c')]
+
+
+def test_zip_with_sync_and_async_iterables():
+    assert run(AsyncIter(agen(5)).zip('abc', agen(4)).collect(list)) == [(0, 'a', 0), (1, 'b', 1), (2, 'c', 2)]
+
+
+def test_reduce():
+    assert run(AsyncIter(agen(5)).reduce(lambda acc, x: acc + x)) == 10
+
+
+def test_reduce_with_initial():
+    assert run(AsyncIter(agen(5)).reduce(lambda acc, x: acc + x, initial = 10)) == 20
+
+
+def test_reduce_on_empty():
+    with pytest.raises(TypeError):
+        run(AsyncIter([]).reduce(lambda acc, x: acc + x))
+
+
+def test_for_each():
+    seen = []
+
+    async def record(x):
+        seen.append(x)
+
+    run(AsyncIter(agen(3)).for_each(record))
+
+    assert seen == [0, 1, 2]
+
+
+def test_buffered_keeps_order_and_runs_concurrently():
+    running = 0
+    peak = 0
+
+    async def slow(x):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 * (5 - x))
+        running -= 1
+        return x
+
+    assert run(AsyncIter(range(5)).buffered(3, slow).collect(list)) == [Ok(x) for x in range(5)]
+    assert peak == 3
+
+
+def test_buffered_on_awaitables():
+    async def main():
+        return await AsyncIter(async_square(x) for x in range(3)).buffered(2).collect(list)
+
+    assert run(main()) == [Ok(0), Ok(1), Ok(4)]
+
+
+def test_buffered_failures_become_errs():
+    async def invert(x):
+        return 1 / x
+
+    assert run(AsyncIter([1, 0, 2]).buffered(2, invert).collect(list)) == [Ok(1), Err(ZeroDivisionError('division by zero')), Ok(0.5)]
+
+
+def test_buffer_unordered_yields_fastest_first():
+    async def slow(x):
+        await asyncio.sleep(0.01 * x)
+        return x
+
+    assert run(AsyncIter([3, 1, 2]).buffer_unordered(3, slow).collect(list)) == [Ok(1), Ok(2), Ok(3)]
+
+
+@pytest.mark.parametrize('method', ['buffered', 'buffer_unordered'])
+def test_buffered_cancelled_awaitable_becomes_err(method):
+    async def main():
+        loop = asyncio.get_event_loop()
+        done, cancelled = loop.create_future(), loop.create_future()
+        done.set_result(1)
+        cancelled.cancel()
+
+        return await getattr(AsyncIter([done, cancelled]), method)(2).collect(list)
+
+    oks, errs = [], []
+    for r in run(main()):
+        (oks if r.is_ok() else errs).append(r)
+
+    assert oks == [Ok(1)]
+    assert [type(e.unwrap_err()) for e in errs] == [concurrent.futures.CancelledError]
+
+
+@pytest.mark.parametrize('method', ['buffered', 'buffer_unordered'])
+@pytest.mark.parametrize('n', [0, -1])
+def test_buffered_with_bad_n_panics(method, n):
+    with pytest.raises(Panic):
+        getattr(AsyncIter(range(3)), method)(n)
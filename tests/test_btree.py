@@ -0,0 +1,108 @@
+import random
+
+import pytest
+
+from hypoxia import BTreeMap, Iter, Some, Nun, Panic
+
+
+@pytest.fixture(scope = 'function')
+def btree():
+    return BTreeMap(((k, str(k)) for k in range(0, 100, 10)), load = 2)
+
+
+def test_getitem_returns_options(btree):
+    assert btree[10] == Some('10')
+    assert btree[11] == Nun()
+    assert btree.get(90) == Some('90')
+
+
+def test_keys_are_sorted():
+    b = BTreeMap({3: 'c', 1: 'a', 2: 'b'})
+
+    assert list(b) == [1, 2, 3]
+    assert b.items().collect(list) == [(1, 'a'), (2, 'b'), (3, 'c')]
+    assert b.values().collect(list) == ['a', 'b', 'c']
+
+
+def test_collect_into_btree():
+    b = Iter('cab').map(lambda c: (c, c.upper())).collect(BTreeMap)
+
+    assert list(b) == ['a', 'b', 'c']
+
+
+def test_first_and_last(btree):
+    assert btree.first() == Some((0, '0'))
+    assert btree.last() == Some((90, '90'))
+    assert BTreeMap().first() == Nun()
+    assert BTreeMap().last() == Nun()
+
+
+def test_floor_and_ceiling(btree):
+    assert btree.floor(25) == Some((20, '20'))
+    assert btree.floor(20) == Some((20, '20'))
+    assert btree.floor(-1) == Nun()
+    assert btree.ceiling(25) == Some((30, '30'))
+    assert btree.ceiling(30) == Some((30, '30'))
+    assert btree.ceiling(91) == Nun()
+
+
+@pytest.mark.parametrize(
+    'lo, hi, inclusive, expected',
+    [
+        (20, 50, (True, False), [20, 30, 40]),
+        (20, 50, (True, True), [20, 30, 40, 50]),
+        (20, 50, (False, True), [30, 40, 50]),
+        (15, 55, (True, False), [20, 30, 40, 50]),
+        (None, 20, (True, False), [0, 10]),
+        (75, None, (True, False), [80, 90]),
+        (None, None, (True, False), list(range(0, 100, 10))),
+        (50, 20, (True, False), []),
+        (200, 300, (True, False), []),
+    ],
+)
+def test_range(btree, lo, hi, inclusive, expected):
+    r = btree.range(lo, hi, inclusive = inclusive)
+
+    assert isinstance(r, Iter)
+    assert [k for k, _ in r] == expected
+
+
+def test_from_sorted():
+    b = BTreeMap.from_sorted(((i, i) for i in range(10)), load = 3)
+
+    assert list(b) == list(range(10))
+    assert b.range(3, 6).collect(list) == [(3, 3), (4, 4), (5, 5)]
+
+
+def test_from_sorted_panics_on_unsorted_input():
+    with pytest.raises(Panic):
+        BTreeMap.from_sorted([(1, 'a'), (1, 'b')])
+
+
+def test_remove(btree):
+    assert btree.remove(20) == Some('20')
+    assert btree.remove(20) == Nun()
+    assert list(btree) == [0, 10, 30, 40, 50, 60, 70, 80, 90]
+
+
+def test_matches_sorted_dict_under_random_operations():
+    rng = random.Random(0)
+    b = BTreeMap(load = 4)
+    reference = {}
+
+    for step in range(3000):
+        key = rng.randrange(300)
+        if rng.random() < 0.6:
+            b[key] = step
+            reference[key] = step
+        else:
+            assert b.remove(key) == (Some(reference.pop(key)) if key in reference else Nun())
+
+        if step % 100 == 0:
+            keys = sorted(reference)
+            assert list(b) == keys
+            lo, hi = sorted((rng.randrange(300), rng.randrange(300)))
+            assert [k for k, _ in b.range(lo, hi)] == [k for k in keys if lo <= k < hi]
+            assert b.floor(lo).map(lambda kv: kv[0]) == Iter(reversed(keys)).find(lambda k: k <= lo)
+
+    assert len(b) == len(reference)
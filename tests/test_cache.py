@@ -0,0 +1,217 @@
+import pytest
+
+from hypoxia import LruHashMap, TtlHashMap, HashMap, memoize, returns_result, Some, Nun, Ok, Err, Panic
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(scope = 'function')
+def clock():
+    return FakeClock()
+
+
+def test_lru_getitem_returns_options():
+    lru = LruHashMap(2)
+    lru['a'] = 1
+
+    assert lru['a'] == Some(1)
+    assert lru['b'] == Nun()
+    assert lru.get('a') == Some(1)
+
+
+def test_lru_evicts_least_recently_used():
+    lru = LruHashMap(2)
+    lru['a'] = 1
+    lru['b'] = 2
+    lru['a']  # now b is the least-recently-used
+    lru['c'] = 3
+
+    assert list(lru) == ['a', 'c']
+    assert lru.stats.evictions == 1
+
+
+def test_lru_peek_does_not_touch_recency():
+    lru = LruHashMap(2)
+    lru['a'] = 1
+    lru['b'] = 2
+    assert lru.peek('a') == Some(1)
+    lru['c'] = 3
+
+    assert 'a' not in lru
+    assert lru.stats.hits == 0
+
+
+def test_lru_stats():
+    lru = LruHashMap(2)
+    lru['a'] = 1
+    lru['a']
+    lru['a']
+    lru['b']
+
+    assert (lru.stats.hits, lru.stats.misses) == (2, 1)
+    assert lru.stats.hit_rate == pytest.approx(2 / 3)
+
+
+def test_lru_weigher():
+    lru = LruHashMap(10, weigher = lambda k, v: len(v))
+    lru['a'] = 'xxxx'
+    lru['b'] = 'xxxx'
+    lru['c'] = 'xxxx'
+
+    assert list(lru) == ['b', 'c']
+    assert lru.weight == 8
+
+
+def test_lru_weigher_replacing_a_value_updates_the_weight():
+    lru = LruHashMap(10, weigher = lambda k, v: len(v))
+    lru['a'] = 'xxxx'
+    lru['a'] = 'xx'
+
+    assert lru.weight == 2
+
+
+def test_lru_entry_heavier_than_capacity_is_not_stored():
+    lru = LruHashMap(3, weigher = lambda k, v: len(v))
+    lru['a'] = 'x'
+    lru['b'] = 'xxxx'
+
+    assert list(lru) == ['a']
+    assert lru.weight == 1
+
+
+def test_lru_remove():
+    lru = LruHashMap(3, weigher = lambda k, v: v)
+    lru['a'] = 2
+
+    assert lru.remove('a') == Some(2)
+    assert lru.remove('a') == Nun()
+    assert lru.weight == 0
+
+
+def test_lru_bad_capacity_panics():
+    with pytest.raises(Panic):
+        LruHashMap(0)
+
+
+def test_ttl_expires(clock):
+    ttl = TtlHashMap(10, clock = clock)
+    ttl['a'] = 1
+
+    clock.now = 9
+    assert ttl['a'] == Some(1)
+
+    clock.now = 10
+    assert ttl['a'] == Nun()
+    assert len(ttl) == 0
+    assert ttl.stats.expirations == 1
+
+
+def test_ttl_insert_drops_expired_entries_from_the_front(clock):
+    ttl = TtlHashMap(10, clock = clock)
+    ttl['a'] = 1
+    clock.now = 5
+    ttl['b'] = 2
+    clock.now = 12
+    ttl['c'] = 3
+
+    assert list(ttl) == ['b', 'c']
+    assert len(ttl) == 2
+
+
+def test_ttl_reinsert_refreshes_expiry(clock):
+    ttl = TtlHashMap(10, clock = clock)
+    ttl['a'] = 1
+    clock.now = 5
+    ttl['a'] = 2
+    clock.now = 12
+
+    assert ttl['a'] == Some(2)
+
+
+def test_ttl_per_entry_ttl(clock):
+    ttl = TtlHashMap(10, clock = clock)
+    ttl.insert('a', 1, ttl = 1)
+    clock.now = 1
+
+    assert 'a' not in ttl
+    assert ttl['a'] == Nun()
+
+
+def test_ttl_capacity(clock):
+    ttl = TtlHashMap(10, capacity = 2, clock = clock)
+    for k in 'abc':
+        ttl[k] = k
+
+    assert list(ttl) == ['b', 'c']
+    assert ttl.stats.evictions == 1
+
+
+def test_memoize_caches_ok(mocker):
+    func = mocker.MagicMock(side_effect = lambda x: Ok(x * 2))
+    memoized = memoize(func)
+
+    assert memoized(2) == Ok(4)
+    assert memoized(2) == Ok(4)
+    assert func.call_count == 1
+    assert memoized.cache.stats.hits == 1
+
+
+def test_memoize_does_not_cache_err_by_default():
+    calls = []
+
+    @memoize
+    @returns_result
+    def fail(x):
+        calls.append(x)
+        raise ValueError(x)
+
+    assert fail(1).is_err()
+    assert fail(1).is_err()
+    assert len(calls) == 2
+
+
+def test_memoize_negative_ttl():
+    calls = []
+
+    @memoize(negative_ttl = 60)
+    def fail(x):
+        calls.append(x)
+        return Err(ValueError(x))
+
+    assert fail(1) == Err(ValueError(1))
+    assert fail(1) == Err(ValueError(1))
+    assert len(calls) == 1
+    assert len(fail.cache) == 0
+
+
+def test_memoize_keyword_arguments_are_part_of_the_key():
+    @memoize(cache = HashMap())
+    def add(x, y = 0):
+        return Ok(x + y)
+
+    assert add(1, y = 2) == Ok(3)
+    assert add(1, y = 3) == Ok(4)
+    assert add(1) == Ok(1)
+    assert len(add.cache) == 3
+
+
+def test_memoize_with_ttl_cache(clock):
+    calls = []
+
+    @memoize(cache = TtlHashMap(5, clock = clock))
+    def f(x):
+        calls.append(x)
+        return Ok(x)
+
+    f(1)
+    f(1)
+    clock.now = 5
+    f(1)
+
+    assert len(calls) == 2
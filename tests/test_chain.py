@@ -0,0 +1,86 @@
+import pytest
+
+from hypoxia import Chain, Iter, Some, Nun, Ok, Err
+
+
+def test_option_pipe_with_some():
+    assert Some(2).pipe(lambda x: x + 1, lambda x: x * 10) == Some(30)
+
+
+def test_option_pipe_with_nun(mocker):
+    func = mocker.MagicMock()
+    x = Nun()
+
+    assert x.pipe(func) is x
+    assert func.call_count == 0
+
+
+def test_result_pipe_with_ok():
+    assert Ok(2).pipe(lambda x: x + 1, str) == Ok('3')
+
+
+def test_result_pipe_with_err():
+    x = Err(Exception('error message'))
+
+    assert x.pipe(lambda x: x + 1) is x
+
+
+@pytest.mark.parametrize('x', [Some(2), Nun()])
+def test_chain_matches_option_methods(x):
+    chain = Chain().map(lambda x: x + 1).and_then(lambda x: x * 2).or_else(lambda: 0).map(str)
+
+    assert chain(x) == x.map(lambda x: x + 1).and_then(lambda x: x * 2).or_else(lambda: 0).map(str)
+
+
+def check(x):
+    return Ok(x) if x < 10 else Err(ValueError(x))
+
+
+@pytest.mark.parametrize('x', [Ok(2), Ok(20), Err(KeyError('k'))])
+def test_chain_matches_result_methods(x):
+    chain = Chain().map(lambda x: x + 1).and_then(check).or_else(lambda e: Ok(-1)).map(str)
+
+    assert chain(x) == x.map(lambda x: x + 1).and_then(check).or_else(lambda e: Ok(-1)).map(str)
+
+
+def test_chain_map_err():
+    chain = Chain().map_err(lambda e: Err(TypeError(*e.args)))
+
+    assert chain(Err(KeyError('k'))) == Err(TypeError('k'))
+    assert chain(Ok(1)) == Ok(1)
+
+
+def test_chain_map_err_is_skipped_for_options():
+    assert Chain().map_err(lambda e: Some(1))(Nun()) == Nun()
+
+
+def test_chain_exits_early_on_failure_with_no_recovery_after(mocker):
+    recover = mocker.MagicMock(return_value = Ok(0))
+    later = mocker.MagicMock()
+
+    chain = Chain().or_else(recover).and_then(lambda x: Err(KeyError(x))).map(later).map(later)
+
+    assert chain(Ok(1)) == Err(KeyError(1))
+    assert recover.call_count == 0
+    assert later.call_count == 0
+
+
+def test_chain_returns_input_untouched_when_nothing_applies():
+    x = Err(KeyError('k'))
+
+    assert Chain().map(str)(x) is x
+
+
+def test_chain_returns_the_result_of_the_last_and_then():
+    y = Ok(5)
+
+    assert Chain().map(lambda x: x + 1).and_then(lambda x: y)(Ok(1)) is y
+
+
+def test_chain_is_reusable_and_immutable():
+    base = Chain().map(lambda x: x + 1)
+    longer = base.map(lambda x: x * 2)
+
+    assert len(base) == 1
+    assert len(longer) == 2
+    assert Iter([Some(1), Nun(), Some(3)]).map(longer).collect(list) == [Some(4), Nun(), Some(8)]
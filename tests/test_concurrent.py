@@ -0,0 +1,113 @@
+import operator
+import threading
+
+import pytest
+
+from hypoxia import ConcurrentHashMap, HashMap, Some, Nun, Panic
+
+
+@pytest.fixture(scope = 'function')
+def cmap():
+    return ConcurrentHashMap({'num': 2, 'foo': 'bar'}, shards = 4)
+
+
+def run_threads(target, n = 8):
+    barrier = threading.Barrier(n)
+
+    def run():
+        barrier.wait()
+        target()
+
+    threads = [threading.Thread(target = run) for _ in range(n)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def test_getitem_returns_options(cmap):
+    assert cmap['num'] == Some(2)
+    assert cmap['missing'] == Nun()
+    assert cmap.get('foo') == Some('bar')
+
+
+def test_insert_remove_and_len(cmap):
+    cmap.insert('new', 1)
+    assert len(cmap) == 3
+    assert cmap.remove('new') == Some(1)
+    assert cmap.remove('new') == Nun()
+    assert 'new' not in cmap
+
+
+def test_snapshot(cmap):
+    snapshot = cmap.snapshot()
+
+    assert type(snapshot) is HashMap
+    assert snapshot == {'num': 2, 'foo': 'bar'}
+    assert set(cmap) == {'num', 'foo'}
+
+
+def test_shards_must_be_power_of_two():
+    with pytest.raises(Panic):
+        ConcurrentHashMap(shards = 3)
+
+
+def test_compute(cmap):
+    assert cmap.compute('num', lambda o: o.map(lambda x: x + 1)) == Some(3)
+    assert cmap.compute('new', lambda o: Some(o.unwrap_or(0) + 1)) == Some(1)
+    assert cmap.compute('foo', lambda o: Nun()) == Nun()
+
+    assert cmap.snapshot() == {'num': 3, 'new': 1}
+
+
+def test_merge(cmap):
+    assert cmap.merge('num', 5, operator.add) == 7
+    assert cmap.merge('new', 5, operator.add) == 5
+
+
+def test_concurrent_merge_counts_exactly():
+    counts = ConcurrentHashMap(shards = 2)
+
+    def work():
+        for i in range(1000):
+            counts.merge(i % 10, 1, operator.add)
+
+    run_threads(work)
+
+    assert counts.snapshot() == {i: 800 for i in range(10)}
+
+
+def test_concurrent_compute_counts_exactly():
+    counts = ConcurrentHashMap()
+
+    def work():
+        for _ in range(1000):
+            counts.compute('n', lambda o: Some(o.unwrap_or(0) + 1))
+
+    run_threads(work)
+
+    assert counts['n'] == Some(8000)
+
+
+def test_get_or_insert_with_runs_factory_once_per_key():
+    cmap = ConcurrentHashMap()
+    calls = []
+
+    def factory():
+        calls.append(1)
+        return object()
+
+    results = []
+    run_threads(lambda: results.append(cmap.get_or_insert_with('key', factory)))
+
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_factory_can_use_the_map():
+    cmap = ConcurrentHashMap(shards = 1)
+
+    value = cmap.get_or_insert_with('a', lambda: cmap.get_or_insert_with('b', lambda: 1) + 1)
+
+    assert value == 2
+    assert cmap.snapshot() == {'a': 2, 'b': 1}
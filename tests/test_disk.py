@@ -0,0 +1,196 @@
+import threading
+
+import pytest
+
+from hypoxia import DiskHashMap, BloomFilter, Iter, Some, Nun, Panic
+
+
+@pytest.fixture(scope = 'function')
+def dmap(tmpdir):
+    with DiskHashMap(str(tmpdir.join('map.db')), bloom_capacity = 1000) as d:
+        d['num'] = 2
+        d['foo'] = 'bar'
+        yield d
+
+
+def test_getitem_returns_options(dmap):
+    assert dmap['num'] == Some(2)
+    assert dmap['missing'] == Nun()
+    assert dmap.get('foo') == Some('bar')
+    assert 'num' in dmap
+    assert 'missing' not in dmap
+
+
+def test_len_and_iteration(dmap):
+    assert len(dmap) == 2
+    assert set(dmap) == {'num', 'foo'}
+    assert dict(dmap.items()) == {'num': 2, 'foo': 'bar'}
+    assert sorted(dmap.values(), key = str) == [2, 'bar']
+
+
+def test_overwrite(dmap):
+    dmap.insert('num', [1, 2, 3])
+
+    assert dmap['num'] == Some([1, 2, 3])
+    assert len(dmap) == 2
+
+
+def test_remove(dmap):
+    assert dmap.remove('num') == Some(2)
+    assert dmap.remove('num') == Nun()
+    assert dmap['num'] == Nun()
+
+
+def test_misses_skip_the_disk(dmap):
+    statements = []
+    dmap._connection().set_trace_callback(lambda statement: statements.append(statement))  # Python 3.6 needs a hashable callback
+
+    assert dmap['definitely not here'] == Nun()
+    assert dmap['also not here'] == Nun()
+    assert not any('entries' in s or 'meta' in s for s in statements)
+
+
+def test_extend_from_iter(dmap):
+    dmap.extend(Iter(range(2500)).map(lambda i: ((i, 'key'), i * i)), batch_size = 1000)
+
+    assert len(dmap) == 2502
+    assert dmap[(50, 'key')] == Some(2500)
+
+
+def test_reopen_uses_saved_bloom(tmpdir, mocker):
+    path = str(tmpdir.join('map.db'))
+    with DiskHashMap(path) as d:
+        d.extend({i: str(i) for i in range(100)})
+
+    build = mocker.spy(DiskHashMap, '_build_bloom')
+    with DiskHashMap(path) as d:
+        assert d[5] == Some('5')
+        assert len(d) == 100
+
+    assert build.call_count == 0
+
+
+def test_reopen_without_flush_rebuilds_bloom(tmpdir):
+    path = str(tmpdir.join('map.db'))
+    d = DiskHashMap(path)
+    d.extend({i: i for i in range(100)})  # not flushed, so the saved filter is invalidated
+
+    other = DiskHashMap(path)
+    assert other[99] == Some(99)
+
+    d.close()
+    other.close()
+
+
+def test_reader_sees_keys_from_another_writer(tmpdir):
+    path = str(tmpdir.join('map.db'))
+    with DiskHashMap(path) as writer, DiskHashMap(path) as reader:
+        writer['a'] = 1
+        assert reader['a'] == Some(1)  # not flushed yet, so the reader looks it up in the file
+
+        writer.flush()
+        writer['b'] = 2
+        writer.flush()
+        assert reader['b'] == Some(2)
+        assert 'b' in reader
+        assert reader['c'] == Nun()
+
+
+def test_reader_loads_flushed_bloom_from_another_writer(tmpdir):
+    path = str(tmpdir.join('map.db'))
+    with DiskHashMap(path) as writer, DiskHashMap(path) as reader:
+        assert reader['a'] == Nun()
+
+        writer.extend({'a': 1, 'b': 2})
+        writer.flush()
+
+        assert reader['a'] == Some(1)
+        assert reader._generation == writer._generation
+        assert reader['c'] == Nun()
+
+
+def test_writes_from_other_instance_make_bloom_stale(tmpdir):
+    path = str(tmpdir.join('map.db'))
+    with DiskHashMap(path) as first, DiskHashMap(path) as second:
+        first['a'] = 1
+        second['b'] = 2
+        first['c'] = 3  # the generation skips ahead, so first's filter doesn't cover 'b'
+
+        assert first['b'] == Some(2)
+        assert second['a'] == Some(1)
+        assert second['c'] == Some(3)
+
+
+def test_concurrent_writers_from_threads(dmap):
+    def write(start):
+        for i in range(start, start + 200):
+            dmap[i] = i
+
+    threads = [threading.Thread(target = write, args = (n * 200,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert all(dmap[i] == Some(i) for i in range(800))
+
+
+def test_remove_reads_the_row_inside_the_write_transaction(dmap):
+    statements = []
+    dmap._connection().set_trace_callback(lambda statement: statements.append(statement))
+
+    assert dmap.remove('num') == Some(2)
+
+    begin = statements.index('BEGIN IMMEDIATE')
+    assert begin < next(i for i, s in enumerate(statements) if s.startswith('SELECT value FROM entries'))
+
+
+def test_compact(dmap):
+    dmap.extend((i, 'x' * 100) for i in range(1000))
+    for i in range(1000):
+        dmap.remove(i)
+
+    dmap.compact()
+
+    assert len(dmap) == 2
+    assert dmap['num'] == Some(2)
+
+
+def test_concurrent_readers(dmap):
+    dmap.extend((i, i) for i in range(1000))
+    errors = []
+
+    def read():
+        try:
+            for i in range(1000):
+                assert dmap[i] == Some(i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target = read) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+
+
+def test_use_after_close_panics(tmpdir):
+    d = DiskHashMap(str(tmpdir.join('map.db')))
+    d.close()
+
+    with pytest.raises(Panic):
+        d['a'] = 1
+
+
+def test_bloom_filter():
+    bloom = BloomFilter(1000, error_rate = 0.01)
+    for i in range(1000):
+        bloom.add(str(i).encode())
+
+    assert all(str(i).encode() in bloom for i in range(1000))
+    false_positives = sum(str(i).encode() in bloom for i in range(1000, 11000))
+    assert false_positives < 300
+
+    assert BloomFilter.from_bytes(bloom.to_bytes()).bits == bloom.bits
@@ -0,0 +1,104 @@
+import random
+import sys
+
+import pytest
+
+from hypoxia import FrozenHashMap, HashMap, Iter, Some, Nun, Panic
+
+
+@pytest.fixture(scope = 'function')
+def str_map():
+    return FrozenHashMap({'num': 2, 'foo': 3, 'héllo': 4})
+
+
+def test_str_keys(str_map):
+    assert str_map['num'] == Some(2)
+    assert str_map['héllo'] == Some(4)
+    assert str_map['missing'] == Nun()
+    assert str_map[5] == Nun()
+    assert str_map.get('foo') == Some(3)
+    assert len(str_map) == 3
+
+
+def test_int_keys():
+    f = FrozenHashMap((i * 3, i) for i in range(1000))
+
+    assert f[300] == Some(100)
+    assert f[301] == Nun()
+    assert f['300'] == Nun()
+    assert f[2 ** 70] == Nun()
+    assert list(f) == [i * 3 for i in range(1000)]
+
+
+def test_value_kinds():
+    assert FrozenHashMap({1: 1.5})[1] == Some(1.5)
+    assert FrozenHashMap({1: 'a', 2: None})[2] == Some(None)
+    assert FrozenHashMap({1: True})[1] == Some(True)
+    assert FrozenHashMap({1: 2 ** 70})[1] == Some(2 ** 70)
+    assert FrozenHashMap({1: [1, 2]})[1] == Some([1, 2])
+
+
+def test_from_iter_and_hashmap():
+    h = HashMap(a = 1, b = 2)
+
+    assert dict(FrozenHashMap(h).items()) == h
+    assert Iter(h.items()).collect(FrozenHashMap)['b'] == Some(2)
+
+
+def test_empty():
+    f = FrozenHashMap()
+
+    assert len(f) == 0
+    assert f['a'] == Nun()
+    assert list(f) == []
+
+
+def test_mixed_keys_panic():
+    with pytest.raises(Panic):
+        FrozenHashMap({1: 1, 'a': 2})
+
+
+def test_int_keys_out_of_range_panic():
+    with pytest.raises(Panic):
+        FrozenHashMap({2 ** 70: 1})
+
+
+def test_get_many(str_map):
+    found = str_map.get_many(['num', 'missing', 'foo'])
+
+    assert list(found) == [Some(2), Nun(), Some(3)]
+
+
+def test_save_and_load(str_map, tmpdir):
+    path = str(tmpdir.join('map.frozen'))
+    str_map.save(path)
+
+    with FrozenHashMap.load(path) as loaded:
+        assert dict(loaded.items()) == dict(str_map.items())
+        assert loaded['héllo'] == Some(4)
+
+
+def test_load_rejects_other_files(tmpdir):
+    path = str(tmpdir.join('not.frozen'))
+    with open(path, 'wb') as f:
+        f.write(b'x' * 100)
+
+    with pytest.raises(Panic):
+        FrozenHashMap.load(path)
+
+
+def test_matches_dict_for_many_str_keys():
+    rng = random.Random(0)
+    d = {f'key-{rng.getrandbits(40)}': rng.random() for _ in range(5000)}
+    f = FrozenHashMap(d)
+
+    assert all(f[k] == Some(v) for k, v in d.items())
+    assert all(f[f'other-{i}'] == Nun() for i in range(1000))
+
+
+def test_smaller_than_dict():
+    d = {f'key-{i}': i for i in range(10000)}
+    f = FrozenHashMap(d)
+
+    dict_bytes = sys.getsizeof(d) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in d.items())
+    assert f.nbytes < dict_bytes / 2
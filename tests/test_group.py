@@ -0,0 +1,137 @@
+import collections
+import random
+
+import pytest
+
+from hypoxia import Iter, HashMap, GroupBy, Some, Panic
+
+Order = collections.namedtuple('Order', ['customer', 'amount'])
+
+ORDERS = [
+    Order('a', 10),
+    Order('b', 5),
+    Order('a', 3),
+    Order('c', 7),
+    Order('b', 1),
+    Order('a', 4),
+]
+
+
+def test_counts():
+    counts = Iter('abracadabra').counts()
+
+    assert type(counts) is HashMap
+    assert counts == {'a': 5, 'b': 2, 'r': 2, 'c': 1, 'd': 1}
+    assert counts['z'].is_nun()
+
+
+def test_counts_with_key():
+    assert Iter(range(10)).counts(key = lambda x: x % 3) == {0: 4, 1: 3, 2: 3}
+
+
+def test_counts_with_spilling():
+    assert Iter(range(1000)).counts(key = lambda x: x % 100, max_groups = 7) == {k: 10 for k in range(100)}
+
+
+def test_group_by_returns_group_by():
+    assert isinstance(Iter(ORDERS).group_by(lambda o: o.customer), GroupBy)
+
+
+def test_group_by_collect():
+    groups = Iter(ORDERS).group_by(lambda o: o.customer).collect(list)
+
+    assert type(groups) is HashMap
+    assert groups['a'] == Some([ORDERS[0], ORDERS[2], ORDERS[5]])
+    assert groups['c'] == Some([ORDERS[3]])
+
+
+def test_group_by_collect_other_collection_type():
+    groups = Iter(range(10)).group_by(lambda x: x % 2).collect(set)
+
+    assert groups == {0: {0, 2, 4, 6, 8}, 1: {1, 3, 5, 7, 9}}
+
+
+def test_group_by_without_key_groups_by_element():
+    assert Iter('aab').group_by().agg(n = 'count') == {'a': {'n': 2}, 'b': {'n': 1}}
+
+
+def test_agg():
+    result = Iter(ORDERS).group_by(lambda o: o.customer).agg(
+        n = 'count',
+        total = ('sum', lambda o: o.amount),
+        smallest = ('min', lambda o: o.amount),
+        largest = ('max', lambda o: o.amount),
+        mean = ('mean', lambda o: o.amount),
+        first = ('first', lambda o: o.amount),
+        last = ('last', lambda o: o.amount),
+        amounts = ('list', lambda o: o.amount),
+    )
+
+    assert result['a'] == Some({
+        'n': 3,
+        'total': 17,
+        'smallest': 3,
+        'largest': 10,
+        'mean': 17 / 3,
+        'first': 10,
+        'last': 4,
+        'amounts': [10, 3, 4],
+    })
+    assert result['c'].unwrap()['n'] == 1
+
+
+def test_agg_on_elements():
+    result = Iter(range(10)).group_by(lambda x: x % 2).agg(total = 'sum', top = 'max')
+
+    assert result == {0: {'total': 20, 'top': 8}, 1: {'total': 25, 'top': 9}}
+
+
+def test_agg_unknown_aggregation_panics():
+    with pytest.raises(Panic):
+        Iter(ORDERS).group_by(lambda o: o.customer).agg(x = 'median')
+
+
+def test_agg_without_aggregations_panics():
+    with pytest.raises(Panic):
+        Iter(ORDERS).group_by(lambda o: o.customer).agg()
+
+
+def test_bad_max_groups_panics():
+    with pytest.raises(Panic):
+        Iter(ORDERS).group_by(max_groups = 0)
+
+
+def test_spilling_gives_same_results_as_in_memory():
+    rng = random.Random(0)
+    data = [(rng.randrange(500), rng.random()) for _ in range(20000)]
+    aggs = dict(
+        n = 'count',
+        total = ('sum', lambda d: d[1]),
+        low = ('min', lambda d: d[1]),
+        high = ('max', lambda d: d[1]),
+        first = ('first', lambda d: d[1]),
+        last = ('last', lambda d: d[1]),
+        values = ('list', lambda d: d[1]),
+    )
+
+    in_memory = Iter(data).group_by(lambda d: d[0]).agg(**aggs)
+    spilled = Iter(data).group_by(lambda d: d[0], max_groups = 50).agg(**aggs)
+
+    assert spilled.keys() == in_memory.keys()
+    for k, expected in in_memory.items():
+        actual = spilled[k].unwrap()
+        assert actual.pop('total') == pytest.approx(expected.pop('total'))
+        assert actual == expected
+
+
+def test_spilling_collect_keeps_order():
+    groups = Iter(range(1000)).group_by(lambda x: x % 100, max_groups = 10).collect(list)
+
+    assert groups[7] == Some(list(range(7, 1000, 100)))
+
+
+def test_agg_iter_is_lazy_iter():
+    result = Iter(range(100)).group_by(lambda x: x % 10, max_groups = 3).agg_iter(n = 'count')
+
+    assert isinstance(result, Iter)
+    assert sorted(result) == [(k, {'n': 10}) for k in range(10)]
@@ -1,6 +1,6 @@
 import pytest
 
-from hypoxia import HashMap
+from hypoxia import HashMap, Iter, Some, Nun, Panic
 
 
 @pytest.fixture(scope = 'function')
@@ -35,3 +35,166 @@ def test_inserting_works(hashmap):
     hashmap.insert('new', 'newval')
 
     assert hashmap['new'].unwrap() == 'newval'
+
+
+def test_getitem_and_get_return_options(hashmap):
+    assert hashmap['num'] == Some(2)
+    assert hashmap['missing'] == Nun()
+    assert hashmap.get('num') == Some(2)
+    assert hashmap.get('missing') == Nun()
+
+
+def test_hashmap_is_a_dict(hashmap):
+    assert isinstance(hashmap, dict)
+    assert dict(hashmap) == {'num': 2, 'foo': 'bar'}
+    assert not hasattr(hashmap, '__dict__')
+
+
+def test_collect_into_hashmap():
+    h = Iter('abc').enumerate().collect(HashMap)
+
+    assert h[1] == Some('b')
+
+
+def test_copy_is_a_hashmap(hashmap):
+    c = hashmap.copy()
+
+    assert type(c) is HashMap
+    assert c == hashmap
+    assert c is not hashmap
+
+
+def test_fromkeys_is_a_hashmap():
+    h = HashMap.fromkeys('ab', 0)
+
+    assert type(h) is HashMap
+    assert h == {'a': 0, 'b': 0}
+    assert h['a'] == Some(0)
+
+
+def test_union_is_a_hashmap():
+    h = HashMap({'a': 1, 'b': 2})
+
+    left = h | {'b': 3, 'c': 4}
+    right = {'b': 3, 'c': 4} | h
+
+    assert type(left) is HashMap and type(right) is HashMap
+    assert left == {'a': 1, 'b': 3, 'c': 4}
+    assert right == {'a': 1, 'b': 2, 'c': 4}
+    assert h == {'a': 1, 'b': 2}
+
+
+def test_union_with_non_dict_is_not_supported():
+    with pytest.raises(TypeError):
+        HashMap({'a': 1}) | [('b', 2)]
+
+
+def test_inplace_union():
+    h = HashMap({'a': 1})
+    original = h
+
+    h |= [('b', 2)]
+
+    assert h is original
+    assert type(h) is HashMap
+    assert h == {'a': 1, 'b': 2}
+
+
+def test_remove(hashmap):
+    assert hashmap.remove('num') == Some(2)
+    assert hashmap.remove('num') == Nun()
+    assert 'num' not in hashmap
+
+
+def test_entry_or_insert(hashmap):
+    assert hashmap.entry('num').or_insert(5) == 2
+    assert hashmap.entry('new').or_insert(5) == 5
+    assert hashmap['new'] == Some(5)
+
+
+def test_entry_or_insert_with_only_calls_func_when_missing(hashmap, mocker):
+    func = mocker.MagicMock(return_value = 5)
+
+    assert hashmap.entry('num').or_insert_with(func) == 2
+    assert func.call_count == 0
+
+    assert hashmap.entry('new').or_insert_with(func) == 5
+    assert func.call_count == 1
+
+
+def test_entry_or_default(hashmap):
+    assert hashmap.entry('new').or_default() == 0
+    assert hashmap.entry('list').or_default(list) == []
+
+
+def test_entry_and_modify(hashmap):
+    hashmap.entry('num').and_modify(lambda x: x + 1)
+    hashmap.entry('new').and_modify(lambda x: x + 1)
+
+    assert hashmap['num'] == Some(3)
+    assert 'new' not in hashmap
+
+
+def test_entry_counter():
+    counts = HashMap()
+    for c in 'abracadabra':
+        counts.entry(c).and_modify(lambda n: n + 1).or_insert(1)
+
+    assert counts == {'a': 5, 'b': 2, 'r': 2, 'c': 1, 'd': 1}
+
+
+def test_entry_key_and_is_occupied(hashmap):
+    assert hashmap.entry('num').key() == 'num'
+    assert hashmap.entry('num').is_occupied()
+    assert not hashmap.entry('new').is_occupied()
+
+
+def test_get_many(hashmap):
+    found = hashmap.get_many(['num', 'missing', 'foo', 'num'])
+
+    assert list(found) == [Some(2), Nun(), Some('bar'), Some(2)]
+    assert found.mask == bytearray([1, 0, 1, 1])
+
+
+def test_get_many_from_iterator(hashmap):
+    found = hashmap.get_many(iter(['missing', 'num']))
+
+    assert list(found) == [Nun(), Some(2)]
+
+
+def test_insert_many(hashmap):
+    hashmap.insert_many(range(3), 'abc')
+
+    assert hashmap[2] == Some('c')
+    assert len(hashmap) == 5
+
+
+def test_insert_many_with_mismatched_lengths_panics(hashmap):
+    with pytest.raises(Panic):
+        hashmap.insert_many([1, 2], ['a'])
+
+
+def test_extend_from_iter(hashmap):
+    hashmap.extend(Iter('xyz').enumerate())
+
+    assert hashmap[1] == Some('y')
+
+
+def test_extend_from_mapping(hashmap):
+    hashmap.extend({'num': 3})
+
+    assert hashmap['num'] == Some(3)
+
+
+def test_remove_many(hashmap):
+    removed = hashmap.remove_many(['num', 'missing', 'num'])
+
+    assert list(removed) == [Some(2), Nun(), Nun()]
+    assert hashmap == {'foo': 'bar'}
+
+
+def test_retain():
+    h = HashMap((i, i * 10) for i in range(10))
+    h.retain(lambda k, v: k % 2 == 0 and v < 60)
+
+    assert h == {0: 0, 2: 20, 4: 40}
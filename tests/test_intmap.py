@@ -0,0 +1,122 @@
+import random
+
+import pytest
+
+from hypoxia import IntHashMap, IntFloatHashMap, Some, Nun
+from hypoxia import numeric
+
+
+@pytest.fixture(scope = 'function')
+def intmap():
+    return IntHashMap({1: 10, 2: 20, -3: 30})
+
+
+def test_getitem_returns_options(intmap):
+    assert intmap[1] == Some(10)
+    assert intmap[-3] == Some(30)
+    assert intmap[4] == Nun()
+    assert intmap['1'] == Nun()
+    assert intmap[2 ** 70] == Nun()
+    assert intmap.get(2) == Some(20)
+
+
+def test_overwrite(intmap):
+    intmap[1] = 11
+
+    assert intmap[1] == Some(11)
+    assert len(intmap) == 3
+
+
+def test_grows(intmap):
+    for i in range(1000):
+        intmap[i * 7919] = i
+
+    assert len(intmap) == 1003
+    assert intmap[7919 * 500] == Some(500)
+    assert intmap.capacity * 0.7 >= len(intmap)
+
+
+def test_bad_keys_and_values(intmap):
+    with pytest.raises(OverflowError):
+        intmap[2 ** 70] = 1
+    with pytest.raises(TypeError):
+        intmap['a'] = 1
+    with pytest.raises(TypeError):
+        intmap[5] = 'a'
+
+    assert 5 not in intmap
+    assert len(intmap) == 3
+
+
+def test_float_values():
+    f = IntFloatHashMap({1: 0.5, 2: 2})
+
+    assert f[1] == Some(0.5)
+    assert f[2] == Some(2.0)
+
+
+def test_remove(intmap):
+    assert intmap.remove(1) == Some(10)
+    assert intmap.remove(1) == Nun()
+    assert dict(intmap.items()) == {2: 20, -3: 30}
+
+
+def test_matches_dict_under_random_operations():
+    rng = random.Random(0)
+    m = IntHashMap()
+    reference = {}
+
+    for step in range(5000):
+        key = rng.randrange(-500, 500)
+        if rng.random() < 0.6:
+            m[key] = step
+            reference[key] = step
+        else:
+            assert m.remove(key) == (Some(reference.pop(key)) if key in reference else Nun())
+
+    assert len(m) == len(reference)
+    assert dict(m.items()) == reference
+    assert all(m[k] == Some(v) for k, v in reference.items())
+
+
+@pytest.fixture(scope = 'function', params = ['numpy', 'python'])
+def backend(request, monkeypatch):
+    if request.param == 'numpy':
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(numeric, 'np', None)
+
+
+def test_get_many(backend):
+    m = IntHashMap((i, i * i) for i in range(0, 2000, 2))
+    for i in range(0, 2000, 4):
+        m.remove(i)
+
+    keys = list(range(-10, 2010))
+    found = m.get_many(keys)
+
+    assert list(found) == [Some(k * k) if k % 4 == 2 and 0 <= k < 2000 else Nun() for k in keys]
+
+
+def test_get_many_float(backend):
+    f = IntFloatHashMap({1: 0.5, 3: 1.5})
+
+    assert list(f.get_many([1, 2, 3])) == [Some(0.5), Nun(), Some(1.5)]
+
+
+def test_get_many_empty_map(backend):
+    assert list(IntHashMap().get_many([1, 2])) == [Nun(), Nun()]
+
+
+@pytest.mark.parametrize('keys', [[1.7], [1, 1.7, '2'], [2 ** 64 - 1, 1], [2 ** 70, 2], (k for k in [1, 2])])
+def test_get_many_matches_indexing(intmap, backend, keys):
+    keys = list(keys)
+
+    assert list(intmap.get_many(keys)) == [intmap[k] for k in keys]
+
+
+def test_get_many_with_non_integer_array(intmap):
+    np = pytest.importorskip('numpy')
+
+    assert list(intmap.get_many(np.array([1.7, 1.0]))) == [Nun(), Nun()]  # like intmap[1.0]
+    assert list(intmap.get_many(np.array([1, 2 ** 64 - 1], dtype = np.uint64))) == [Some(10), Nun()]
@@ -1,7 +1,7 @@
 import itertools
 import pytest
 
-from hypoxia import Iter, Some, Nun
+from hypoxia import Iter, Some, Nun, Ok, Err, Panic
 
 HELLO_WORLD = 'Hello world!'
 
@@ -330,3 +330,221 @@ def test_cycle():
 
     for _ in range(1000):
         assert next(x) == next(cycle)
+
+
+def test_chained_stages_are_fused_into_one_native_iterator(int_iter):
+    x = int_iter.map(lambda x: x + 1).filter(lambda x: x % 2 == 0).map(lambda x: x * 10)
+
+    assert not isinstance(iter(x), Iter)
+    assert list(x) == [20, 40]
+
+
+def test_single_map_compiles_to_builtin_map(int_iter):
+    assert type(iter(int_iter.map(str))) is map
+
+
+def test_fused_star_map_and_filter_map():
+    def fm(x):
+        if x % 2 == 0:
+            return Some(x)
+        return Nun()
+
+    x = Iter(range(5)).zip(range(5)).star_map(lambda a, b: a + b).filter_map(fm).map(lambda x: -x)
+
+    assert list(x) == [0, -2, -4, -6, -8]
+
+
+def test_filter_with_none_keeps_truthy_elements():
+    assert Iter([0, 1, '', 'a', None]).filter(None).map(str).collect(list) == ['1', 'a']
+
+
+def test_plan_is_lazy(mocker):
+    mock = mocker.MagicMock(side_effect = lambda x: x)
+
+    x = Iter(range(5)).map(mock).map(mock).filter(mock)
+    assert mock.call_count == 0
+
+    next(x)
+    assert mock.call_count == 6  # 0 is filtered out, so it takes two elements to produce one
+
+
+def test_stages_added_after_iteration_starts_continue_from_position(int_iter):
+    next(int_iter)
+    x = int_iter.map(lambda x: x * 2)
+
+    assert list(x) == [2, 4, 6, 8]
+
+
+def test_branches_share_the_same_source(int_iter):
+    doubled = int_iter.map(lambda x: x * 2)
+    tripled = int_iter.map(lambda x: x * 3)
+
+    assert next(doubled) == 0
+    assert next(tripled) == 3
+    assert next(int_iter) == 2
+
+
+def test_collect_result_with_all_ok():
+    assert Iter([Ok(1), Ok(2)]).collect_result() == Ok([1, 2])
+
+
+def test_collect_result_with_collection_type():
+    assert Iter([Ok(1), Ok(2)]).collect_result(tuple) == Ok((1, 2))
+
+
+def test_collect_result_stops_at_first_err():
+    x = Iter([Ok(1), Err(KeyError('a')), Err(KeyError('b')), Ok(4)])
+
+    assert x.collect_result() == Err(KeyError('a'))
+    assert next(x) == Err(KeyError('b'))
+
+
+def test_collect_option():
+    assert Iter([Some(1), Some(2)]).collect_option(set) == Some({1, 2})
+    assert Iter([Some(1), Nun(), Some(2)]).collect_option() == Nun()
+
+
+def test_try_fold_with_results():
+    assert Iter(range(5)).try_fold(0, lambda acc, x: Ok(acc + x)) == Ok(10)
+
+
+def test_try_fold_with_options():
+    assert Iter(range(5)).try_fold(0, lambda acc, x: Some(acc + x)) == Some(10)
+
+
+def test_try_fold_on_empty():
+    assert Iter([]).try_fold(7, lambda acc, x: Ok(acc + x)) == Ok(7)
+
+
+def test_try_fold_stops_early():
+    x = Iter(range(10))
+
+    assert x.try_fold(0, lambda acc, x: Ok(acc + x) if x < 3 else Err(ValueError(x))) == Err(ValueError(3))
+    assert next(x) == 4
+
+
+def test_try_for_each():
+    seen = []
+
+    def f(x):
+        seen.append(x)
+        return Ok(x) if x < 2 else Nun()
+
+    assert Iter(range(5)).try_for_each(f) == Nun()
+    assert seen == [0, 1, 2]
+
+
+def test_try_for_each_with_no_failures():
+    assert Iter(range(3)).try_for_each(lambda x: None) == Ok(None)
+
+
+def test_filter_ok():
+    x = Iter([Ok(1), Err(KeyError('k')), Ok(2), Ok(3)]).filter_ok(lambda x: x % 2 == 1)
+
+    assert list(x) == [Ok(1), Err(KeyError('k')), Ok(3)]
+
+
+def test_flatten_ok():
+    x = Iter([Ok([1, 2]), Err(KeyError('k')), Ok([]), Ok((3,))]).flatten_ok()
+
+    assert list(x) == [Ok(1), Ok(2), Err(KeyError('k')), Ok(3)]
+
+
+def test_partition_results():
+    oks, errs = Iter([Ok(1), Err(KeyError('k')), Ok(2)]).partition_results()
+
+    assert oks == [1, 2]
+    assert [type(e) for e in errs] == [KeyError]
+
+
+USERS = [(1, 'alice'), (2, 'bob'), (3, 'carol')]
+ORDERS = [(1, 'apple'), (3, 'pear'), (1, 'fig'), (4, 'kiwi')]
+
+
+def test_hash_join_inner():
+    x = Iter(ORDERS).hash_join(USERS, lambda o: o[0])
+
+    assert list(x) == [
+        ((1, 'apple'), (1, 'alice')),
+        ((3, 'pear'), (3, 'carol')),
+        ((1, 'fig'), (1, 'alice')),
+    ]
+
+
+def test_hash_join_left():
+    x = Iter(ORDERS).hash_join(USERS, lambda o: o[0], how = 'left')
+
+    assert [(o, u.map(lambda u: u[1])) for o, u in x] == [
+        ((1, 'apple'), Some('alice')),
+        ((3, 'pear'), Some('carol')),
+        ((1, 'fig'), Some('alice')),
+        ((4, 'kiwi'), Nun()),
+    ]
+
+
+def test_hash_join_anti():
+    x = Iter(USERS).hash_join(ORDERS, lambda u: u[0], how = 'anti')
+
+    assert list(x) == [(2, 'bob')]
+
+
+def test_hash_join_with_right_key():
+    x = Iter(['a', 'bb', 'ccc']).hash_join([1, 3, 3], len, right_key = lambda n: n)
+
+    assert list(x) == [('a', 1), ('ccc', 3), ('ccc', 3)]
+
+
+@pytest.mark.parametrize('method', ['hash_join', 'merge_join'])
+def test_join_with_unknown_how_panics(method):
+    with pytest.raises(Panic):
+        getattr(Iter(USERS), method)(ORDERS, lambda x: x[0], how = 'outer')
+
+
+@pytest.mark.parametrize('how', ['inner', 'left', 'anti'])
+def test_merge_join_matches_hash_join(how):
+    left = sorted(ORDERS * 2, key = lambda o: o[0])
+    right = sorted(USERS + [(3, 'carl')], key = lambda u: u[0])
+
+    hashed = list(Iter(left).hash_join(right, lambda x: x[0], how = how))
+    merged = list(Iter(left).merge_join(right, lambda x: x[0], how = how))
+
+    assert merged == hashed
+
+
+def test_merge_join_unsorted_panics():
+    x = Iter([(2, 'b'), (1, 'a')]).merge_join(USERS, lambda x: x[0])
+
+    with pytest.raises(Panic):
+        list(x)
+
+
+def test_merge():
+    x = Iter([1, 4, 7]).merge([2, 5], [0, 3, 6, 8])
+
+    assert list(x) == list(range(9))
+
+
+def test_merge_with_key_and_reversed():
+    x = Iter(['ccc', 'a']).merge(['dddd', 'bb'], key = len, reversed = True)
+
+    assert list(x) == ['dddd', 'ccc', 'bb', 'a']
+
+
+def test_merge_is_stable():
+    x = Iter([(1, 'first'), (2, 'first')]).merge([(1, 'second')], key = lambda x: x[0])
+
+    assert list(x) == [(1, 'first'), (1, 'second'), (2, 'first')]
+
+
+class TaggedIter(Iter):
+    def __init__(self, iter, tag = 'default'):
+        super().__init__(iter)
+        self.tag = tag
+
+
+def test_chained_stages_go_through_subclass_init():
+    x = TaggedIter(range(5), tag = 'mine').map(lambda x: x * 2).filter(lambda x: x > 2)
+
+    assert type(x) is TaggedIter
+    assert x.tag == 'default'
+    assert list(x) == [4, 6, 8]
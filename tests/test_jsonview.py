@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from hypoxia import HashMap, JsonView, JsonArray, KeyPath, Some, Nun, Panic
+
+DOC = {
+    'a': {'b': [{'c': 1}, {'c': 2}, {}, {'c': [10, 20]}]},
+    'name': 'doc',
+    'dotted.key': {'x': None},
+}
+
+
+@pytest.fixture(scope = 'function')
+def view():
+    return HashMap.from_json(json.dumps(DOC).encode())
+
+
+def test_from_json_bytes_returns_lazy_view(view):
+    assert isinstance(view, JsonView)
+    assert view['name'] == Some('doc')
+    assert view['missing'] == Nun()
+    assert len(view) == 3
+
+
+def test_from_json_path(tmpdir):
+    path = str(tmpdir.join('doc.json'))
+    with open(path, 'w') as f:
+        f.write(json.dumps([1, {'a': 2}]))
+
+    array = HashMap.from_json(path)
+
+    assert isinstance(array, JsonArray)
+    assert array[1].unwrap()['a'] == Some(2)
+    assert array[5] == Nun()
+    assert array[-1].unwrap() == {'a': 2}
+
+
+def test_nested_values_are_wrapped_on_access(view):
+    a = view['a'].unwrap()
+    b = a['b'].unwrap()
+
+    assert isinstance(a, JsonView)
+    assert isinstance(b, JsonArray)
+    assert b.raw == DOC['a']['b']
+    assert [type(x) for x in b] == [JsonView] * 4
+
+
+def test_to_hashmap(view):
+    h = view.to_hashmap()
+
+    assert type(h) is HashMap
+    assert type(h['a'].unwrap()) is HashMap
+    assert h == DOC
+
+
+@pytest.mark.parametrize(
+    'path, expected',
+    [
+        ('name', Some('doc')),
+        ('a.b[1].c', Some(2)),
+        ('a.b[3].c[1]', Some(20)),
+        ('a.b[-1].c[0]', Some(10)),
+        ('["dotted.key"].x', Some(None)),
+        ('a.b[2].c', Nun()),
+        ('a.b[9].c', Nun()),
+        ('a.b[-9]', Nun()),
+        ('name.c', Nun()),
+        ('a[0]', Nun()),
+        ('missing.b', Nun()),
+    ],
+)
+def test_path(view, path, expected):
+    assert HashMap.path(path)(view) == expected
+    assert HashMap.path(path)(DOC) == expected
+
+
+def test_path_on_hashmap():
+    h = HashMap(a = HashMap(b = [1, 2]))
+
+    assert HashMap.path('a.b[1]')(h) == Some(2)
+
+
+def test_path_wraps_containers(view):
+    assert isinstance(HashMap.path('a.b[0]')(view).unwrap(), JsonView)
+
+
+def test_path_is_compiled_once():
+    assert HashMap.path('a.b[3].c') is HashMap.path('a.b[3].c')
+    assert isinstance(HashMap.path('a.b'), KeyPath)
+    assert HashMap.path('a.b[3].c').steps == ('a', 'b', 3, 'c')
+
+
+@pytest.mark.parametrize('path', ['', 'a..b', 'a[x]', 'a[1'])
+def test_bad_paths_panic(path):
+    with pytest.raises(Panic):
+        KeyPath(path)
@@ -0,0 +1,104 @@
+import pytest
+
+from hypoxia import Iter, OptionArray, Some, Nun
+
+np = pytest.importorskip('numpy')
+
+
+@pytest.mark.parametrize('values', [range(10), [0.5, 1.5, 2.5], range(100_000)])
+def test_vectorized_sum(values):
+    assert Iter(values).sum(vectorize = True) == sum(values)
+
+
+def test_vectorized_sum_returns_python_scalar():
+    assert type(Iter(range(5)).sum(vectorize = True)) is int
+
+
+def test_vectorized_sum_with_start():
+    assert Iter(range(5)).sum(start = 5, vectorize = True) == 15
+
+
+def test_vectorized_sum_of_empty():
+    assert Iter([]).sum(vectorize = True) == 0
+
+
+def test_vectorized_mul():
+    assert Iter(range(1, 6)).mul(initial = 2, vectorize = True) == 2 * 120
+
+
+def test_vectorized_dot():
+    assert Iter(range(3)).dot(range(4), vectorize = True) == 0 * 0 + 1 * 1 + 2 * 2
+
+
+def test_vectorized_dot_across_chunks():
+    assert Iter(range(70_000)).dot(Iter.repeat(2.0), vectorize = True) == 2.0 * sum(range(70_000))
+
+
+@pytest.mark.parametrize('values', [[2 ** 62, 2 ** 62], [-2 ** 63, -1], [2 ** 63, 1], [2 ** 70, 1], [2 ** 40] * 70_000])
+def test_vectorized_sum_does_not_overflow(values):
+    assert Iter(values).sum(vectorize = True) == sum(values)
+
+
+def test_vectorized_mul_does_not_overflow():
+    assert Iter(range(1, 26)).mul(vectorize = True) == 15511210043330985984000000
+
+
+def test_vectorized_mul_with_zero_and_large_values():
+    assert Iter([2 ** 62, 2 ** 62, 0]).mul(vectorize = True) == 0
+
+
+def test_vectorized_dot_does_not_overflow():
+    assert Iter([2 ** 40, 2 ** 40]).dot([2 ** 40, 3], vectorize = True) == 2 ** 80 + 3 * 2 ** 40
+
+
+def test_vectorized_max_and_min():
+    assert Iter([3, -1, 7, 2]).max(vectorize = True) == 7
+    assert Iter([3, -1, 7, 2]).min(vectorize = True) == -1
+
+
+def test_vectorized_max_with_key_falls_back_to_python():
+    assert Iter([3, -1, 7, 2]).max(key = lambda x: -x, vectorize = True) == -1
+
+
+def test_vectorized_max_of_empty():
+    with pytest.raises(ValueError):
+        Iter([]).max(vectorize = True)
+
+
+def test_option_array_to_masked():
+    masked = OptionArray([Some(1.0), Nun(), Some(3.0)]).to_masked(dtype = float)
+
+    assert masked.mask.tolist() == [False, True, False]
+    assert masked.sum() == 4.0
+
+
+def test_option_array_to_masked_fills_ndarray_values():
+    x = OptionArray.from_columns(np.array([1.0, 99.0, 3.0]), [1, 0, 1])
+
+    masked = x.to_masked(fill = -1.0)
+
+    assert masked.data.tolist() == [1.0, -1.0, 3.0]
+    assert masked.dtype == np.float64
+    assert x.values.tolist() == [1.0, 99.0, 3.0]
+
+
+def test_option_array_from_masked_does_not_copy_values():
+    data = np.arange(4.0)
+    x = OptionArray.from_masked(np.ma.masked_array(data, mask = [0, 1, 0, 1]))
+
+    assert list(x) == [Some(0.0), Nun(), Some(2.0), Nun()]
+    assert x.values is data or x.values.base is data
+
+
+def test_masked_round_trip_with_vectorized_comparison():
+    x = OptionArray([Some(1), Nun(), Some(3)])
+
+    assert list(OptionArray.from_masked(x.to_masked() > 2)) == [Some(False), Nun(), Some(True)]
+
+
+def test_array_backed_option_array_vectorized_map_and_unwrap_or():
+    x = OptionArray.from_masked(np.ma.masked_array([1.0, 2.0, 3.0], mask = [0, 1, 0]))
+
+    doubled = x.map(np.negative, vectorized = True)
+
+    assert doubled.unwrap_or(0.0).tolist() == [-1.0, 0.0, -3.0]
@@ -1,6 +1,6 @@
 import pytest
 
-from hypoxia import Some, Nun, Panic, Ok, Err
+from hypoxia import Option, Some, Nun, Panic, Ok, Err
 
 
 def test_is_some_with_some():
@@ -268,3 +268,27 @@ def test_hash_nun():
 
     assert x == y
     assert hash(x) == hash(y)
+
+
+def test_options_have_no_instance_dict():
+    assert not hasattr(Some(2), '__dict__')
+    assert not hasattr(Nun(), '__dict__')
+
+
+def test_option_cannot_be_instantiated():
+    with pytest.raises(TypeError):
+        Option(3)
+
+
+def test_ok_or_else_with_nun_builds_error_immediately(mocker):
+    func = mocker.MagicMock(return_value = Exception('error message'))
+
+    x = Nun().ok_or_else(func)
+    assert func.call_count == 1
+    assert type(x) is Err
+
+
+def test_ok_or_else_in_loop_binds_each_key():
+    errs = [Nun().ok_or_else(lambda: KeyError(k)) for k in 'abc']
+
+    assert errs == [Err(KeyError('a')), Err(KeyError('b')), Err(KeyError('c'))]
@@ -0,0 +1,113 @@
+import concurrent.futures
+import operator
+import threading
+
+import pytest
+
+from hypoxia import Iter, Ok, Err, Some, Nun
+
+
+def square(x):
+    return x ** 2
+
+
+def invert(x):
+    return 1 / x
+
+
+def even_squares(x):
+    if x % 2 == 0:
+        return Some(x ** 2)
+    return Nun()
+
+
+@pytest.mark.parametrize('pool', ['thread', 'process'])
+def test_par_map(pool):
+    assert Iter(range(10)).par_map(square, pool = pool, workers = 2).collect(list) == [Ok(x ** 2) for x in range(10)]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 100])
+def test_par_map_with_chunk_size(chunk_size):
+    assert Iter(range(10)).par_map(square, chunk_size = chunk_size).collect(list) == [Ok(x ** 2) for x in range(10)]
+
+
+def test_par_map_unordered():
+    x = Iter(range(20)).par_map(square, ordered = False, workers = 4).collect(list)
+
+    assert sorted(r.unwrap() for r in x) == [x ** 2 for x in range(20)]
+
+
+def test_par_map_exception_becomes_err():
+    x = Iter([1, 0, 2]).par_map(invert).collect(list)
+
+    assert x[0] == Ok(1)
+    assert x[1] == Err(ZeroDivisionError('division by zero'))
+    assert x[2] == Ok(0.5)
+
+
+def test_par_map_with_process_pool_exception_becomes_err():
+    x = Iter([1, 0]).par_map(invert, pool = 'process', workers = 1).collect(list)
+
+    assert x[1].is_err()
+
+
+def test_par_map_on_infinite_iter_is_bounded(mocker):
+    seen = mocker.MagicMock(side_effect = lambda x: x)
+
+    x = Iter.count().map(seen).par_map(square, workers = 2, max_in_flight = 4)
+    assert [next(x) for _ in range(3)] == [Ok(0), Ok(1), Ok(4)]
+    assert seen.call_count <= 3 + 4
+
+
+def test_par_map_with_existing_executor():
+    with concurrent.futures.ThreadPoolExecutor(1) as ex:
+        assert Iter(range(3)).par_map(square, pool = ex).collect(list) == [Ok(0), Ok(1), Ok(4)]
+
+
+def test_par_map_with_bad_pool():
+    with pytest.raises(ValueError):
+        Iter(range(3)).par_map(square, pool = 'gpu').collect(list)
+
+
+def test_par_filter_map():
+    assert Iter(range(6)).par_filter_map(even_squares, chunk_size = 2).collect(list) == [Ok(0), Ok(4), Ok(16)]
+
+
+def test_par_for_each_runs_on_every_element():
+    seen = []
+    lock = threading.Lock()
+
+    def record(x):
+        with lock:
+            seen.append(x)
+
+    assert Iter(range(10)).par_for_each(record, workers = 3) == []
+    assert sorted(seen) == list(range(10))
+
+
+def test_par_for_each_returns_errs():
+    errs = Iter([1, 0, 2, 0]).par_for_each(invert)
+
+    assert errs == [Err(ZeroDivisionError('division by zero'))] * 2
+
+
+@pytest.mark.parametrize('pool', ['thread', 'process'])
+def test_par_reduce(pool):
+    assert Iter(range(100)).par_reduce(operator.add, pool = pool, chunk_size = 7) == Ok(sum(range(100)))
+
+
+def test_par_reduce_with_initial():
+    assert Iter(range(1, 5)).par_reduce(operator.mul, initial = 10, chunk_size = 2) == Ok(10 * 1 * 2 * 3 * 4)
+
+
+def test_par_reduce_keeps_order_for_non_commutative_func():
+    assert Iter('abcdefg').par_reduce(operator.add, chunk_size = 2, workers = 4) == Ok('abcdefg')
+
+
+def test_par_reduce_with_error():
+    assert Iter([1, 2, 0]).par_reduce(operator.truediv).is_err()
+
+
+def test_par_reduce_on_empty_iter():
+    assert Iter([]).par_reduce(operator.add).is_err()
+    assert Iter([]).par_reduce(operator.add, initial = 0) == Ok(0)
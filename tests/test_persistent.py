@@ -0,0 +1,156 @@
+import random
+
+import pytest
+
+from hypoxia import PersistentHashMap, HashMap, Iter, Some, Nun, Panic
+
+
+class Collider:
+    """Keys that all hash to the same few values."""
+
+    def __init__(self, n):
+        self.n = n
+
+    def __hash__(self):
+        return self.n % 3
+
+    def __eq__(self, other):
+        return isinstance(other, Collider) and self.n == other.n
+
+    def __repr__(self):
+        return f'Collider({self.n})'
+
+
+@pytest.fixture(scope = 'function')
+def pmap():
+    return PersistentHashMap({'num': 2, 'foo': 'bar'})
+
+
+def test_getitem_returns_options(pmap):
+    assert pmap['num'] == Some(2)
+    assert pmap['missing'] == Nun()
+    assert pmap.get('foo') == Some('bar')
+    assert len(pmap) == 2
+
+
+def test_insert_returns_new_version(pmap):
+    new = pmap.insert('new', 1)
+
+    assert new['new'] == Some(1)
+    assert pmap['new'] == Nun()
+    assert len(new) == 3
+    assert len(pmap) == 2
+
+
+def test_insert_same_value_returns_same_map(pmap):
+    assert pmap.insert('num', 2) is pmap
+
+
+def test_remove_returns_new_version(pmap):
+    new = pmap.remove('num')
+
+    assert 'num' not in new
+    assert 'num' in pmap
+    assert pmap.remove('missing') is pmap
+
+
+@pytest.mark.parametrize('make_key', [lambda n: n, str, Collider])
+def test_matches_dict_under_random_operations(make_key):
+    rng = random.Random(0)
+    reference = {}
+    pmap = PersistentHashMap()
+    versions = []
+
+    for step in range(3000):
+        key = make_key(rng.randrange(500))
+        if rng.random() < 0.7:
+            reference[key] = step
+            pmap = pmap.insert(key, step)
+        else:
+            reference.pop(key, None)
+            pmap = pmap.remove(key)
+
+        if step % 500 == 0:
+            versions.append((dict(reference), pmap))
+
+    assert len(pmap) == len(reference)
+    assert dict(pmap.items()) == reference
+    for expected, version in versions:
+        assert dict(version.items()) == expected
+        assert len(version) == len(expected)
+
+
+def test_transient_batch_mutation(pmap):
+    t = pmap.transient()
+    for i in range(100):
+        t[i] = i
+    assert t.remove(50) == Some(50)
+    assert t.remove(50) == Nun()
+
+    new = t.persistent()
+
+    assert len(new) == 101
+    assert new[99] == Some(99)
+    assert len(pmap) == 2
+
+
+def test_transient_is_invalid_after_persistent(pmap):
+    t = pmap.transient()
+    t.persistent()
+
+    with pytest.raises(Panic):
+        t['x'] = 1
+
+
+def test_transients_do_not_affect_each_other():
+    base = PersistentHashMap((i, i) for i in range(1000))
+    a = base.transient()
+    b = base.transient()
+    a[0] = 'a'
+    b[0] = 'b'
+
+    assert a.persistent()[0] == Some('a')
+    assert b.persistent()[0] == Some('b')
+    assert base[0] == Some(0)
+
+
+def test_update(pmap):
+    new = pmap.update({'num': 3, 'new': 4})
+
+    assert new.to_hashmap() == HashMap(num = 3, foo = 'bar', new = 4)
+
+
+def test_diff():
+    old = PersistentHashMap((i, i) for i in range(1000))
+    new = old.insert(1, 'one').remove(2).insert(1000, 1000)
+
+    diff = old.diff(new)
+
+    assert isinstance(diff, Iter)
+    assert sorted(diff, key = lambda d: d[0]) == [
+        (1, Some(1), Some('one')),
+        (2, Some(2), Nun()),
+        (1000, Nun(), Some(1000)),
+    ]
+
+
+def test_diff_of_identical_versions_is_empty(pmap):
+    assert list(pmap.diff(pmap)) == []
+
+
+def test_diff_with_collisions():
+    old = PersistentHashMap((Collider(i), i) for i in range(10))
+    new = old.remove(Collider(4)).insert(Collider(5), 'five')
+
+    assert sorted(old.diff(new), key = lambda d: d[0].n) == [
+        (Collider(4), Some(4), Nun()),
+        (Collider(5), Some(5), Some('five')),
+    ]
+
+
+def test_equality():
+    a = PersistentHashMap((i, i) for i in range(100))
+    b = PersistentHashMap((i, i) for i in reversed(range(100)))
+
+    assert a == b
+    assert a != b.insert(0, 'x')
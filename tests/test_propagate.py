@@ -0,0 +1,166 @@
+import asyncio
+import functools
+import sys
+
+import pytest
+
+from hypoxia import returns_result, try_, Ok, Err, Some, Nun
+
+
+@returns_result
+def parse(s):
+    return int(s)
+
+
+def run(coro):
+    # not asyncio.run, which needs Python 3.7
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+@returns_result
+def add_parsed(a, b):
+    return try_(parse(a)) + try_(parse(b))
+
+
+def test_returns_result_wraps_return_value():
+    assert parse('3') == Ok(3)
+
+
+def test_returns_result_catches_exception():
+    assert parse('x') == Err(ValueError("invalid literal for int() with base 10: 'x'"))
+
+
+def test_returns_result_passes_results_through():
+    @returns_result
+    def f(x):
+        return Err(KeyError(x)) if x else Ok(0)
+
+    assert f(1) == Err(KeyError(1))
+    assert f(0) == Ok(0)
+
+
+def test_returns_result_with_catch_lets_other_exceptions_through():
+    @returns_result(catch = (KeyError,))
+    def f(d):
+        return d['k'] / d['n']
+
+    assert f({}) == Err(KeyError('k'))
+    with pytest.raises(ZeroDivisionError):
+        f({'k': 1, 'n': 0})
+
+
+def test_returns_result_preserves_metadata():
+    assert parse.__name__ == 'parse'
+
+
+def test_try_unwraps_ok():
+    assert add_parsed('1', '2') == Ok(3)
+
+
+def test_try_returns_first_err_early(mocker):
+    spy = mocker.MagicMock(side_effect = lambda x: parse(x))
+
+    @returns_result
+    def f():
+        return try_(spy('a')) + try_(spy('2'))
+
+    assert f().is_err()
+    assert spy.call_count == 1
+
+
+def test_try_is_not_swallowed_by_except_exception():
+    @returns_result
+    def f():
+        try:
+            return try_(Err(KeyError('k')))
+        except Exception:
+            return 'swallowed'
+
+    assert f() == Err(KeyError('k'))
+
+
+def test_try_on_options():
+    @returns_result
+    def f(o):
+        return try_(o) * 2
+
+    assert f(Some(2)) == Ok(4)
+    assert f(Nun()) == Nun()
+
+
+def test_try_outside_decorated_function_raises():
+    with pytest.raises(BaseException, match = 'outside of a function decorated with returns_result'):
+        try_(Err(KeyError('k')))
+
+
+def test_returns_result_on_coroutine_function():
+    @returns_result
+    async def f(a, b):
+        await asyncio.sleep(0)
+        return try_(parse(a)) / try_(parse(b))
+
+    assert run(f('4', '2')) == Ok(2)
+    assert run(f('4', 'x')).is_err()
+    assert run(f('4', '0')) == Err(ZeroDivisionError('division by zero'))
+
+
+def test_returns_result_forwards_every_kind_of_parameter():
+    @returns_result
+    def f(a, b, c = 3, *args, d, e = 5, **kwargs):
+        return a, b, c, args, d, e, kwargs
+
+    assert f(1, 2, d = 4) == Ok((1, 2, 3, (), 4, 5, {}))
+    assert f(1, b = 2, c = 0, d = 4, e = 0, z = 9) == Ok((1, 2, 0, (), 4, 0, {'z': 9}))
+    assert f(1, 2, 3, 6, 7, d = 4) == Ok((1, 2, 3, (6, 7), 4, 5, {}))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason = 'positional-only parameters need Python 3.8')
+def test_returns_result_forwards_positional_only_parameters():
+    namespace = {}
+    exec('def f(a, /, b, *, d):\n    return a, b, d', namespace)  # exec'd, since the syntax doesn't parse before 3.8
+    f = returns_result(namespace['f'])
+
+    assert f(1, 2, d = 4) == Ok((1, 2, 4))
+
+    with pytest.raises(TypeError):
+        f(a = 1, b = 2, d = 4)
+
+
+def test_returns_result_on_function_without_signature():
+    assert returns_result(int)('5') == Ok(5)
+
+
+def test_returns_result_with_parameter_names_that_shadow_builtins():
+    @returns_result
+    def f(isinstance, value, func):
+        return isinstance + value + func
+
+    assert f(1, 2, 3) == Ok(6)
+
+
+def test_returns_result_on_decorator_that_changes_parameters():
+    def inject_x(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return func(*args, x = 10, **kwargs)
+        return wrapper
+
+    @returns_result
+    @inject_x
+    def g(y, x):
+        return x + y
+
+    assert g(1) == Ok(11)
+
+
+def test_returns_result_with_parameter_names_that_collide_with_the_wrapper():
+    @returns_result
+    def f(_hypoxia_func, _hypoxia_value = 2):
+        return _hypoxia_func + _hypoxia_value
+
+    assert f(1) == Ok(3)
+    assert f(1, _hypoxia_value = 5) == Ok(6)
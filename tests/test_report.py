@@ -0,0 +1,81 @@
+import pytest
+
+from hypoxia import Iter, ErrorReport, Ok, Err
+
+
+@pytest.fixture(scope = 'function')
+def results():
+    return [
+        Ok(0),
+        Err(KeyError('a')),
+        Ok(2),
+        Err(ValueError('bad 1')),
+        Err(KeyError('a')),
+        Err(ValueError('bad 2')),
+        Err(KeyError('a')),
+    ]
+
+
+def test_collect_errors_passes_ok_values_on(results):
+    oks, report = Iter(results).collect_errors()
+
+    assert oks.collect(list) == [0, 2]
+    assert report.total == len(report) == 5
+
+
+def test_report_fills_in_lazily(results):
+    oks, report = Iter(results).collect_errors()
+    assert report.total == 0
+
+    next(oks)
+    next(oks)
+    assert report.total == 1
+
+
+def test_counts_are_keyed_like_err_eq(results):
+    oks, report = Iter(results).collect_errors()
+    oks.for_each(lambda x: None)
+
+    assert report.counts[(KeyError, ('a',))].unwrap() == 3
+    assert report.counts[(ValueError, ('bad 1',))].unwrap() == 1
+
+
+def test_first_and_last_positions_and_samples(results):
+    oks, report = Iter(results).collect_errors(samples = 2)
+    oks.for_each(lambda x: None)
+
+    group = report.groups[(KeyError, ('a',))].unwrap()
+    assert group.first == 1
+    assert group.last == 6
+    assert group.samples == [Err(KeyError('a'))] * 2
+
+
+def test_template_groups_similar_messages(results):
+    oks, report = Iter(results).collect_errors(template = lambda e: (type(e), e.args[0].split()[0]))
+    oks.for_each(lambda x: None)
+
+    assert report.counts[(ValueError, 'bad')].unwrap() == 2
+
+
+def test_most_common(results):
+    oks, report = Iter(results).collect_errors()
+    oks.for_each(lambda x: None)
+
+    key, group = report.most_common(1)[0]
+    assert key == (KeyError, ('a',))
+    assert group.count == 3
+    assert str(report).startswith('5 errors in 3 groups')
+
+
+def test_lazy_errs_are_counted_without_building_them():
+    oks, report = Iter([Err.lazy(KeyError, 'k'), Err.lazy(KeyError, 'k')]).collect_errors(samples = 0)
+    oks.for_each(lambda x: None)
+
+    assert report.counts[(KeyError, ('k',))].unwrap() == 2
+
+
+def test_report_can_be_used_directly():
+    report = ErrorReport()
+
+    assert list(report.watch([Ok(1), Err(KeyError('k'))])) == [1]
+    assert report.total == 1
@@ -1,6 +1,8 @@
+import pickle
+
 import pytest
 
-from hypoxia import Ok, Err, Some, Nun, Panic
+from hypoxia import Result, Ok, Err, LazyErr, Some, Nun, Panic
 
 
 def test_err_val_must_be_exception():
@@ -250,3 +252,88 @@ def test_hash_err_same_type_different_message():
 
     assert x != y
     assert hash(x) != hash(y)
+
+
+def test_results_have_no_instance_dict():
+    assert not hasattr(Ok(2), '__dict__')
+    assert not hasattr(Err(Exception('error message')), '__dict__')
+
+
+def test_result_cannot_be_instantiated():
+    with pytest.raises(TypeError):
+        Result(3)
+
+
+def raise_and_catch(**kwargs):
+    try:
+        raise ValueError('boom')
+    except ValueError as e:
+        return Err(e, **kwargs)
+
+
+def test_err_keeps_traceback_by_default():
+    x = raise_and_catch()
+
+    assert x.unwrap_err().__traceback__ is not None
+    assert x.traceback_summary().unwrap()[-1].name == 'raise_and_catch'
+
+
+def test_err_without_traceback_keeps_summary():
+    x = raise_and_catch(keep_traceback = False)
+
+    assert x.unwrap_err().__traceback__ is None
+    assert x.traceback_summary().unwrap()[-1].name == 'raise_and_catch'
+    assert x == Err(ValueError('boom'))
+
+
+def test_err_without_traceback_strips_context():
+    try:
+        try:
+            raise KeyError('inner')
+        except KeyError:
+            raise ValueError('outer')
+    except ValueError as e:
+        x = Err(e, keep_traceback = False)
+
+    assert x.unwrap_err().__context__.__traceback__ is None
+
+
+def test_err_keep_tracebacks_global_default(monkeypatch):
+    monkeypatch.setattr(Err, 'keep_tracebacks', False)
+
+    assert raise_and_catch().unwrap_err().__traceback__ is None
+
+
+def test_traceback_summary_of_unraised_exception():
+    assert Err(Exception('error message')).traceback_summary().is_nun()
+
+
+def test_lazy_err_compares_without_building():
+    x = Err.lazy(ValueError, 'bad')
+
+    assert x == Err(ValueError('bad'))
+    assert hash(x) == hash(Err(ValueError('bad')))
+    assert x._exc is None
+
+
+def test_lazy_err_builds_exception_once_when_needed(mocker):
+    factory = mocker.MagicMock(return_value = ValueError('bad'))
+
+    x = LazyErr(factory)
+    assert factory.call_count == 0
+
+    assert x.unwrap_err().args == ('bad',)
+    assert x.unwrap_or_else(lambda e: e.args[0]) == 'bad'
+    assert factory.call_count == 1
+
+
+def test_lazy_err_factory_must_build_exception():
+    with pytest.raises(Panic):
+        LazyErr(lambda: 0).unwrap_err()
+
+
+def test_lazy_err_pickles_as_err():
+    x = pickle.loads(pickle.dumps(Err.lazy(KeyError, 'k')))
+
+    assert type(x) is Err
+    assert x == Err(KeyError('k'))
@@ -0,0 +1,110 @@
+import concurrent.futures
+import os
+
+import pytest
+
+from hypoxia import SharedHashMap, FrozenHashMap, Iter, Some, Nun
+
+
+@pytest.fixture(scope = 'function')
+def path(tmpdir):
+    p = str(tmpdir.join('table.map'))
+    SharedHashMap.publish(p, {'num': 2, 'foo': 3})
+    return p
+
+
+def test_getitem_returns_options(path):
+    with SharedHashMap(path) as shared:
+        assert shared['num'] == Some(2)
+        assert shared['missing'] == Nun()
+        assert shared.get('foo') == Some(3)
+        assert len(shared) == 2
+        assert set(shared) == {'num', 'foo'}
+
+
+def test_publish_from_iter(tmpdir):
+    p = str(tmpdir.join('table.map'))
+    SharedHashMap.publish(p, Iter(range(100)).map(lambda i: (i, i * 2)))
+
+    with SharedHashMap(p) as shared:
+        assert shared[50] == Some(100)
+        assert list(shared.get_many([1, 1000])) == [Some(2), Nun()]
+
+
+def test_publish_leaves_no_temporary_files(path):
+    assert os.listdir(os.path.dirname(path)) == ['table.map']
+
+
+def test_old_version_is_unchanged_until_refresh(path):
+    shared = SharedHashMap(path)
+    SharedHashMap.publish(path, {'num': 5})
+
+    assert shared['num'] == Some(2)
+    assert shared['foo'] == Some(3)
+
+    assert shared.refresh()
+    assert shared['num'] == Some(5)
+    assert shared['foo'] == Nun()
+    assert not shared.refresh()
+
+
+def test_publish_while_attaching_is_picked_up_by_refresh(path, mocker):
+    load = FrozenHashMap.load
+
+    def publish_then_load(f):
+        SharedHashMap.publish(path, {'num': 5})
+        return load(f)
+
+    mocker.patch.object(FrozenHashMap, 'load', side_effect = publish_then_load)
+    shared = SharedHashMap(path)
+    mocker.stopall()
+
+    assert shared['num'] == Some(2)  # the version that was open when the new one was published
+    assert shared.refresh()
+    assert shared['num'] == Some(5)
+
+
+@pytest.mark.skipif(os.name != 'posix', reason = 'file modes are only meaningful on POSIX')
+def test_publish_uses_umask_for_mode(path):
+    umask = os.umask(0o022)
+    try:
+        SharedHashMap.publish(path, {'num': 5})
+    finally:
+        os.umask(umask)
+
+    assert os.stat(path).st_mode & 0o777 == 0o644
+
+
+@pytest.mark.skipif(os.name != 'posix', reason = 'file modes are only meaningful on POSIX')
+def test_publish_with_explicit_mode(path):
+    SharedHashMap.publish(path, {'num': 5}, mode = 0o640)
+
+    assert os.stat(path).st_mode & 0o777 == 0o640
+
+
+@pytest.mark.skipif(os.name != 'posix', reason = 'directories are only synced on POSIX')
+def test_publish_syncs_directory(path, mocker):
+    fsync = mocker.spy(os, 'fsync')
+
+    SharedHashMap.publish(path, {'num': 5})
+
+    assert fsync.call_count == 2  # the new file, then the directory it was renamed into
+
+
+def test_check_interval_refreshes_automatically(path):
+    shared = SharedHashMap(path, check_interval = 0)
+    SharedHashMap.publish(path, {'num': 5})
+
+    assert shared['num'] == Some(5)
+
+
+def lookup(path, key):
+    with SharedHashMap(path) as shared:
+        return shared[key].unwrap_or(None)
+
+
+def test_attach_from_other_processes(path):
+    with concurrent.futures.ProcessPoolExecutor(max_workers = 2) as pool:
+        results = list(pool.map(lookup, [path] * 4, ['num', 'foo', 'missing', 'num']))
+
+    assert results == [2, 3, None, 2]
@@ -0,0 +1,77 @@
+import itertools
+import os
+import random
+import tempfile
+
+import pytest
+
+from hypoxia import Iter, Panic
+from hypoxia import sort
+
+
+def first(pair):
+    return pair[0]
+
+
+@pytest.fixture(scope = 'function')
+def pairs():
+    rng = random.Random(0)
+    return [(rng.randrange(50), i) for i in range(1000)]
+
+
+@pytest.mark.parametrize('max_in_memory', [1, 7, 100, 1000, 5000])
+def test_external_sort_matches_sorted(pairs, max_in_memory):
+    assert Iter(pairs).sorted(max_in_memory = max_in_memory).collect(list) == sorted(pairs)
+
+
+@pytest.mark.parametrize('reversed', [False, True])
+def test_external_sort_is_stable(pairs, reversed):
+    x = Iter(pairs).sorted(key = first, reversed = reversed, max_in_memory = 64)
+
+    assert x.collect(list) == sorted(pairs, key = first, reverse = reversed)
+
+
+@pytest.mark.parametrize('pool', ['thread', 'process'])
+def test_external_sort_in_pool(pairs, pool):
+    x = Iter(pairs).sorted(key = first, max_in_memory = 100, pool = pool, workers = 2)
+
+    assert x.collect(list) == sorted(pairs, key = first)
+
+
+def test_external_sort_with_many_runs(pairs, monkeypatch):
+    monkeypatch.setattr(sort, 'MERGE_FAN_IN', 3)
+
+    x = Iter(pairs).sorted(key = first, max_in_memory = 10)
+
+    assert x.collect(list) == sorted(pairs, key = first)
+
+
+def test_external_sort_of_empty_iter():
+    assert Iter([]).sorted(max_in_memory = 10).collect(list) == []
+
+
+def test_external_sort_is_lazy():
+    consumed = []
+    x = Iter(range(10)).map(consumed.append).sorted(key = lambda _: 0, max_in_memory = 3)
+
+    assert consumed == []
+
+    x.collect(list)
+
+    assert consumed == list(range(10))
+
+
+def test_external_sort_removes_its_files(pairs, monkeypatch, tmpdir):
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmpdir))
+
+    x = Iter(pairs).sorted(max_in_memory = 100)
+    assert list(itertools.islice(x, 5)) == sorted(pairs)[:5]
+    assert os.listdir(str(tmpdir)) != []
+
+    del x
+    assert os.listdir(str(tmpdir)) == []
+
+
+def test_external_sort_with_bad_max_in_memory_panics():
+    with pytest.raises(Panic):
+        Iter([1]).sorted(max_in_memory = 0)